@@ -4,14 +4,56 @@ Modern XML to Markdown converter using the new Pydantic-based parser
 Much more compact than the old ElementTree-based version
 """
 
+import io
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List
+from typing import Callable, Iterator, List, Optional, TextIO, Tuple
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from gesetzessuche import parse_gesetz, Dokumente, Norm, P, DL, ContentElement
+from gesetzessuche import parse_gesetz, Dokumente, Norm
+from gesetzessuche.models import P, DL, DT, DD, ContentElement
+
+# Leading "(1)", "(2)" etc. Absatz marker including following whitespace
+_ABSATZ_RE = re.compile(r"\((\d+)\)\s*")
+
+# Deletes "§" from enbez in a single C-level pass
+_PARA_STRIP = str.maketrans("", "", "§")
+
+# Reference labels and indentation units, shared instead of rebuilt per item
+_ABSATZ = " Absatz "
+_NUMMER = " Nummer "
+_BUCHSTABE = " Buchstabe "
+_INDENTS = tuple("  " * level for level in range(6))
+
+
+def _strip_parts(parts: List[str], start: int) -> None:
+    """
+    Trim parts[start:] like " ".join(parts[start:]).strip(), in place.
+
+    Only the edge parts are touched, so a nested container needs no joined
+    string of its own. An empty result leaves a single "" behind.
+    """
+    first = start
+    last = len(parts) - 1
+    while first <= last and (not parts[first] or parts[first].isspace()):
+        first += 1
+    while last >= first and (not parts[last] or parts[last].isspace()):
+        last -= 1
+
+    if first > last:
+        parts[start:] = [""]
+        return
+
+    parts[first] = parts[first].lstrip()
+    parts[last] = parts[last].rstrip()
+    del parts[last + 1 :]
+    del parts[start:first]
 
 
 class MarkdownConverter:
@@ -20,133 +62,179 @@ class MarkdownConverter:
     def __init__(self, dokumente: Dokumente, gesetz_kuerzel: str):
         self.dokumente = dokumente
         self.gesetz_kuerzel = gesetz_kuerzel
-        self.output: List[str] = []
+        self._write: Callable[[str], object] = io.StringIO().write
+        # Prebuilt reference prefixes - avoids re-formatting per paragraph
+        self._kuerzel_prefix_bold = f"**{gesetz_kuerzel} "
+        self._kuerzel_prefix_plain = f"{gesetz_kuerzel} "
+
+    def _emit(self, line: str) -> None:
+        """Write a single output line to the current output target"""
+        self._write(line)
+        self._write("\n")
 
     def _extract_text(self, elements: List[ContentElement]) -> str:
-        """Recursively extract text from content elements"""
-        parts = []
-        for elem in elements:
-            if isinstance(elem, str):
+        """Extract text from content elements, joined once at the top level"""
+        parts: List[str] = []
+        self._extract_into(elements, parts)
+        return " ".join(parts).strip()
+
+    @staticmethod
+    def _extract_into(elements: List[ContentElement], parts: List[str]) -> None:
+        """Append the text of content elements to parts (without recursion)"""
+        _isinstance = isinstance
+
+        # Nested containers write into the same list - a frame only remembers
+        # where its parts start, so they can be trimmed once it is finished
+        stack: List[Tuple[Iterator[ContentElement], int]] = [
+            (iter(elements), len(parts))
+        ]
+
+        while stack:
+            elements_iter, start = stack[-1]
+            elem = next(elements_iter, None)
+
+            if elem is None:
+                stack.pop()
+                if stack:
+                    _strip_parts(parts, start)
+                continue
+
+            nested: Optional[List[ContentElement]] = None
+            if _isinstance(elem, str):
                 parts.append(elem)
-            elif isinstance(elem, P):
-                # Recursively extract from P elements
+            elif _isinstance(elem, P):
+                # Descend into P elements unless raw text is available
                 if elem.raw_text:
                     parts.append(elem.raw_text)
-                elif elem.content:
-                    parts.append(self._extract_text(elem.content))
-            elif isinstance(elem, DL):
+                else:
+                    nested = elem.content
+            elif _isinstance(elem, DL):
                 # Skip DL in text extraction - handled separately
                 continue
-            elif hasattr(elem, "text") and elem.text:
-                parts.append(elem.text)
-            elif hasattr(elem, "content") and elem.content:
-                parts.append(self._extract_text(elem.content))
-            elif hasattr(elem, "children") and elem.children:
-                parts.append(self._extract_text(elem.children))
+            else:
+                # Single attribute probe per field instead of hasattr + access
+                text = getattr(elem, "text", None)
+                if text:
+                    parts.append(text)
+                    continue
+                nested = getattr(elem, "content", None) or getattr(
+                    elem, "children", None
+                )
 
-        return " ".join(parts).strip()
+            if nested:
+                stack.append((iter(nested), len(parts)))
 
     def _process_dl_list(
         self, dl: DL, indent_level: int = 0, parent_ref: str | None = None
     ) -> None:
-        """Process a definition list recursively"""
-        indent = "  " * indent_level
+        """Process a definition list including nested lists (without recursion)"""
+        # Stack of (remaining items, indent level, parent reference). Nested
+        # lists are pushed on top so they are emitted right after their item.
+        stack: List[Tuple[Iterator[Tuple[DT, DD]], int, str | None]] = [
+            (zip(dl.dts, dl.dds), indent_level, parent_ref)
+        ]
+
+        while stack:
+            items, level, level_ref = stack[-1]
+            item = next(items, None)
+            if item is None:
+                stack.pop()
+                continue
+            dt, dd = item
 
-        for item in dl.items:
-            dt_text = item.dt.text or ""
+            indent = _INDENTS[level] if level < len(_INDENTS) else "  " * level
+            dt_text = dt.text or ""
 
             # Build reference
-            if parent_ref and indent_level == 0:
-                item_ref = f"{parent_ref} Nummer {dt_text}"
-            elif parent_ref and indent_level == 1:
-                item_ref = f"{parent_ref} Buchstabe {dt_text}"
+            if level_ref and level == 0:
+                item_ref = level_ref + _NUMMER + dt_text
+            elif level_ref and level == 1:
+                item_ref = level_ref + _BUCHSTABE + dt_text
             else:
                 item_ref = None
 
             # Extract DD content
-            if item.dd.la:
+            if dd.la:
                 # Check for nested DL
                 nested_dls = []
-                if item.dd.la.children:
+                if dd.la.children:
                     nested_dls = [
-                        child for child in item.dd.la.children if isinstance(child, DL)
+                        child for child in dd.la.children if isinstance(child, DL)
                     ]
 
                 if not nested_dls:
                     # Simple text
-                    text = item.dd.la.text or self._extract_text(item.dd.la.children)
+                    text = dd.la.text or self._extract_text(dd.la.children)
                     if text and item_ref:
-                        self.output.append(f"{indent}**{item_ref}** {text}")
+                        self._emit(f"{indent}**{item_ref}** {text}")
                     elif text:
-                        self.output.append(f"{indent}{dt_text}. {text}")
+                        self._emit(f"{indent}{dt_text}. {text}")
                 else:
                     # With nested list
-                    intro_text = item.dd.la.text or ""
+                    intro_text = dd.la.text or ""
                     if intro_text and item_ref:
-                        self.output.append(f"{indent}**{item_ref}** {intro_text}")
+                        self._emit(f"{indent}**{item_ref}** {intro_text}")
                     elif intro_text:
-                        self.output.append(f"{indent}{dt_text}. {intro_text}")
+                        self._emit(f"{indent}{dt_text}. {intro_text}")
                     elif item_ref:
-                        self.output.append(f"{indent}**{item_ref}**")
+                        self._emit(f"{indent}**{item_ref}**")
                     else:
-                        self.output.append(f"{indent}{dt_text}.")
+                        self._emit(f"{indent}{dt_text}.")
 
-                    # Process nested lists
-                    for nested_dl in nested_dls:
-                        self._process_dl_list(nested_dl, indent_level + 1, item_ref)
+                    # Queue nested lists (reversed, so the first one is on top)
+                    for nested_dl in reversed(nested_dls):
+                        stack.append(
+                            (zip(nested_dl.dts, nested_dl.dds), level + 1, item_ref)
+                        )
 
-    def _process_paragraph_content(self, p: P, paragraph_num: str) -> None:
-        """Process a paragraph element"""
+    def _process_paragraph_content(
+        self, p: P, base_ref_bold: str, base_ref_plain: str
+    ) -> None:
+        """Process a paragraph element (reference prefixes prebuilt per norm)"""
         # Get absatz number from P element (extracted during parsing)
         absatz_num = p.absatz_num
-        text = p.raw_text or ""
 
         # Build reference
         if absatz_num:
-            paragraph_ref = (
-                f"**{self.gesetz_kuerzel} {paragraph_num} Absatz {absatz_num}**"
-            )
-            paragraph_ref_plain = (
-                f"{self.gesetz_kuerzel} {paragraph_num} Absatz {absatz_num}"
-            )
-            # Remove (1), (2) etc. prefix from text since we already have absatz_num
-            if text.startswith(f"({absatz_num})"):
-                text = text[len(f"({absatz_num})") :].strip()
+            absatz_suffix = _ABSATZ + absatz_num
+            paragraph_ref = base_ref_bold + absatz_suffix + "**"
+            paragraph_ref_plain = base_ref_plain + absatz_suffix
+        else:
+            paragraph_ref = base_ref_bold + "**"
+            paragraph_ref_plain = base_ref_plain
+
+        # Single pass: collect DL lists and the text before the first DL
+        _isinstance = isinstance
+        _DL = DL
+        dl_lists: List[DL] = []
+        intro_parts: List[str] = []
+        for elem in p.content:
+            if _isinstance(elem, _DL):
+                dl_lists.append(elem)
+            elif not dl_lists and _isinstance(elem, str):
+                intro_parts.append(elem)
+
+        # Full text for simple paragraphs, intro text before the first DL otherwise
+        if dl_lists:
+            text = " ".join(intro_parts).strip()
         else:
-            paragraph_ref = f"**{self.gesetz_kuerzel} {paragraph_num}**"
-            paragraph_ref_plain = f"{self.gesetz_kuerzel} {paragraph_num}"
+            text = p.raw_text or ""
 
-        # Check for DL lists in content
-        dl_lists = [elem for elem in p.content if isinstance(elem, DL)]
+        # Remove (1), (2) etc. prefix once (using parsed absatz_num)
+        if absatz_num:
+            match = _ABSATZ_RE.match(text)
+            if match and match.group(1) == absatz_num:
+                text = text[match.end() :]
 
-        if not dl_lists:
-            # Simple text
-            if text:
-                self.output.append(f"{paragraph_ref} {text}")
-        else:
-            # Extract text before first DL
-            intro_parts = []
-            for elem in p.content:
-                if isinstance(elem, DL):
-                    break
-                if isinstance(elem, str):
-                    intro_parts.append(elem)
-
-            intro_text = " ".join(intro_parts).strip()
-            # Remove (1), (2) etc. prefix if present (using parsed absatz_num)
-            if absatz_num and intro_text.startswith(f"({absatz_num})"):
-                intro_text = intro_text[len(f"({absatz_num})") :].strip()
-
-            if intro_text:
-                self.output.append(f"{paragraph_ref} {intro_text}")
-            else:
-                self.output.append(f"{paragraph_ref}")
+        if text:
+            self._emit(f"{paragraph_ref} {text}")
+        elif dl_lists:
+            # Lists always get their reference line, even without intro text
+            self._emit(paragraph_ref)
 
-            # Process all DL lists
-            for dl in dl_lists:
-                self._process_dl_list(
-                    dl, indent_level=0, parent_ref=paragraph_ref_plain
-                )
+        # Process all DL lists
+        for dl in dl_lists:
+            self._process_dl_list(dl, indent_level=0, parent_ref=paragraph_ref_plain)
 
     def _process_norm(self, norm: Norm) -> None:
         """Process a single norm (paragraph or structure element)"""
@@ -162,11 +250,11 @@ class MarkdownConverter:
             if bez and titel:
                 # Determine heading level
                 if "Buch" in bez or "Teil" in bez:
-                    self.output.append(f"\n# {bez}: {titel}\n")
+                    self._emit(f"\n# {bez}: {titel}\n")
                 elif "Abschnitt" in bez or "Kapitel" in bez:
-                    self.output.append(f"\n## {bez}: {titel}\n")
+                    self._emit(f"\n## {bez}: {titel}\n")
                 else:
-                    self.output.append(f"\n### {bez}: {titel}\n")
+                    self._emit(f"\n### {bez}: {titel}\n")
             return
 
         # Handle paragraphs
@@ -174,66 +262,89 @@ class MarkdownConverter:
         if not enbez or not norm.textdaten:
             return
 
-        paragraph_num = enbez.replace("§", "").strip()
+        paragraph_num = enbez.translate(_PARA_STRIP).strip()
+        # Reference prefixes are stable for the whole norm - build them once
+        base_ref_bold = self._kuerzel_prefix_bold + paragraph_num
+        base_ref_plain = self._kuerzel_prefix_plain + paragraph_num
         titel_text = norm.metadaten.titel or ""
 
         # Heading
         if titel_text:
-            self.output.append(f"\n## {enbez} - {titel_text}\n")
+            self._emit(f"\n## {enbez} - {titel_text}\n")
         else:
-            self.output.append(f"\n## {enbez}\n")
+            self._emit(f"\n## {enbez}\n")
 
         # Process text content
         if norm.textdaten.text and norm.textdaten.text.content:
             content = norm.textdaten.text.content
 
-            # Find all P elements
-            p_elements = [elem for elem in content.elements if isinstance(elem, P)]
+            # P elements are collected once when the model is built
+            p_elements = content.p_elements
 
             if p_elements:
                 for p in p_elements:
-                    self._process_paragraph_content(p, paragraph_num)
+                    self._process_paragraph_content(p, base_ref_bold, base_ref_plain)
             else:
                 # Fallback: use raw text
                 if content.raw_text:
-                    ref = f"**{self.gesetz_kuerzel} {paragraph_num}**"
-                    self.output.append(f"{ref} {content.raw_text}\n")
+                    self._emit(f"{base_ref_bold}** {content.raw_text}\n")
+
+    def convert(self, file: Optional[TextIO] = None) -> str:
+        """Convert the document to Markdown
+
+        Writes directly to file if given (and returns ""), otherwise
+        returns the complete Markdown as a string.
+        """
+        buf: Optional[io.StringIO] = None
+        if file is None:
+            buf = io.StringIO()
+            self._write = buf.write
+        else:
+            self._write = file.write
 
-    def convert(self) -> str:
-        """Convert the document to Markdown"""
         # Title and metadata
         titel = self.dokumente.get_titel()
         if titel:
-            self.output.append(f"# {titel}\n")
-            self.output.append("")
-
-        # Stand information
-        if self.dokumente.normen and self.dokumente.normen[0].metadaten:
-            first_meta = self.dokumente.normen[0].metadaten
-            if first_meta.standangabe:
-                for stand in first_meta.standangabe:
+            self._emit(f"# {titel}\n")
+            self._emit("")
+
+        # Process all norms - the first one also carries the Stand information
+        for index, norm in enumerate(self.dokumente.normen):
+            if index == 0 and norm.metadaten:
+                for stand in norm.metadaten.standangabe:
                     if stand.standkommentar:
-                        self.output.append(f"*{stand.standkommentar}*\n")
-                        self.output.append("")
+                        self._emit(f"*{stand.standkommentar}*\n")
+                        self._emit("")
                         break
 
-        # Process all norms
-        for norm in self.dokumente.normen:
             self._process_norm(norm)
 
-        return "\n".join(self.output)
+        return buf.getvalue() if buf is not None else ""
 
     def save_markdown(self, output_path: Path) -> Path:
-        """Save the Markdown to a file"""
-        markdown_content = self.convert()
-
+        """Save the Markdown to a file (streamed, no full in-memory copy)"""
         with open(output_path, "w", encoding="utf-8") as f:
-            f.write(markdown_content)
+            self.convert(file=f)
 
         print(f"✓ Successfully converted: {output_path.name}")
         return output_path
 
 
+def convert_one(example_dir: Path, gesetz: Tuple[str, str, str]) -> None:
+    """Parse and convert a single law (runs in a worker process)"""
+    xml_file, kuerzel, md_file = gesetz
+    xml_path = example_dir / xml_file
+    if xml_path.exists():
+        # Parse using new parser
+        dokumente = parse_gesetz(xml_path)
+
+        # Convert to Markdown
+        converter = MarkdownConverter(dokumente, kuerzel)
+        converter.save_markdown(example_dir / md_file)
+    else:
+        print(f"⚠ Skipped: {xml_file} not found")
+
+
 def main() -> None:
     """Main function"""
     example_dir = Path(__file__).parent.parent / "example"
@@ -249,17 +360,10 @@ def main() -> None:
 
     print("Converting laws from XML to Markdown using new parser...\n")
 
-    for xml_file, kuerzel, md_file in gesetze:
-        xml_path = example_dir / xml_file
-        if xml_path.exists():
-            # Parse using new parser
-            dokumente = parse_gesetz(xml_path)
-
-            # Convert to Markdown
-            converter = MarkdownConverter(dokumente, kuerzel)
-            converter.save_markdown(example_dir / md_file)
-        else:
-            print(f"⚠ Skipped: {xml_file} not found")
+    # The laws are independent - parse and convert them in parallel processes
+    max_workers = min(len(gesetze), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(partial(convert_one, example_dir), gesetze))
 
     print("\n✓ Conversion complete!")
 
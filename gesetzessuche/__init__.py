@@ -25,6 +25,7 @@ Utility Functions:
     - load_toc_index: Load TOC index from gii-toc.xml
     - find_law_in_toc: Find law in TOC by code
     - download_laws_batch: Batch download laws
+    - iter_law_references: Find all law references in a text
 
 Formatting Functions:
     - extract_text_from_elements: Extract text from content elements
@@ -32,34 +33,90 @@ Formatting Functions:
     - format_p_element: Format a P element with lists and proper indentation
 """
 
-from .models import (
-    Content,
-    Dokumente,
-    LawMapping,
-    LawReference,
-    Metadaten,
-    Norm,
-    SearchResult,
-)
-from .parser import GesetzParser, parse_gesetz
-from .search import LawSearch
-from .utils import (
-    download_laws_batch,
-    extract_text_from_norm,
-    extract_text_from_p,
-    find_law_in_mapping,
-    find_law_in_toc,
-    get_law,
-    load_law_mapping,
-    load_toc_index,
-    parse_law_reference,
-    save_law_mapping,
-)
-from .formatting import (
-    extract_text_from_elements,
-    process_dl_list,
-    format_p_element,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .formatting import (
+        extract_text_from_elements,
+        format_p_element,
+        process_dl_list,
+    )
+    from .models import (
+        Content,
+        Dokumente,
+        LawMapping,
+        LawReference,
+        Metadaten,
+        Norm,
+        SearchResult,
+    )
+    from .parser import GesetzParser, parse_gesetz
+    from .search import LawSearch
+    from .utils import (
+        download_laws_batch,
+        extract_text_from_norm,
+        extract_text_from_p,
+        find_law_in_mapping,
+        find_law_in_toc,
+        get_law,
+        iter_law_references,
+        load_law_mapping,
+        load_toc_index,
+        parse_law_reference,
+        save_law_mapping,
+    )
+
+# Public name -> submodule. Submodules are imported on first attribute access
+# (PEP 562), so "import gesetzessuche" does not build all Pydantic models and
+# parser/search code up front.
+_LAZY_IMPORTS: dict[str, str] = {
+    # Models
+    "Content": ".models",
+    "Dokumente": ".models",
+    "LawMapping": ".models",
+    "LawReference": ".models",
+    "Metadaten": ".models",
+    "Norm": ".models",
+    "SearchResult": ".models",
+    # Parser
+    "GesetzParser": ".parser",
+    "parse_gesetz": ".parser",
+    # Search
+    "LawSearch": ".search",
+    # Utility Functions
+    "download_laws_batch": ".utils",
+    "extract_text_from_norm": ".utils",
+    "extract_text_from_p": ".utils",
+    "find_law_in_mapping": ".utils",
+    "find_law_in_toc": ".utils",
+    "get_law": ".utils",
+    "iter_law_references": ".utils",
+    "load_law_mapping": ".utils",
+    "load_toc_index": ".utils",
+    "parse_law_reference": ".utils",
+    "save_law_mapping": ".utils",
+    # Formatting Functions
+    "extract_text_from_elements": ".formatting",
+    "process_dl_list": ".formatting",
+    "format_p_element": ".formatting",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache in module namespace - later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Main classes
@@ -87,6 +144,7 @@ __all__ = [
     "find_law_in_toc",
     "download_laws_batch",
     "parse_law_reference",
+    "iter_law_references",
     # Formatting Functions
     "extract_text_from_elements",
     "process_dl_list",
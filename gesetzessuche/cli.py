@@ -34,14 +34,9 @@ import sys
 
 # Relative imports since we're inside the package
 from .search import LawSearch
-from .utils import get_law
+from .utils import get_law, parse_law_reference
 
-
-def main() -> int:
-    parser = argparse.ArgumentParser(
-        description="Search German law documents",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_EPILOG = """
 Examples:
   %(prog)s AktG                             # Show law info
   %(prog)s AktG --liste                     # List all paragraphs
@@ -51,7 +46,15 @@ Examples:
   %(prog)s -r "KStG § 8b Absatz 2"          # Reference with law code
   %(prog)s BGB --reference "§ 1"            # Reference without law code
   %(prog)s AktG --suche "Aufsichtsrat"      # Search for term
-        """,
+"""
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the command line interface."""
+    parser = argparse.ArgumentParser(
+        description="Search German law documents",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
     )
 
     parser.add_argument(
@@ -97,6 +100,11 @@ Examples:
         help="List all paragraphs",
     )
 
+    return parser
+
+
+def main() -> int:
+    parser = _get_parser()
     args = parser.parse_args()
 
     # Determine which law to load
@@ -104,8 +112,6 @@ Examples:
 
     if args.reference:
         # Parse reference to extract law code if present
-        from .utils import parse_law_reference
-
         parsed = parse_law_reference(args.reference)
         if parsed and parsed["law"]:
             # Reference contains law code
@@ -141,7 +147,8 @@ Examples:
         return 1
 
     # Get law code (short form) and title (long form)
-    law_key = documents.get_jurabk()[0] if documents.get_jurabk() else law_to_load
+    jurabk = documents.get_jurabk()
+    law_key = jurabk[0] if jurabk else law_to_load
     law_title = documents.get_titel() or law_key
 
     # Show loading message with long form
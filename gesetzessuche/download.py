@@ -15,48 +15,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Concurrent downloads for bulk operations (network bound)
+DOWNLOAD_WORKERS = 8
 
-def download_all_laws(skip_existing: bool = True) -> dict[str, int | str]:
-    """Download all laws and create mapping file."""
-    # Use user's home directory for data storage
-    base_path = Path.home() / ".gesetzessuche"
-    base_path.mkdir(exist_ok=True)
-    toc_index = load_toc_index(base_path)
-    target_dir = base_path / "data"
-    toc_entries = list(toc_index.items())
-
-    logger.info("Starting download of all laws")
-
-    result = download_laws_batch(
-        toc_entries=toc_entries,
-        target_dir=target_dir,
-        max_downloads=0,
-        skip_existing=skip_existing,
-        base_path=base_path,
-    )
-
-    logger.info("\n=== Download Complete ===")
-    logger.info(f"Downloaded: {result['downloaded']}")
-    logger.info(f"Failed: {result['failed']}")
-    logger.info(f"Skipped: {result['skipped']}")
-
-    return {
-        "downloaded": result["downloaded"],
-        "failed": result["failed"],
-        "skipped": result["skipped"],
-        "mapping_file": str(base_path / "law_mapping.json"),
-    }
-
-
-def download_essential_laws() -> dict[str, int | str]:
-    """
-    Download a curated set of essential German laws.
-
-    Returns:
-        Dictionary with download statistics
-    """
-    # Essential laws url_paths
-    essential_url_paths = [
+# Essential laws url_paths
+ESSENTIAL_URL_PATHS = frozenset(
+    {
         "agg",
         "aktg",
         "ao_1977",
@@ -99,8 +63,50 @@ def download_essential_laws() -> dict[str, int | str]:
         "vwvfg",
         "woeigg",
         "zpo",
-    ]
+    }
+)
 
+
+def download_all_laws(skip_existing: bool = True) -> dict[str, int | str]:
+    """Download all laws and create mapping file."""
+    # Use user's home directory for data storage
+    base_path = Path.home() / ".gesetzessuche"
+    base_path.mkdir(exist_ok=True)
+    toc_index = load_toc_index(base_path)
+    target_dir = base_path / "data"
+    toc_entries = list(toc_index.items())
+
+    logger.info("Starting download of all laws")
+
+    result = download_laws_batch(
+        toc_entries=toc_entries,
+        target_dir=target_dir,
+        max_downloads=0,
+        skip_existing=skip_existing,
+        base_path=base_path,
+        max_workers=DOWNLOAD_WORKERS,
+    )
+
+    logger.info("\n=== Download Complete ===")
+    logger.info(f"Downloaded: {result['downloaded']}")
+    logger.info(f"Failed: {result['failed']}")
+    logger.info(f"Skipped: {result['skipped']}")
+
+    return {
+        "downloaded": result["downloaded"],
+        "failed": result["failed"],
+        "skipped": result["skipped"],
+        "mapping_file": str(base_path / "law_mapping.json"),
+    }
+
+
+def download_essential_laws() -> dict[str, int | str]:
+    """
+    Download a curated set of essential German laws.
+
+    Returns:
+        Dictionary with download statistics
+    """
     # Use user's home directory for data storage
     base_path = Path.home() / ".gesetzessuche"
     base_path.mkdir(exist_ok=True)
@@ -108,10 +114,11 @@ def download_essential_laws() -> dict[str, int | str]:
     target_dir = base_path / "data"
 
     # Filter TOC to essential laws
-    essential_entries = []
-    for title, entry in toc_index.items():
-        if entry["url_path"] in essential_url_paths:
-            essential_entries.append((title, entry))
+    essential_entries = [
+        (title, entry)
+        for title, entry in toc_index.items()
+        if entry["url_path"] in ESSENTIAL_URL_PATHS
+    ]
 
     logger.info(f"Found {len(essential_entries)} essential laws to download")
 
@@ -121,6 +128,7 @@ def download_essential_laws() -> dict[str, int | str]:
         max_downloads=0,
         skip_existing=True,
         base_path=base_path,
+        max_workers=DOWNLOAD_WORKERS,
     )
 
     logger.info(
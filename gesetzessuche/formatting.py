@@ -7,13 +7,87 @@ Provides functions for:
 - Formatting paragraphs and sections
 """
 
-from typing import List
-from .models import P, DL, ContentElement
+import re
+from typing import Iterator, List, Tuple, Union, cast
+from .models import (
+    DL,
+    KIND_DL,
+    KIND_FORMAT,
+    KIND_OTHER,
+    KIND_P,
+    KIND_TEXT,
+    TOC,
+    ContentElement,
+    FormatElement,
+    Kommentar,
+    Norm,
+    P,
+    Pre,
+    Revision,
+)
+
+# Indentation strings for nested lists, indexed by indent level
+_INDENTS = tuple("  " * level for level in range(64))
+
+# Leading "(1)", "(2)" etc. Absatz marker including following whitespace
+_ABSATZ_PREFIX = re.compile(r"\((\w+)\)\s*")
+
+
+def _strip_absatz(text: str, absatz_num: str | None) -> str:
+    """
+    Remove a leading "(n)" marker if it matches the parsed Absatz number.
+
+    Args:
+        text: Paragraph text
+        absatz_num: Absatz number parsed from the P element
+
+    Returns:
+        Text without the marker, or the unchanged text
+    """
+    if not absatz_num:
+        return text
+    match = _ABSATZ_PREFIX.match(text)
+    if match and match.group(1) == absatz_num:
+        return text[match.end() :].strip()
+    return text
+
+
+def _join_stripped(parts: List[str]) -> str:
+    """
+    Join parts with spaces, without leading or trailing whitespace.
+
+    Same result as " ".join(parts).strip(), but trims the edge parts instead
+    of copying the whole joined string a second time.
+
+    Args:
+        parts: Text parts in document order
+
+    Returns:
+        Joined text
+    """
+    start = 0
+    end = len(parts)
+    while start < end and (not parts[start] or parts[start].isspace()):
+        start += 1
+    while end > start and (not parts[end - 1] or parts[end - 1].isspace()):
+        end -= 1
+    if start == end:
+        return ""
+    if end - start == 1:
+        return parts[start].strip()
+
+    first = parts[start].lstrip()
+    last = parts[end - 1].rstrip()
+    return " ".join([first, *parts[start + 1 : end - 1], last])
 
 
 def extract_text_from_elements(elements: List[ContentElement]) -> str:
     """
-    Recursively extract text from content elements.
+    Extract text from content elements (including nested elements).
+
+    Walks the tree with an explicit stack instead of recursion. Each nested
+    container gets its own frame, so its text is joined and stripped on its
+    own exactly like a recursive call would do.
 
     Args:
         elements: List of content elements
@@ -21,33 +95,86 @@ def extract_text_from_elements(elements: List[ContentElement]) -> str:
     Returns:
         Extracted text as string
     """
-    parts = []
-    for elem in elements:
+    root_parts: List[str] = []
+    # Frames of (remaining elements, collected parts)
+    stack: List[Tuple[Iterator[ContentElement], List[str]]] = [
+        (iter(elements), root_parts)
+    ]
+
+    while stack:
+        elements_iter, parts = stack[-1]
+        elem = next(elements_iter, None)
+
+        if elem is None:
+            # Container finished - hand its text to the parent frame
+            stack.pop()
+            if stack:
+                stack[-1][1].append(_join_stripped(parts))
+            continue
+
         if isinstance(elem, str):
             parts.append(elem)
-        elif isinstance(elem, P):
-            # Recursively extract from P elements
-            if elem.raw_text:
-                parts.append(elem.raw_text)
-            elif elem.content:
-                parts.append(extract_text_from_elements(elem.content))
-        elif isinstance(elem, DL):
-            # Skip DL in text extraction - handled separately
             continue
-        elif hasattr(elem, "text") and elem.text:
-            parts.append(elem.text)
-        elif hasattr(elem, "content") and elem.content:
-            parts.append(extract_text_from_elements(elem.content))
-        elif hasattr(elem, "children") and elem.children:
-            parts.append(extract_text_from_elements(elem.children))
 
-    return " ".join(parts).strip()
+        # One class attribute read instead of an isinstance/hasattr chain
+        kind = elem.kind
+        if kind == KIND_DL or kind == KIND_OTHER:
+            # DL lists are handled separately, other kinds carry no text
+            continue
+
+        nested: List[ContentElement] | None = None
+        if kind == KIND_P:
+            p = cast(P, elem)
+            if p.raw_text:
+                parts.append(p.raw_text)
+            else:
+                nested = p.content
+        elif kind == KIND_FORMAT:
+            fmt = cast(FormatElement, elem)
+            if fmt.text:
+                parts.append(fmt.text)
+            else:
+                nested = fmt.children
+        elif kind == KIND_TEXT:
+            text_elem = cast(Union[Kommentar, Pre], elem)
+            if text_elem.text:
+                parts.append(text_elem.text)
+        else:
+            # KIND_REVISION, KIND_TOC
+            nested = cast(Union[Revision, TOC], elem).content
+
+        if nested:
+            # Descend into the container with a fresh frame
+            stack.append((iter(nested), []))
+
+    return _join_stripped(root_parts)
+
+
+def _split_p_content(p: P) -> Tuple[List[str], List[DL]]:
+    """
+    Split the content of a P element into intro text parts and DL lists.
+
+    Args:
+        p: P element to split
+
+    Returns:
+        Tuple of (text parts before the first DL, all DL lists)
+    """
+    intro_parts: List[str] = []
+    for elem in p.content:
+        if isinstance(elem, DL):
+            break
+        if isinstance(elem, str):
+            intro_parts.append(elem)
+    # DL lists are collected once when the model is built
+    return intro_parts, p.dl_lists
 
 
 def process_dl_list(
     dl: DL,
     indent_level: int = 0,
     parent_ref: str | None = None,
+    out: List[str] | None = None,
 ) -> List[str]:
     """
     Process a definition list recursively with proper indentation.
@@ -55,30 +182,29 @@ def process_dl_list(
     Args:
         dl: Definition list to process
         indent_level: Current indentation level
-        parent_ref: Parent reference for building hierarchical references
+        parent_ref: Unused, list items are printed without references.
+            Kept for backward compatibility.
+        out: Existing line buffer to append to (nested lists share it)
 
     Returns:
-        List of formatted lines
+        List of formatted lines (out, if given)
     """
-    lines = []
-    indent = "  " * indent_level
-
-    for item in dl.items:
-        dt_text = item.dt.text or ""
+    lines: List[str] = [] if out is None else out
+    indent = (
+        _INDENTS[indent_level] if indent_level < len(_INDENTS) else "  " * indent_level
+    )
 
-        # Build reference - just append the DT text without labels
-        if parent_ref:
-            item_ref = f"{parent_ref} {dt_text}"
-        else:
-            item_ref = None
+    for dt, dd in zip(dl.dts, dl.dds):
+        dt_text = dt.text or ""
 
         # Extract DD content
-        if item.dd.la:
+        la = dd.la
+        if la:
             # Check for nested DL
             nested_dls = []
             text_parts = []
-            if item.dd.la.children:
-                for child in item.dd.la.children:
+            if la.children:
+                for child in la.children:
                     if isinstance(child, DL):
                         nested_dls.append(child)
                     elif isinstance(child, str):
@@ -87,24 +213,24 @@ def process_dl_list(
             if not nested_dls:
                 # Simple text - no nested lists
                 text = (
-                    item.dd.la.text
+                    la.text
                     or " ".join(text_parts)
-                    or extract_text_from_elements(item.dd.la.children)
+                    or extract_text_from_elements(la.children)
                 )
                 if text:
                     # Show with proper formatting
-                    lines.append(f"{indent}{dt_text} {text}")
+                    lines.append("".join([indent, dt_text, " ", text]))
             else:
                 # With nested list
-                intro_text = item.dd.la.text or " ".join(text_parts)
+                intro_text = la.text or " ".join(text_parts)
                 if intro_text:
-                    lines.append(f"{indent}{dt_text} {intro_text}")
+                    lines.append("".join([indent, dt_text, " ", intro_text]))
                 else:
-                    lines.append(f"{indent}{dt_text}")
+                    lines.append(indent + dt_text)
 
                 # Process nested lists
                 for nested_dl in nested_dls:
-                    lines.extend(process_dl_list(nested_dl, indent_level + 1, item_ref))
+                    process_dl_list(nested_dl, indent_level + 1, out=lines)
 
     return lines
 
@@ -113,59 +239,51 @@ def format_p_element(
     p: P,
     paragraph_ref: str,
     skip_intro: bool = False,
+    out: List[str] | None = None,
 ) -> List[str]:
     """
     Format a single P element with proper list formatting.
 
     Args:
         p: P element to format
-        paragraph_ref: Reference for building hierarchical references (e.g., "HGB 266 Absatz 2")
+        paragraph_ref: Reference of the paragraph (e.g., "HGB 266 Absatz 2").
+            Unused, kept for backward compatibility.
         skip_intro: If True, skip the intro text (because it's already in header)
+        out: Existing line buffer to append to
 
     Returns:
-        List of formatted lines
+        List of formatted lines (out, if given)
     """
-    lines = []
-
-    # Check for DL lists in content
-    dl_lists = [elem for elem in p.content if isinstance(elem, DL)]
-
-    if not dl_lists:
-        # Simple text without lists
-        text = p.raw_text or ""
-        # Remove (1), (2) etc. prefix if present (using parsed absatz_num)
-        if p.absatz_num and text.startswith(f"({p.absatz_num})"):
-            text = text[len(f"({p.absatz_num})") :].strip()
-
-        if text and not skip_intro:
-            lines.append(text)
-    else:
-        # With lists - extract text before first DL
-        intro_parts = []
-        for elem in p.content:
-            if isinstance(elem, DL):
-                break
-            if isinstance(elem, str):
-                intro_parts.append(elem)
-
-        intro_text = " ".join(intro_parts).strip()
-        # Remove (1), (2) etc. prefix if present (using parsed absatz_num)
-        if p.absatz_num and intro_text.startswith(f"({p.absatz_num})"):
-            intro_text = intro_text[len(f"({p.absatz_num})") :].strip()
-
-        # Only add intro text if not skipping
-        if intro_text and not skip_intro:
-            lines.append(intro_text)
-
-        # Process all DL lists
-        for dl in dl_lists:
-            lines.extend(process_dl_list(dl, indent_level=0, parent_ref=paragraph_ref))
+    lines: List[str] = [] if out is None else out
+
+    if not p.has_dl:
+        # Fast path: simple text without lists
+        if not skip_intro:
+            # Remove (1), (2) etc. prefix if present (using parsed absatz_num)
+            text = _strip_absatz(p.raw_text or "", p.absatz_num)
+            if text:
+                lines.append(text)
+        return lines
+
+    # With lists - text before first DL
+    intro_parts, dl_lists = _split_p_content(p)
+    intro_text = " ".join(intro_parts).strip()
+    # Remove (1), (2) etc. prefix if present (using parsed absatz_num)
+    intro_text = _strip_absatz(intro_text, p.absatz_num)
+
+    # Only add intro text if not skipping
+    if intro_text and not skip_intro:
+        lines.append(intro_text)
+
+    # Process all DL lists
+    for dl in dl_lists:
+        process_dl_list(dl, indent_level=0, out=lines)
 
     return lines
 
 
 def format_norm_content(
-    norm,  # Type: Norm - avoiding circular import
+    norm: Norm,
     law_code: str,
 ) -> str:
     """
@@ -173,7 +291,8 @@ def format_norm_content(
 
     Args:
         norm: Norm object to format
-        law_code: Law code for building references (e.g., "HGB")
+        law_code: Law code (e.g., "HGB"). Unused, list items are printed
+            without references. Kept for backward compatibility.
 
     Returns:
         Formatted text as string
@@ -185,8 +304,8 @@ def format_norm_content(
     if not text_content or not text_content.elements:
         return ""
 
-    # Find all P elements
-    p_elements = [elem for elem in text_content.elements if isinstance(elem, P)]
+    # P elements are collected once when the model is built
+    p_elements = text_content.p_elements
 
     if not p_elements:
         # Fallback to raw text
@@ -194,12 +313,7 @@ def format_norm_content(
             return text_content.raw_text
         return ""
 
-    # Get paragraph number from norm metadata
-    paragraph_num = ""
-    if norm.metadaten and norm.metadaten.enbez:
-        paragraph_num = norm.metadaten.enbez.replace("§", "").strip()
-
-    all_lines = []
+    all_lines: List[str] = []
 
     for idx, p in enumerate(p_elements):
         # Add spacing between Absätze (but not before the first one)
@@ -208,57 +322,36 @@ def format_norm_content(
 
         # Get absatz number from P element (extracted during parsing)
         absatz_num = p.absatz_num
-        text = p.raw_text or ""
-
-        # Build reference
-        if absatz_num:
-            paragraph_ref = f"{law_code} {paragraph_num} Absatz {absatz_num}"
-        else:
-            paragraph_ref = f"{law_code} {paragraph_num}"
-
-        # Check for DL lists
-        dl_lists = [elem for elem in p.content if isinstance(elem, DL)]
 
-        if not dl_lists:
-            # Simple text without lists
+        if not p.has_dl:
+            # Fast path: simple text without lists
+            text = p.raw_text or ""
             if absatz_num:
-                # Add Absatz header on same line as text if text is short
                 # Remove (1), (2) etc. prefix from text since we already have absatz_num
-                text_clean = text
-                if text.startswith(f"({absatz_num})"):
-                    text_clean = text[len(f"({absatz_num})") :].strip()
+                text_clean = _strip_absatz(text, absatz_num)
                 all_lines.append(
                     f"({absatz_num}) {text_clean}" if text_clean else f"({absatz_num})"
                 )
             elif text:
                 all_lines.append(text)
-        else:
-            # With lists - use format_p_element
-            # Extract intro text for Absatz header
-            intro_parts = []
-            for elem in p.content:
-                if isinstance(elem, DL):
-                    break
-                if isinstance(elem, str):
-                    intro_parts.append(elem)
-
-            intro_text = " ".join(intro_parts).strip()
-            # Remove (1), (2) etc. prefix from intro_text since we already have absatz_num
-            if absatz_num and intro_text.startswith(f"({absatz_num})"):
-                intro_text = intro_text[len(f"({absatz_num})") :].strip()
-
-            # Add Absatz header with intro text
-            if absatz_num and intro_text:
-                all_lines.append(f"({absatz_num}) {intro_text}")
-            elif absatz_num:
-                all_lines.append(f"({absatz_num})")
-            elif intro_text:
-                all_lines.append(intro_text)
-
-            # Process all DL lists
-            for dl in dl_lists:
-                all_lines.extend(
-                    process_dl_list(dl, indent_level=0, parent_ref=paragraph_ref)
-                )
+            continue
+
+        # With lists - intro text for Absatz header
+        intro_parts, dl_lists = _split_p_content(p)
+        intro_text = " ".join(intro_parts).strip()
+        # Remove (1), (2) etc. prefix from intro_text since we already have absatz_num
+        intro_text = _strip_absatz(intro_text, absatz_num)
+
+        # Add Absatz header with intro text
+        if absatz_num and intro_text:
+            all_lines.append(f"({absatz_num}) {intro_text}")
+        elif absatz_num:
+            all_lines.append(f"({absatz_num})")
+        elif intro_text:
+            all_lines.append(intro_text)
+
+        # Process all DL lists directly into the shared buffer
+        for dl in dl_lists:
+            process_dl_list(dl, indent_level=0, out=all_lines)
 
     return "\n".join(all_lines)
@@ -3,10 +3,18 @@ Pydantic Models für das gii-norm.dtd Schema
 Vollständige Abbildung der offiziellen DTD-Definition von gesetze-im-internet.de
 """
 
+import sys
 from datetime import date
-from typing import List, Literal, Optional, TypedDict, Union
+from typing import Any, ClassVar, Dict, List, Literal, Optional, TypedDict, Union
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
 
 
 # TypedDicts für API-Responses und Suchergebnisse
@@ -39,7 +47,37 @@ class LawReference(TypedDict):
     sentence: Optional[str]  # Optional: Satz number
 
 
-class Anlageabgabe(BaseModel):
+# Kurze Strings (Nummern wie "1.", "a)", Absatznummern) wiederholen sich
+# tausendfach und werden deshalb nur einmal im Speicher gehalten
+_INTERN_MAX_LEN = 32
+
+
+def _intern_short(value: Any) -> Any:
+    """Interniert kurze Strings, alles andere bleibt unverändert"""
+    if isinstance(value, str) and len(value) < _INTERN_MAX_LEN:
+        return sys.intern(value)
+    return value
+
+
+# Art eines ContentElements für schnelle Dispatch ohne isinstance/hasattr-Ketten
+KIND_OTHER = 0  # Kein Text (Tabelle, Bild, Datei, Fußnotenbereich)
+KIND_P = 1  # raw_text oder content
+KIND_DL = 2  # Listen werden separat verarbeitet
+KIND_FORMAT = 3  # text oder children
+KIND_REVISION = 4  # content
+KIND_TOC = 5  # content
+KIND_TEXT = 6  # nur text (Kommentar, Pre)
+
+
+class GiiModel(BaseModel):
+    """Gemeinsame Basis aller Dokument-Models (nach dem Parsen unveränderlich)"""
+
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    kind: ClassVar[int] = KIND_OTHER
+
+
+class Anlageabgabe(GiiModel):
     """Anlage- und Abgabedaten in Fundstelle"""
 
     anlagedat: Optional[str] = None
@@ -47,7 +85,7 @@ class Anlageabgabe(BaseModel):
     abgabedat: Optional[str] = None
 
 
-class Fundstelle(BaseModel):
+class Fundstelle(GiiModel):
     """Veröffentlichungsangaben eines Gesetzes"""
 
     typ: Optional[Literal["amtlich", "nichtamtlich"]] = None
@@ -56,7 +94,7 @@ class Fundstelle(BaseModel):
     anlageabgabe: Optional[Anlageabgabe] = None
 
 
-class Standangabe(BaseModel):
+class Standangabe(GiiModel):
     """Aktualitätsinformation des Gesetzes"""
 
     checked: Optional[Literal["ja", "nein"]] = None
@@ -64,7 +102,7 @@ class Standangabe(BaseModel):
     standkommentar: Optional[str] = None
 
 
-class Gliederungseinheit(BaseModel):
+class Gliederungseinheit(GiiModel):
     """Strukturelemente wie Buch, Abschnitt, Kapitel"""
 
     gliederungskennzahl: Optional[str] = None
@@ -72,14 +110,14 @@ class Gliederungseinheit(BaseModel):
     gliederungstitel: Optional[str] = None
 
 
-class AusfertigungsDatum(BaseModel):
+class AusfertigungsDatum(GiiModel):
     """Ausfertigungsdatum mit manuell-Attribut"""
 
     manuell: Literal["ja", "nein"]
     datum: Optional[date] = None
 
 
-class Metadaten(BaseModel):
+class Metadaten(GiiModel):
     """Metadaten einer Norm (Paragraph oder Gliederungseinheit)"""
 
     jurabk: List[str] = Field(default_factory=list)
@@ -99,8 +137,10 @@ class Metadaten(BaseModel):
 
     model_config = ConfigDict(populate_by_name=True)
 
+    _intern_enbez = field_validator("enbez", mode="before")(_intern_short)
 
-class IMG(BaseModel):
+
+class IMG(GiiModel):
     """Bild-Element"""
 
     src: str
@@ -116,7 +156,7 @@ class IMG(BaseModel):
     type: Optional[str] = None
 
 
-class FILE(BaseModel):
+class FILE(GiiModel):
     """Datei-Anhang"""
 
     src: str
@@ -125,14 +165,16 @@ class FILE(BaseModel):
     title: Optional[str] = None
 
 
-class DT(BaseModel):
+class DT(GiiModel):
     """Definition Term (Nummer/Buchstabe in Liste)"""
 
     id: Optional[str] = None
     text: Optional[str] = None
 
+    _intern_text = field_validator("text", mode="before")(_intern_short)
+
 
-class LA(BaseModel):
+class LA(GiiModel):
     """Listen-Absatz"""
 
     id: Optional[str] = None
@@ -141,8 +183,10 @@ class LA(BaseModel):
     text: Optional[str] = None
     children: List["ContentElement"] = Field(default_factory=list)
 
+    _intern_text = field_validator("text", mode="before")(_intern_short)
+
 
-class DD(BaseModel):
+class DD(GiiModel):
     """Definition Description (Text zu DT)"""
 
     id: Optional[str] = None
@@ -150,24 +194,50 @@ class DD(BaseModel):
     revisions: List["Revision"] = Field(default_factory=list)
 
 
-class DLItem(BaseModel):
+class DLItem(GiiModel):
     """Ein DT/DD-Paar in einer Definition List"""
 
     dt: DT
     dd: DD
 
 
-class DL(BaseModel):
-    """Definition List (nummerierte/alphabetische Liste)"""
+class DL(GiiModel):
+    """Definition List (nummerierte/alphabetische Liste)
+
+    DT- und DD-Elemente liegen in zwei parallelen Listen (dts[i] gehört zu dds[i]).
+    """
+
+    kind: ClassVar[int] = KIND_DL
 
     id: Optional[str] = None
     indent: Optional[str] = None
     font: Optional[str] = None
     type: Optional[str] = None
-    items: List[DLItem] = Field(default_factory=list)
-
-
-class Entry(BaseModel):
+    dts: List[DT] = Field(default_factory=list)
+    dds: List[DD] = Field(default_factory=list)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _split_items(cls, data: Any) -> Any:
+        """Akzeptiert weiterhin items=[DLItem, ...] beim Erstellen"""
+        if isinstance(data, dict) and "items" in data:
+            data = dict(data)
+            items = data.pop("items")
+            data["dts"] = [
+                item.dt if isinstance(item, DLItem) else item["dt"] for item in items
+            ]
+            data["dds"] = [
+                item.dd if isinstance(item, DLItem) else item["dd"] for item in items
+            ]
+        return data
+
+    @property
+    def items(self) -> List[DLItem]:
+        """DT/DD-Paare als DLItem-Liste (veraltet, besser zip(dts, dds))"""
+        return [DLItem(dt=dt, dd=dd) for dt, dd in zip(self.dts, self.dds)]
+
+
+class Entry(GiiModel):
     """Tabellenzelle"""
 
     id: Optional[str] = None
@@ -182,7 +252,7 @@ class Entry(BaseModel):
     content: List["ContentElement"] = Field(default_factory=list)
 
 
-class Row(BaseModel):
+class Row(GiiModel):
     """Tabellenzeile"""
 
     id: Optional[str] = None
@@ -191,7 +261,7 @@ class Row(BaseModel):
     entries: List[Entry] = Field(default_factory=list)
 
 
-class Colspec(BaseModel):
+class Colspec(GiiModel):
     """Spaltendefinition"""
 
     colname: Optional[str] = None
@@ -202,25 +272,25 @@ class Colspec(BaseModel):
     rowsep: Optional[str] = None
 
 
-class THead(BaseModel):
+class THead(GiiModel):
     """Tabellenkopf"""
 
     rows: List[Row] = Field(default_factory=list)
 
 
-class TBody(BaseModel):
+class TBody(GiiModel):
     """Tabellenkörper"""
 
     rows: List[Row] = Field(default_factory=list)
 
 
-class TFoot(BaseModel):
+class TFoot(GiiModel):
     """Tabellenfuß"""
 
     rows: List[Row] = Field(default_factory=list)
 
 
-class TGroup(BaseModel):
+class TGroup(GiiModel):
     """Tabellengruppe"""
 
     cols: int
@@ -230,7 +300,7 @@ class TGroup(BaseModel):
     tfoot: Optional[TFoot] = None
 
 
-class Table(BaseModel):
+class Table(GiiModel):
     """Tabelle"""
 
     id: Optional[str] = None
@@ -241,16 +311,42 @@ class Table(BaseModel):
     tgroups: List[TGroup] = Field(default_factory=list)
 
 
-class P(BaseModel):
+class P(GiiModel):
     """Absatz"""
 
+    kind: ClassVar[int] = KIND_P
+
     id: Optional[str] = None
     absatz_num: Optional[str] = None
     content: List["ContentElement"] = Field(default_factory=list)
     raw_text: Optional[str] = None
 
+    _intern_short_fields = field_validator("absatz_num", "raw_text", mode="before")(
+        _intern_short
+    )
 
-class Footnote(BaseModel):
+    _dl_lists: List["DL"] = PrivateAttr(default_factory=list)
+    # Von utils.extract_text_from_p beim ersten Aufruf gefüllt
+    _extracted_text: Optional[str] = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def _collect_dl_lists(self) -> "P":
+        """Sammelt die DL-Elemente einmalig beim Erstellen"""
+        self._dl_lists = [elem for elem in self.content if isinstance(elem, DL)]
+        return self
+
+    @property
+    def dl_lists(self) -> List["DL"]:
+        """Nur die DL-Elemente (Listen) aus content"""
+        return self._dl_lists
+
+    @property
+    def has_dl(self) -> bool:
+        """True, wenn der Absatz Listen enthält"""
+        return bool(self._dl_lists)
+
+
+class Footnote(GiiModel):
     """Einzelne Fußnote"""
 
     id: str
@@ -262,19 +358,19 @@ class Footnote(BaseModel):
     content: List["ContentElement"] = Field(default_factory=list)
 
 
-class Footnotes(BaseModel):
+class Footnotes(GiiModel):
     """Fußnoten-Container"""
 
     footnotes: List[Footnote] = Field(default_factory=list)
 
 
-class FnR(BaseModel):
+class FnR(GiiModel):
     """Fußnoten-Referenz"""
 
     id: str
 
 
-class FnArea(BaseModel):
+class FnArea(GiiModel):
     """Fußnoten-Referenzbereich"""
 
     line: Literal["0", "1"] = "1"
@@ -282,29 +378,37 @@ class FnArea(BaseModel):
     fn_refs: List[FnR] = Field(default_factory=list)
 
 
-class TOC(BaseModel):
+class TOC(GiiModel):
     """Table of Contents"""
 
+    kind: ClassVar[int] = KIND_TOC
+
     id: Optional[str] = None
     content: List["ContentElement"] = Field(default_factory=list)
 
 
-class Kommentar(BaseModel):
+class Kommentar(GiiModel):
     """Kommentar-Element"""
 
+    kind: ClassVar[int] = KIND_TEXT
+
     typ: Literal["Stand", "Stand-Hinweis", "Hinweis", "Fundstelle", "Verarbeitung"]
     text: Optional[str] = None
 
 
-class Pre(BaseModel):
+class Pre(GiiModel):
     """Vorformatierter Text"""
 
+    kind: ClassVar[int] = KIND_TEXT
+
     text: Optional[str] = None
 
 
-class FormatElement(BaseModel):
+class FormatElement(GiiModel):
     """Formatierungselement (B, I, U, SUP, SUB, etc.)"""
 
+    kind: ClassVar[int] = KIND_FORMAT
+
     tag: str
     id: Optional[str] = None
     cls: Optional[str] = Field(default=None, alias="class")
@@ -313,29 +417,46 @@ class FormatElement(BaseModel):
 
     model_config = ConfigDict(populate_by_name=True)
 
+    _intern_tag = field_validator("tag", "cls", mode="before")(_intern_short)
+
 
 ContentElement = Union[
     str, P, DL, Table, IMG, FILE, FnArea, TOC, Kommentar, Pre, FormatElement, "Revision"
 ]
 
 
-class Revision(BaseModel):
+class Revision(GiiModel):
     """Änderungsblock"""
 
+    kind: ClassVar[int] = KIND_REVISION
+
     id: Optional[str] = None
     postfix: Optional[str] = None
     content: List[ContentElement] = Field(default_factory=list)
 
 
-class Content(BaseModel):
+class Content(GiiModel):
     """Content-Container für strukturierten Text"""
 
     id: Optional[str] = None
     elements: List[ContentElement] = Field(default_factory=list)
     raw_text: Optional[str] = None
 
+    _p_elements: List[P] = PrivateAttr(default_factory=list)
+
+    @model_validator(mode="after")
+    def _split_p_elements(self) -> "Content":
+        """Sammelt die P-Elemente einmalig beim Erstellen"""
+        self._p_elements = [elem for elem in self.elements if isinstance(elem, P)]
+        return self
+
+    @property
+    def p_elements(self) -> List[P]:
+        """Nur die P-Elemente (Absätze) aus elements"""
+        return self._p_elements
+
 
-class Text(BaseModel):
+class Text(GiiModel):
     """Haupttext einer Norm"""
 
     format: Optional[str] = None
@@ -344,7 +465,7 @@ class Text(BaseModel):
     footnotes: Optional[Footnotes] = None
 
 
-class Fussnoten(BaseModel):
+class Fussnoten(GiiModel):
     """Fußnotenbereich einer Norm"""
 
     format: Optional[str] = None
@@ -353,14 +474,14 @@ class Fussnoten(BaseModel):
     footnotes: Optional[Footnotes] = None
 
 
-class Textdaten(BaseModel):
+class Textdaten(GiiModel):
     """Textdaten einer Norm (Inhalt)"""
 
     text: Optional[Text] = None
     fussnoten: Optional[Fussnoten] = None
 
 
-class Norm(BaseModel):
+class Norm(GiiModel):
     """Eine einzelne Norm (Paragraph, Artikel oder Gliederungseinheit)"""
 
     builddate: Optional[str] = None
@@ -369,8 +490,11 @@ class Norm(BaseModel):
     metadaten: Optional[Metadaten] = None
     textdaten: Optional[Textdaten] = None
 
+    # Von utils.extract_text_from_norm beim ersten Aufruf gefüllt
+    _extracted_text: Optional[str] = PrivateAttr(default=None)
 
-class Dokumente(BaseModel):
+
+class Dokumente(GiiModel):
     """Root-Element: Collection aller Normen eines Gesetzes"""
 
     builddate: Optional[str] = None
@@ -389,27 +513,46 @@ class Dokumente(BaseModel):
             return self.normen[0].metadaten.jurabk
         return []
 
+    # Lazy berechnete Listen/Index, erst beim ersten Zugriff gefüllt
+    _paragraphen: Optional[List[Norm]] = PrivateAttr(default=None)
+    _gliederung: Optional[List[Norm]] = PrivateAttr(default=None)
+    _paragraph_index: Optional[Dict[str, Norm]] = PrivateAttr(default=None)
+
     def get_paragraphen(self) -> List[Norm]:
-        """Gibt nur Paragraphen zurück (keine Gliederungseinheiten)"""
-        return [norm for norm in self.normen if norm.metadaten and norm.metadaten.enbez]
+        """Gibt nur Paragraphen zurück (keine Gliederungseinheiten)
+
+        Die Liste wird einmalig erstellt und wiederverwendet (nicht verändern).
+        """
+        if self._paragraphen is None:
+            self._paragraphen = [
+                norm for norm in self.normen if norm.metadaten and norm.metadaten.enbez
+            ]
+        return self._paragraphen
 
     def get_gliederung(self) -> List[Norm]:
-        """Gibt nur Gliederungseinheiten zurück"""
-        return [
-            norm
-            for norm in self.normen
-            if norm.metadaten and norm.metadaten.gliederungseinheit
-        ]
+        """Gibt nur Gliederungseinheiten zurück
+
+        Die Liste wird einmalig erstellt und wiederverwendet (nicht verändern).
+        """
+        if self._gliederung is None:
+            self._gliederung = [
+                norm
+                for norm in self.normen
+                if norm.metadaten and norm.metadaten.gliederungseinheit
+            ]
+        return self._gliederung
 
     def find_paragraph(self, enbez: str) -> Optional[Norm]:
         """Findet einen Paragraphen nach seiner Bezeichnung (z.B. '§ 1')"""
-        enbez_normalized = enbez.replace("§", "").strip()
-        for norm in self.get_paragraphen():
-            if norm.metadaten and norm.metadaten.enbez:
-                norm_enbez = norm.metadaten.enbez.replace("§", "").strip()
-                if norm_enbez == enbez_normalized:
-                    return norm
-        return None
+        if self._paragraph_index is None:
+            # Normalisierte Bezeichnung -> erste Norm mit dieser Bezeichnung
+            index: Dict[str, Norm] = {}
+            for norm in self.get_paragraphen():
+                if norm.metadaten and norm.metadaten.enbez:
+                    key = norm.metadaten.enbez.replace("§", "").strip()
+                    index.setdefault(key, norm)
+            self._paragraph_index = index
+        return self._paragraph_index.get(enbez.replace("§", "").strip())
 
 
 # Rebuild all models with forward references to ContentElement
@@ -3,11 +3,30 @@ XML Parser für deutsche Gesetzestexte
 Konvertiert gii-norm.dtd konforme XML-Dateien in Pydantic Models
 """
 
+import importlib
 import re
 import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime
+from itertools import repeat
 from pathlib import Path
-from typing import List, Literal, Optional, cast
+from types import ModuleType
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 
 from .models import (
     DD,
@@ -22,7 +41,6 @@ from .models import (
     Colspec,
     Content,
     ContentElement,
-    DLItem,
     Dokumente,
     Entry,
     FnArea,
@@ -50,6 +68,51 @@ from .models import (
     THead,
 )
 
+lxml_etree: Optional[ModuleType]
+try:
+    # Optional: libxml2-based parser, noticeably faster on large laws
+    lxml_etree = importlib.import_module("lxml.etree")
+except ImportError:  # pragma: no cover - depends on installed extras
+    lxml_etree = None
+
+# Line breaks, tabs and spaces (no NBSP - legal texts use it deliberately)
+_WHITESPACE_RE = re.compile(r"[\r\n\t ]+")
+
+_LXML_ELEMENT: Any = lxml_etree._Element if lxml_etree is not None else None
+
+# Allowed values of Literal-typed attributes
+_FUNDSTELLE_TYP: FrozenSet[Literal["amtlich", "nichtamtlich"]] = frozenset(
+    {"amtlich", "nichtamtlich"}
+)
+_JA_NEIN: FrozenSet[Literal["ja", "nein"]] = frozenset({"ja", "nein"})
+_FNAREA_LINE: FrozenSet[Literal["0", "1"]] = frozenset({"0", "1"})
+_FNAREA_SIZE: FrozenSet[Literal["normal", "large", "small"]] = frozenset(
+    {"normal", "large", "small"}
+)
+_KOMMENTAR_TYP: FrozenSet[
+    Literal["Stand", "Stand-Hinweis", "Hinweis", "Fundstelle", "Verarbeitung"]
+] = frozenset({"Stand", "Stand-Hinweis", "Hinweis", "Fundstelle", "Verarbeitung"})
+_LA_SIZE: FrozenSet[Literal["normal", "small", "tiny"]] = frozenset(
+    {"normal", "small", "tiny"}
+)
+
+_L = TypeVar("_L", bound=str)
+_D = TypeVar("_D", bound=Optional[str])
+
+
+def _literal(raw: Optional[str], allowed: FrozenSet[_L], default: _D) -> _L | _D:
+    """Returns raw if it is one of the allowed literal values, else default"""
+    if raw in allowed:
+        return raw
+    return default
+
+
+# Inline formatting tags, parsed as FormatElement
+_FORMAT_TAGS = frozenset({"B", "I", "U", "SUP", "SUB", "SP", "small", "Citation"})
+
+# Norms per task when parsing with a process pool
+_PARALLEL_CHUNK_SIZE = 64
+
 
 class GesetzParser:
     """Parser für Gesetzes-XML-Dateien gemäß gii-norm.dtd"""
@@ -57,26 +120,27 @@ class GesetzParser:
     @staticmethod
     def _normalize_whitespace(text: str) -> str:
         """Normalize whitespace without destroying word boundaries"""
-        # Replace line breaks and tabs with spaces
-        text = (
-            text.replace("\r\n", " ")
-            .replace("\r", " ")
-            .replace("\n", " ")
-            .replace("\t", " ")
-        )
-        # Collapse multiple spaces into one
-        while "  " in text:
-            text = text.replace("  ", " ")
-        return text
+        # Most text is already normalized - the substring checks are plain C
+        # scans and much cheaper than running the regex over the whole text
+        if (
+            "\n" not in text
+            and "  " not in text
+            and "\t" not in text
+            and "\r" not in text
+        ):
+            return text
+        # Line breaks, tabs and runs of spaces become a single space
+        return _WHITESPACE_RE.sub(" ", text)
 
     @staticmethod
-    def _get_attr(elem: ET.Element, *names: str) -> Optional[str]:
-        """Robust attribute reading - tries multiple case variants"""
-        for name in names:
-            val = elem.get(name)
-            if val:
-                return val
-        return None
+    def _get_id(elem: ET.Element) -> Optional[str]:
+        """Liest das ID-Attribut in allen vorkommenden Schreibweisen"""
+        return elem.get("ID") or elem.get("Id") or elem.get("id") or None
+
+    @staticmethod
+    def _get_class(elem: ET.Element) -> Optional[str]:
+        """Liest das Class-Attribut in allen vorkommenden Schreibweisen"""
+        return elem.get("Class") or elem.get("class") or None
 
     @staticmethod
     def _get_text(elem: ET.Element, tag: str) -> Optional[str]:
@@ -85,20 +149,55 @@ class GesetzParser:
         return child.text.strip() if child is not None and child.text else None
 
     @staticmethod
-    def _get_all_text(elem: ET.Element, tag: str) -> List[str]:
-        """Extrahiert Text aus allen Child-Elementen mit Tag"""
+    def _get_all_text(children: Iterable[ET.Element]) -> List[str]:
+        """Extrahiert Text aus allen übergebenen Child-Elementen"""
         return [
             child.text.strip()
-            for child in elem.findall(tag)
+            for child in children
             if child.text and child.text.strip()
         ]
 
+    @staticmethod
+    def _findall(elem: ET.Element, tag: str) -> Iterable[ET.Element]:
+        """Alle direkten Kinder mit Tag (unter lxml in C gefiltert, ohne Liste)"""
+        if _LXML_ELEMENT is not None and isinstance(elem, _LXML_ELEMENT):
+            return cast(Iterable[ET.Element], elem.iterchildren(tag))
+        return elem.findall(tag)
+
+    @staticmethod
+    def _group_children(elem: ET.Element) -> Dict[str, List[ET.Element]]:
+        """Gruppiert die direkten Kinder nach Tag (ein Durchlauf statt find je Tag)"""
+        groups: Dict[str, List[ET.Element]] = {}
+        for child in elem:
+            group = groups.get(child.tag)
+            if group is None:
+                groups[child.tag] = [child]
+            else:
+                group.append(child)
+        return groups
+
+    @staticmethod
+    def _first(groups: Dict[str, List[ET.Element]], tag: str) -> Optional[ET.Element]:
+        """Erstes Kind mit Tag aus _group_children (wie elem.find)"""
+        group = groups.get(tag)
+        return group[0] if group else None
+
+    @staticmethod
+    def _child_text(child: Optional[ET.Element]) -> Optional[str]:
+        """Extrahiert Text aus einem bereits gefundenen Child-Element"""
+        return child.text.strip() if child is not None and child.text else None
+
     @staticmethod
     def _parse_date(date_str: Optional[str]) -> Optional[date]:
         """Parst Datumsstring im Format YYYY-MM-DD"""
         if not date_str:
             return None
         try:
+            # Schneller Weg für das übliche Format ohne Format-Parser
+            if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+                digits = date_str[:4] + date_str[5:7] + date_str[8:]
+                if digits.isascii() and digits.isdigit():
+                    return date(int(digits[:4]), int(digits[4:6]), int(digits[6:]))
             return datetime.strptime(date_str, "%Y-%m-%d").date()
         except ValueError:
             return None
@@ -119,13 +218,8 @@ class GesetzParser:
         if elem is None:
             return None
 
-        typ_raw = elem.get("typ")
-        typ: Optional[Literal["amtlich", "nichtamtlich"]] = None
-        if typ_raw in ("amtlich", "nichtamtlich"):
-            typ = cast(Literal["amtlich", "nichtamtlich"], typ_raw)
-
         return Fundstelle(
-            typ=typ,
+            typ=_literal(elem.get("typ"), _FUNDSTELLE_TYP, None),
             periodikum=self._get_text(elem, "periodikum"),
             zitstelle=self._get_text(elem, "zitstelle"),
             anlageabgabe=self.parse_anlageabgabe(elem.find("anlageabgabe")),
@@ -136,13 +230,8 @@ class GesetzParser:
         if elem is None:
             return None
 
-        checked_raw = elem.get("checked")
-        checked: Optional[Literal["ja", "nein"]] = None
-        if checked_raw in ("ja", "nein"):
-            checked = cast(Literal["ja", "nein"], checked_raw)
-
         return Standangabe(
-            checked=checked,
+            checked=_literal(elem.get("checked"), _JA_NEIN, None),
             standtyp=self._get_text(elem, "standtyp"),
             standkommentar=self._get_text(elem, "standkommentar"),
         )
@@ -167,47 +256,48 @@ class GesetzParser:
         if elem is None:
             return None
 
-        manuell_raw = elem.get("manuell") or "nein"
-        manuell: Literal["ja", "nein"] = "nein"
-        if manuell_raw in ("ja", "nein"):
-            manuell = cast(Literal["ja", "nein"], manuell_raw)
         datum = self._parse_date(elem.text) if elem.text else None
 
-        return AusfertigungsDatum(manuell=manuell, datum=datum)
+        return AusfertigungsDatum(
+            manuell=_literal(elem.get("manuell"), _JA_NEIN, "nein"), datum=datum
+        )
 
     def parse_metadaten(self, elem: Optional[ET.Element]) -> Optional[Metadaten]:
         """Parst Metadaten-Element"""
         if elem is None:
             return None
 
-        fundstelle_list = []
-        for f in elem.findall("fundstelle"):
-            parsed_f = self.parse_fundstelle(f)
-            if parsed_f is not None:
-                fundstelle_list.append(parsed_f)
+        children = self._group_children(elem)
+        first = self._first
+        child_text = self._child_text
 
-        standangabe_list = []
-        for s in elem.findall("standangabe"):
-            parsed_s = self.parse_standangabe(s)
-            if parsed_s is not None:
-                standangabe_list.append(parsed_s)
+        fundstelle_list = [
+            parsed_f
+            for parsed_f in map(self.parse_fundstelle, children.get("fundstelle", ()))
+            if parsed_f is not None
+        ]
+        standangabe_list = [
+            parsed_s
+            for parsed_s in map(self.parse_standangabe, children.get("standangabe", ()))
+            if parsed_s is not None
+        ]
 
         return Metadaten(
-            jurabk=self._get_all_text(elem, "jurabk"),
-            amtabk=self._get_text(elem, "amtabk"),
+            jurabk=self._get_all_text(children.get("jurabk", ())),
+            amtabk=child_text(first(children, "amtabk")),
             **{
                 "ausfertigung-datum": self.parse_ausfertigung_datum(
-                    elem.find("ausfertigung-datum")
+                    first(children, "ausfertigung-datum")
                 )
             },
             fundstelle=fundstelle_list,
-            kurzue=self._get_text(elem, "kurzue"),
-            langue=self._get_text(elem, "langue"),
+            kurzue=child_text(first(children, "kurzue")),
+            langue=child_text(first(children, "langue")),
             standangabe=standangabe_list,
-            enbez=self._get_text(elem, "enbez"),
-            titel=self._get_text(elem, "titel"),
+            enbez=child_text(first(children, "enbez")),
+            titel=child_text(first(children, "titel")),
             gliederungseinheit=self.parse_gliederungseinheit(
-                elem.find("gliederungseinheit")
+                first(children, "gliederungseinheit")
             ),
         )
 
@@ -242,42 +332,17 @@ class GesetzParser:
 
     def parse_fnarea(self, elem: ET.Element) -> FnArea:
         """Parst FnArea-Element"""
-        line_raw = elem.get("Line", "1")
-        line: Literal["0", "1"] = "1"
-        if line_raw in ("0", "1"):
-            line = cast(Literal["0", "1"], line_raw)
-
-        size_raw = elem.get("Size", "normal")
-        size: Literal["normal", "large", "small"] = "normal"
-        if size_raw in ("normal", "large", "small"):
-            size = cast(Literal["normal", "large", "small"], size_raw)
-
         return FnArea(
-            line=line,
-            size=size,
-            fn_refs=[self.parse_fnr(fnr) for fnr in elem.findall("FnR")],
+            line=_literal(elem.get("Line"), _FNAREA_LINE, "1"),
+            size=_literal(elem.get("Size"), _FNAREA_SIZE, "normal"),
+            fn_refs=[self.parse_fnr(fnr) for fnr in self._findall(elem, "FnR")],
         )
 
     def parse_kommentar(self, elem: ET.Element) -> Kommentar:
         """Parst kommentar-Element"""
-        typ_raw = elem.get("typ", "Hinweis")
-        typ: Literal[
-            "Stand", "Stand-Hinweis", "Hinweis", "Fundstelle", "Verarbeitung"
-        ] = "Hinweis"
-        if typ_raw in (
-            "Stand",
-            "Stand-Hinweis",
-            "Hinweis",
-            "Fundstelle",
-            "Verarbeitung",
-        ):
-            typ = cast(
-                Literal[
-                    "Stand", "Stand-Hinweis", "Hinweis", "Fundstelle", "Verarbeitung"
-                ],
-                typ_raw,
-            )
-        return Kommentar(typ=typ, text=elem.text)
+        return Kommentar(
+            typ=_literal(elem.get("typ"), _KOMMENTAR_TYP, "Hinweis"), text=elem.text
+        )
 
     def parse_pre(self, elem: ET.Element) -> Pre:
         """Parst pre-Element"""
@@ -289,23 +354,28 @@ class GesetzParser:
 
     def parse_la(self, elem: ET.Element) -> LA:
         """Parst LA-Element"""
-        size_raw = elem.get("Size")
-        size: Optional[Literal["normal", "small", "tiny"]] = None
-        if size_raw in ("normal", "small", "tiny"):
-            size = cast(Literal["normal", "small", "tiny"], size_raw)
-
+        # len() statt list(): prüft auf Kinder ohne sie zu kopieren
+        has_children = len(elem) > 0
         return LA(
             id=elem.get("ID"),
-            size=size,
+            size=_literal(elem.get("Size"), _LA_SIZE, None),
             value=elem.get("Value"),
-            text=self._extract_raw_text(elem) if not list(elem) else None,
-            children=self.parse_content_elements(elem) if list(elem) else [],
+            text=None if has_children else self._extract_raw_text(elem),
+            children=self.parse_content_elements(elem) if has_children else [],
         )
 
     def parse_dd(self, elem: ET.Element) -> DD:
         """Parst DD-Element"""
-        la_elem = elem.find("LA")
-        revisions = [self.parse_revision(r) for r in elem.findall("Revision")]
+        # Ein Durchlauf über die Kinder statt find + findall
+        la_elem: Optional[ET.Element] = None
+        revisions: List[Revision] = []
+        for child in elem:
+            tag = child.tag
+            if tag == "LA":
+                if la_elem is None:
+                    la_elem = child
+            elif tag == "Revision":
+                revisions.append(self.parse_revision(child))
 
         return DD(
             id=elem.get("ID"),
@@ -315,23 +385,25 @@ class GesetzParser:
 
     def parse_dl(self, elem: ET.Element) -> DL:
         """Parst DL-Element (Definition List)"""
-        items = []
+        dts = []
+        dds = []
         current_dt = None
 
         for child in elem:
             if child.tag == "DT":
                 current_dt = self.parse_dt(child)
             elif child.tag == "DD" and current_dt:
-                dd = self.parse_dd(child)
-                items.append(DLItem(dt=current_dt, dd=dd))
+                dts.append(current_dt)
+                dds.append(self.parse_dd(child))
                 current_dt = None
 
         return DL(
-            id=self._get_attr(elem, "ID", "Id", "id"),
+            id=self._get_id(elem),
             indent=elem.get("Indent"),
             font=elem.get("Font"),
             type=elem.get("Type"),
-            items=items,
+            dts=dts,
+            dds=dds,
         )
 
     def parse_colspec(self, elem: ET.Element) -> Colspec:
@@ -368,35 +440,33 @@ class GesetzParser:
             id=elem.get("ID"),
             rowsep=elem.get("rowsep"),
             valign=elem.get("valign"),
-            entries=[self.parse_entry(e) for e in elem.findall("entry")],
+            entries=[self.parse_entry(e) for e in self._findall(elem, "entry")],
         )
 
     def parse_thead(self, elem: ET.Element) -> THead:
         """Parst thead-Element"""
-        return THead(rows=[self.parse_row(r) for r in elem.findall("row")])
+        return THead(rows=[self.parse_row(r) for r in self._findall(elem, "row")])
 
     def parse_tbody(self, elem: ET.Element) -> TBody:
         """Parst tbody-Element"""
-        return TBody(rows=[self.parse_row(r) for r in elem.findall("row")])
+        return TBody(rows=[self.parse_row(r) for r in self._findall(elem, "row")])
 
     def parse_tfoot(self, elem: ET.Element) -> TFoot:
         """Parst tfoot-Element"""
-        return TFoot(rows=[self.parse_row(r) for r in elem.findall("row")])
+        return TFoot(rows=[self.parse_row(r) for r in self._findall(elem, "row")])
 
     def parse_tgroup(self, elem: ET.Element) -> TGroup:
         """Parst tgroup-Element"""
-        thead_elem = elem.find("thead")
-        tbody_elem = elem.find("tbody")
-        tfoot_elem = elem.find("tfoot")
-
-        if tbody_elem is None:
-            tbody_elem = ET.Element("tbody")
+        children = self._group_children(elem)
+        thead_elem = self._first(children, "thead")
+        tbody_elem = self._first(children, "tbody")
+        tfoot_elem = self._first(children, "tfoot")
 
         return TGroup(
             cols=int(elem.get("cols", "1")),
-            colspecs=[self.parse_colspec(c) for c in elem.findall("colspec")],
+            colspecs=[self.parse_colspec(c) for c in children.get("colspec", ())],
             thead=self.parse_thead(thead_elem) if thead_elem is not None else None,
-            tbody=self.parse_tbody(tbody_elem),
+            tbody=self.parse_tbody(tbody_elem) if tbody_elem is not None else TBody(),
             tfoot=self.parse_tfoot(tfoot_elem) if tfoot_elem is not None else None,
         )
 
@@ -405,22 +475,28 @@ class GesetzParser:
         title_elem = elem.find("Title")
 
         return Table(
-            id=self._get_attr(elem, "ID", "Id", "id"),
+            id=self._get_id(elem),
             frame=elem.get("frame"),
             colsep=elem.get("colsep"),
             rowsep=elem.get("rowsep"),
             title=title_elem.text if title_elem is not None else None,
-            tgroups=[self.parse_tgroup(tg) for tg in elem.findall("tgroup")],
+            tgroups=[self.parse_tgroup(tg) for tg in self._findall(elem, "tgroup")],
         )
 
     def parse_format_element(self, elem: ET.Element) -> FormatElement:
         """Parst Formatierungselement (B, I, U, SUP, SUB, etc.)"""
+        return self._build_format_element(elem, self.parse_content_elements(elem))
+
+    def _build_format_element(
+        self, elem: ET.Element, children: List[ContentElement]
+    ) -> FormatElement:
+        """Erstellt ein Formatierungselement aus bereits geparsten Kindern"""
         return FormatElement(
             tag=elem.tag,
-            id=self._get_attr(elem, "ID", "Id", "id"),
-            **{"class": self._get_attr(elem, "Class", "class")},
+            id=self._get_id(elem),
+            **{"class": self._get_class(elem)},
             text=elem.text,
-            children=self.parse_content_elements(elem),
+            children=children,
         )
 
     def parse_p(self, elem: ET.Element) -> P:
@@ -453,57 +529,83 @@ class GesetzParser:
         """Parst TOC-Element"""
         return TOC(id=elem.get("ID"), content=self.parse_content_elements(elem))
 
+    # Tag -> Parse-Methode für strukturierte Content-Elemente
+    _CONTENT_HANDLERS: ClassVar[
+        Dict[str, Callable[["GesetzParser", ET.Element], ContentElement]]
+    ] = {
+        "P": parse_p,
+        "DL": parse_dl,
+        "table": parse_table,
+        "IMG": parse_img,
+        "FILE": parse_file_element,
+        "FnArea": parse_fnarea,
+        "TOC": parse_toc,
+        "kommentar": parse_kommentar,
+        "pre": parse_pre,
+        "Revision": parse_revision,
+    }
+
     def parse_content_elements(self, elem: ET.Element) -> List[ContentElement]:
-        """Parst Content-Elemente rekursiv"""
+        """Parst Content-Elemente (verschachtelte Formatierungen iterativ)"""
         elements: List[ContentElement] = []
-
-        if elem.text:
-            text = self._normalize_whitespace(elem.text)
+        # Bound once instead of attribute lookups per child
+        normalize = self._normalize_whitespace
+        get_handler = self._CONTENT_HANDLERS.get
+        format_tags = _FORMAT_TAGS
+        extract_raw_text = self._extract_raw_text
+
+        # Whitespace-only text and tails are dropped before the regex runs,
+        # they make up most text nodes in indented XML
+        text = elem.text
+        if text and not text.isspace():
             # Only strip leading/trailing whitespace from the entire text block
-            text = text.strip()
-            if text:
-                elements.append(text)
-
-        for child in elem:
-            if child.tag == "SUP" and (
-                child.get("class") == "Rec" or child.get("Class") == "Rec"
-            ):
-                pass
-            elif child.tag == "P":
-                elements.append(self.parse_p(child))
-            elif child.tag == "DL":
-                elements.append(self.parse_dl(child))
-            elif child.tag == "table":
-                elements.append(self.parse_table(child))
-            elif child.tag == "IMG":
-                elements.append(self.parse_img(child))
-            elif child.tag == "FILE":
-                elements.append(self.parse_file_element(child))
-            elif child.tag == "FnArea":
-                elements.append(self.parse_fnarea(child))
-            elif child.tag == "TOC":
-                elements.append(self.parse_toc(child))
-            elif child.tag == "kommentar":
-                elements.append(self.parse_kommentar(child))
-            elif child.tag == "pre":
-                elements.append(self.parse_pre(child))
-            elif child.tag == "Revision":
-                elements.append(self.parse_revision(child))
-            elif child.tag in ("B", "I", "U", "SUP", "SUB", "SP", "small", "Citation"):
-                elements.append(self.parse_format_element(child))
-            elif child.tag == "BR":
-                elements.append("\n")
+            elements.append(normalize(text).strip())
+
+        # Nested format elements (B in I in SUP ...) get their own frame instead
+        # of a recursive call: (remaining children, output list, format element
+        # that receives the output list once its children are done)
+        stack: List[
+            Tuple[Iterator[ET.Element], List[ContentElement], Optional[ET.Element]]
+        ] = [(iter(elem), elements, None)]
+        while stack:
+            children, out, owner = stack[-1]
+            child = next(children, None)
+
+            if child is None:
+                stack.pop()
+                if owner is None:
+                    continue
+                # Format element finished - add it to the parent, then its tail
+                child = owner
+                out, children_out = stack[-1][1], out
+                out.append(self._build_format_element(child, children_out))
             else:
-                text = self._extract_raw_text(child)
-                if text:
-                    elements.append(text)
-
-            if child.tail:
-                tail = self._normalize_whitespace(child.tail)
-                # Preserve spacing between elements - only strip if empty
-                if tail and tail != " ":
-                    # Keep leading/trailing space if not just whitespace
-                    elements.append(tail)
+                tag = child.tag
+                handler = get_handler(tag)
+                if handler is not None:
+                    out.append(handler(self, child))
+                elif tag in format_tags:
+                    if tag != "SUP" or (
+                        child.get("class") != "Rec" and child.get("Class") != "Rec"
+                    ):
+                        nested: List[ContentElement] = []
+                        text = child.text
+                        if text and not text.isspace():
+                            nested.append(normalize(text).strip())
+                        # The tail follows once the nested frame is done
+                        stack.append((iter(child), nested, child))
+                        continue
+                elif tag == "BR":
+                    out.append("\n")
+                else:
+                    text = extract_raw_text(child)
+                    if text:
+                        out.append(text)
+
+            tail = child.tail
+            if tail and tail.strip(" \r\n\t"):
+                # Keep leading/trailing space to preserve spacing between elements
+                out.append(normalize(tail))
 
         return elements
 
@@ -536,40 +638,59 @@ class GesetzParser:
             return None
 
         return Footnotes(
-            footnotes=[self.parse_footnote(fn) for fn in elem.findall("Footnote")]
+            footnotes=[
+                self.parse_footnote(fn) for fn in self._findall(elem, "Footnote")
+            ]
         )
 
     def _extract_raw_text(self, elem: ET.Element) -> str:
         """Extrahiert reinen Text aus Element (ohne Tags)"""
-        text_parts = []
+        text_parts: List[str] = []
+        append = text_parts.append
 
         if elem.text:
-            text_parts.append(elem.text)
+            append(elem.text)
+
+        # Iterative depth-first walk: (remaining children, element whose tail
+        # follows once they are done)
+        stack: List[Tuple[Iterator[ET.Element], Optional[ET.Element]]] = [
+            (iter(elem), None)
+        ]
+        push = stack.append
+        pop = stack.pop
+        while stack:
+            children, owner = stack[-1]
+            child = next(children, None)
+            if child is None:
+                pop()
+                if owner is not None and owner.tail:
+                    append(owner.tail)
+                continue
 
-        for child in elem:
             if child.tag == "SUP" and (
                 child.get("class") == "Rec" or child.get("Class") == "Rec"
             ):
                 if child.tail:
-                    text_parts.append(child.tail)
+                    append(child.tail)
                 continue
 
-            text_parts.append(self._extract_raw_text(child))
-            if child.tail:
-                text_parts.append(child.tail)
+            text = child.text
+            if text:
+                append(text)
+            push((iter(child), child))
 
-        text = " ".join(text_parts)
-        text = " ".join(text.split())
-        return text.strip()
+        # Part boundaries count as word boundaries, whitespace is collapsed once
+        return " ".join(" ".join(text_parts).split())
 
     def parse_text(self, elem: Optional[ET.Element]) -> Optional[Text]:
         """Parst Text-Element"""
         if elem is None:
             return None
 
-        toc_elem = elem.find("TOC")
-        content_elem = elem.find("Content")
-        footnotes_elem = elem.find("Footnotes")
+        children = self._group_children(elem)
+        toc_elem = self._first(children, "TOC")
+        content_elem = self._first(children, "Content")
+        footnotes_elem = self._first(children, "Footnotes")
 
         return Text(
             format=elem.get("format"),
@@ -583,9 +704,10 @@ class GesetzParser:
         if elem is None:
             return None
 
-        toc_elem = elem.find("TOC")
-        content_elem = elem.find("Content")
-        footnotes_elem = elem.find("Footnotes")
+        children = self._group_children(elem)
+        toc_elem = self._first(children, "TOC")
+        content_elem = self._first(children, "Content")
+        footnotes_elem = self._first(children, "Footnotes")
 
         return Fussnoten(
             format=elem.get("format"),
@@ -599,53 +721,184 @@ class GesetzParser:
         if elem is None:
             return None
 
+        children = self._group_children(elem)
         return Textdaten(
-            text=self.parse_text(elem.find("text")),
-            fussnoten=self.parse_fussnoten(elem.find("fussnoten")),
+            text=self.parse_text(self._first(children, "text")),
+            fussnoten=self.parse_fussnoten(self._first(children, "fussnoten")),
         )
 
     def parse_norm(self, elem: ET.Element) -> Norm:
         """Parst Norm-Element"""
+        children = self._group_children(elem)
         return Norm(
             builddate=elem.get("builddate"),
             doknr=elem.get("doknr"),
-            metadaten=self.parse_metadaten(elem.find("metadaten")),
-            textdaten=self.parse_textdaten(elem.find("textdaten")),
+            metadaten=self.parse_metadaten(self._first(children, "metadaten")),
+            textdaten=self.parse_textdaten(self._first(children, "textdaten")),
         )
 
     def parse_dokumente(self, root: ET.Element) -> Dokumente:
         """Parst Dokumente-Root-Element"""
         # Use direct children only to avoid nested duplicates
-        normen = [self.parse_norm(norm) for norm in root.findall("./norm")]
+        normen = [self.parse_norm(norm) for norm in self._findall(root, "norm")]
 
         return Dokumente(
             builddate=root.get("builddate"), doknr=root.get("doknr"), normen=normen
         )
 
-    def parse_xml_file(self, file_path: Path | str) -> Dokumente:
+    def parse_xml_file(
+        self, file_path: Path | str, max_workers: Optional[int] = None
+    ) -> Dokumente:
         """
         Parst eine Gesetzes-XML-Datei
 
+        Die Normen werden einzeln gestreamt, bereits verarbeitete Teilbäume
+        werden sofort wieder freigegeben.
+
         Args:
             file_path: Pfad zur XML-Datei
+            max_workers: Anzahl Prozesse für paralleles Parsen der Normen.
+                None oder 1 parst sequentiell. Lohnt sich nur für große
+                Gesetze auf Mehrkern-Rechnern, da die Normen zwischen den
+                Prozessen serialisiert werden.
 
         Returns:
             Dokumente-Objekt mit allen Normen
         """
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-        return self.parse_dokumente(root)
+        root_attrs: Dict[str, Optional[str]] = {}
+        if max_workers is not None and max_workers > 1:
+            normen = self._parse_norms_parallel(file_path, root_attrs, max_workers)
+        else:
+            normen = [
+                self.parse_norm(norm_elem)
+                for norm_elem in self._iter_norm_elements(file_path, root_attrs)
+            ]
+
+        return Dokumente(
+            builddate=root_attrs.get("builddate"),
+            doknr=root_attrs.get("doknr"),
+            normen=normen,
+        )
+
+    def parse_xml_file_streaming(self, file_path: Path | str) -> Iterator[Norm]:
+        """
+        Liefert die Normen einer Gesetzes-XML-Datei einzeln (speichersparend)
+
+        Args:
+            file_path: Pfad zur XML-Datei
+
+        Returns:
+            Iterator über die Normen in Dokumentreihenfolge
+        """
+        for norm_elem in self._iter_norm_elements(file_path, {}):
+            yield self.parse_norm(norm_elem)
+
+    def _parse_norms_parallel(
+        self,
+        file_path: Path | str,
+        root_attrs: Dict[str, Optional[str]],
+        max_workers: int,
+    ) -> List[Norm]:
+        """
+        Parst die Normen blockweise in einem Prozess-Pool
+
+        Jede Norm wird als XML-Bytes an die Worker übergeben und dort neu
+        geparst. Die Reihenfolge der Normen bleibt erhalten.
+        """
+        chunks: List[List[bytes]] = []
+        chunk: List[bytes] = []
+        for norm_elem in self._iter_norm_elements(file_path, root_attrs):
+            # Tail gehört nicht zur Norm und darf nicht mitserialisiert werden
+            norm_elem.tail = None
+            if lxml_etree is not None and isinstance(norm_elem, _LXML_ELEMENT):
+                chunk.append(lxml_etree.tostring(norm_elem))
+            else:
+                chunk.append(ET.tostring(norm_elem))
+            if len(chunk) == _PARALLEL_CHUNK_SIZE:
+                chunks.append(chunk)
+                chunk = []
+        if chunk:
+            chunks.append(chunk)
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(_parse_norm_chunk, chunks, repeat(type(self)))
+            return [norm for parsed in results for norm in parsed]
+
+    @staticmethod
+    def _iter_norm_elements(
+        file_path: Path | str, root_attrs: Dict[str, Optional[str]]
+    ) -> Iterator[ET.Element]:
+        """
+        Streamt die direkten norm-Kinder des Root-Elements (mit lxml, falls installiert)
+
+        Jedes Element ist nur bis zum nächsten Schritt gültig und wird danach
+        geleert. Die Attribute des Root-Elements landen in root_attrs.
+        """
+        if lxml_etree is not None:
+            # Kommentare/PIs verwerfen wie der ElementTree-Parser
+            context = lxml_etree.iterparse(
+                str(file_path),
+                events=("end",),
+                tag="norm",
+                huge_tree=True,
+                remove_comments=True,
+                remove_pis=True,
+            )
+            for _, elem in context:
+                parent = elem.getparent()
+                # Use direct children of the root only to avoid nested duplicates
+                if parent is None or parent.getparent() is not None:
+                    continue
+                if not root_attrs:
+                    root_attrs.update(parent.attrib)
+                yield elem
+                # Free the processed norm and everything before it
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del parent[0]
+            if not root_attrs and context.root is not None:
+                root_attrs.update(context.root.attrib)
+            return
+
+        depth = 0
+        root: Optional[ET.Element] = None
+        for event, elem in ET.iterparse(file_path, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = elem
+                    root_attrs.update(elem.attrib)
+                depth += 1
+                continue
+
+            depth -= 1
+            if depth == 1 and root is not None:
+                # Use direct children of the root only to avoid nested duplicates
+                if elem.tag == "norm":
+                    yield elem
+                # Free the processed subtree
+                elem.clear()
+                root.remove(elem)
+
+
+def _parse_norm_chunk(
+    chunk: List[bytes], parser_cls: Type[GesetzParser] = GesetzParser
+) -> List[Norm]:
+    """Parst serialisierte norm-Elemente (läuft im Worker-Prozess)"""
+    parser = parser_cls()
+    fromstring = lxml_etree.fromstring if lxml_etree is not None else ET.fromstring
+    return [parser.parse_norm(fromstring(blob)) for blob in chunk]
 
 
-def parse_gesetz(file_path: Path | str) -> Dokumente:
+def parse_gesetz(file_path: Path | str, max_workers: Optional[int] = None) -> Dokumente:
     """
     Convenience-Funktion zum Parsen einer Gesetzes-XML-Datei
 
     Args:
         file_path: Pfad zur XML-Datei
+        max_workers: Anzahl Prozesse für paralleles Parsen (None = sequentiell)
 
     Returns:
         Dokumente-Objekt mit allen Normen
     """
     parser = GesetzParser()
-    return parser.parse_xml_file(file_path)
+    return parser.parse_xml_file(file_path, max_workers=max_workers)
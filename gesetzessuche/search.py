@@ -8,9 +8,65 @@ Provides the LawSearch class for:
 - Displaying law information
 """
 
-from .models import Dokumente, Norm, P, DL, SearchResult
+import re
+
+from .models import Dokumente, Norm, SearchResult
 from .utils import parse_law_reference, extract_text_from_norm
-from .formatting import format_p_element, format_norm_content
+from .formatting import (
+    _split_p_content,
+    _strip_absatz,
+    format_norm_content,
+    format_p_element,
+)
+
+# Words as indexed by LawSearch.search_word
+_WORD_RE = re.compile(r"\w+")
+
+
+def _insert_after_nth_newline(text: str, n: int, line: str) -> str:
+    """
+    Insert a line after the n-th line of a text.
+
+    Same result as splitting into lines, list.insert(n, line) and joining
+    again, without building the list of all lines.
+
+    Args:
+        text: Multi-line text
+        n: Number of lines to keep before the inserted line
+        line: Line to insert
+
+    Returns:
+        Text with the inserted line (appended if text has at most n lines)
+    """
+    idx = -1
+    for _ in range(n):
+        idx = text.find("\n", idx + 1)
+        if idx < 0:
+            return text + "\n" + line
+    return text[: idx + 1] + line + "\n" + text[idx + 1 :]
+
+
+def _match_context(text: str, match_start: int, match_end: int) -> str:
+    """
+    Cut the context around a match, marking cut-off text with "...".
+
+    Args:
+        text: Searched text
+        match_start: Start offset of the match
+        match_end: End offset of the match
+
+    Returns:
+        Up to 100 characters before and after the match, including the match
+    """
+    start = max(0, match_start - 100)
+    end = min(len(text), match_end + 100)
+    context = text[start:end]
+
+    if start > 0:
+        context = "..." + context
+    if end < len(text):
+        context = context + "..."
+    return context
 
 
 class LawSearch:
@@ -26,6 +82,12 @@ class LawSearch:
         """
         self.documents = documents
         self.law_code = law_code
+        # Paragraph list shared by all queries (the document is immutable)
+        self._paragraphs = documents.get_paragraphen()
+        # (enbez, title, text) per paragraph with text, built on first search
+        self._search_texts: list[tuple[str, str, str]] | None = None
+        # Lowercased word -> positions in _search_texts, built on first search_word
+        self._word_index: dict[str, list[int]] | None = None
 
     def _format_paragraph(self, norm: Norm, show_full_text: bool = True) -> str:
         """
@@ -71,18 +133,9 @@ class LawSearch:
         Returns:
             Formatted paragraph text or None if not found
         """
-        paragraph_num = paragraph_num.replace("§", "").strip()
-
-        paragraphs = self.documents.get_paragraphen()
-        for norm in paragraphs:
-            if not norm.metadaten or not norm.metadaten.enbez:
-                continue
-
-            current_para = norm.metadaten.enbez.replace("§", "").strip()
-            if current_para == paragraph_num:
-                return self._format_paragraph(norm)
-
-        return None
+        # Dict lookup in the paragraph index of the document
+        norm = self.documents.find_paragraph(paragraph_num)
+        return self._format_paragraph(norm) if norm else None
 
     def find_paragraph_section(
         self, paragraph_num: str, section_num: str
@@ -97,18 +150,8 @@ class LawSearch:
         Returns:
             Formatted section text or None if not found
         """
-        paragraph_num = paragraph_num.replace("§", "").strip()
-
-        paragraphs = self.documents.get_paragraphen()
-        for norm in paragraphs:
-            if not norm.metadaten or not norm.metadaten.enbez:
-                continue
-
-            current_para = norm.metadaten.enbez.replace("§", "").strip()
-            if current_para == paragraph_num:
-                return self._find_section_in_norm(norm, section_num)
-
-        return None
+        norm = self.documents.find_paragraph(paragraph_num)
+        return self._find_section_in_norm(norm, section_num) if norm else None
 
     def _find_section_in_norm(self, norm: Norm, section_num: str) -> str | None:
         """
@@ -128,68 +171,52 @@ class LawSearch:
         if not text_content or not text_content.elements:
             return None
 
-        # Look through content for section
-        section_count = 0
+        # P elements are collected once when the model is built - index directly
+        p_elements = text_content.p_elements
         target_section = int(section_num)
+        if not 1 <= target_section <= len(p_elements):
+            return None
+        item = p_elements[target_section - 1]
+
+        enbez = norm.metadaten.enbez if norm.metadaten and norm.metadaten.enbez else "?"
+
+        # Extract intro text for header
+        intro_parts, _ = _split_p_content(item)
+        intro_text = " ".join(intro_parts).strip()
+        # Remove (1), (2) etc. prefix if present (using parsed absatz_num)
+        intro_text = _strip_absatz(intro_text, item.absatz_num)
 
-        for item in text_content.elements:
-            if isinstance(item, P):
-                section_count += 1
-                if section_count == target_section:
-                    enbez = (
-                        norm.metadaten.enbez
-                        if norm.metadaten and norm.metadaten.enbez
-                        else "?"
-                    )
-
-                    # Extract intro text for header
-                    intro_parts = []
-                    for elem in item.content:
-                        if isinstance(elem, DL):
-                            break
-                        if isinstance(elem, str):
-                            intro_parts.append(elem)
-
-                    intro_text = " ".join(intro_parts).strip()
-                    # Remove (1), (2) etc. prefix if present (using parsed absatz_num)
-                    if item.absatz_num and intro_text.startswith(
-                        f"({item.absatz_num})"
-                    ):
-                        intro_text = intro_text[len(f"({item.absatz_num})") :].strip()
-
-                    # Build header with intro text (but only if short enough)
-                    # Use max 50 chars for intro text in header, otherwise show in body
-                    MAX_HEADER_INTRO_LENGTH = 50
-                    skip_intro_in_body = False
-
-                    if intro_text and len(intro_text) <= MAX_HEADER_INTRO_LENGTH:
-                        header = f"{self.law_code} {enbez} Absatz {section_num} - {intro_text}"
-                        skip_intro_in_body = True
-                    else:
-                        header = f"{self.law_code} {enbez} Absatz {section_num}"
-                        skip_intro_in_body = False
-
-                    # Build paragraph reference for formatting
-                    paragraph_ref = f"{self.law_code} {enbez} Absatz {section_num}"
-
-                    # Format the P element
-                    formatted_lines = format_p_element(
-                        item,
-                        paragraph_ref,
-                        skip_intro=skip_intro_in_body,
-                    )
-
-                    result = [
-                        header,
-                        "=" * 70,
-                        "\n".join(formatted_lines),
-                    ]
-                    return "\n".join(result)
-
-        return None
+        # Build header with intro text (but only if short enough)
+        # Use max 50 chars for intro text in header, otherwise show in body
+        MAX_HEADER_INTRO_LENGTH = 50
+        skip_intro_in_body = False
+
+        if intro_text and len(intro_text) <= MAX_HEADER_INTRO_LENGTH:
+            header = f"{self.law_code} {enbez} Absatz {section_num} - {intro_text}"
+            skip_intro_in_body = True
+        else:
+            header = f"{self.law_code} {enbez} Absatz {section_num}"
+            skip_intro_in_body = False
+
+        # Build paragraph reference for formatting
+        paragraph_ref = f"{self.law_code} {enbez} Absatz {section_num}"
+
+        # Format the P element
+        formatted_lines = format_p_element(
+            item,
+            paragraph_ref,
+            skip_intro=skip_intro_in_body,
+        )
+
+        result = [
+            header,
+            "=" * 70,
+            "\n".join(formatted_lines),
+        ]
+        return "\n".join(result)
 
     def search_term(
-        self, term: str, case_sensitive: bool = False
+        self, term: str, case_sensitive: bool = False, limit: int | None = None
     ) -> list[SearchResult]:
         """
         Search for a term in all paragraphs.
@@ -197,45 +224,164 @@ class LawSearch:
         Args:
             term: Term to search for
             case_sensitive: Whether to perform case-sensitive search
+            limit: Stop after this many results (default: None = all)
 
         Returns:
             List of search results with context
         """
+        if limit is not None and limit <= 0:
+            return []
+
         results: list[SearchResult] = []
-        search_term = term if case_sensitive else term.lower()
+        # Case-insensitive matching runs on the original text, so no lowercase
+        # copy of every norm is needed and match offsets always fit the text
+        pattern = None if case_sensitive else re.compile(re.escape(term), re.IGNORECASE)
+
+        for enbez, title, text in self._get_search_texts():
+            if pattern is None:
+                idx = text.find(term)
+                match_end = idx + len(term)
+            else:
+                match = pattern.search(text)
+                idx, match_end = match.span() if match else (-1, -1)
 
-        for norm in self.documents.get_paragraphen():
-            if not norm.metadaten or not norm.metadaten.enbez:
-                continue
+            if idx >= 0:
+                results.append(
+                    {
+                        "paragraph": enbez,
+                        "title": title,
+                        "context": _match_context(text, idx, match_end),
+                    }
+                )
+                if limit is not None and len(results) >= limit:
+                    break
 
-            text = extract_text_from_norm(norm)
-            if not text:
-                continue
+        return results
 
-            compare_text = text if case_sensitive else text.lower()
+    def search_terms(
+        self, terms: list[str], case_sensitive: bool = False, limit: int | None = None
+    ) -> list[SearchResult]:
+        """
+        Search for several terms at once in all paragraphs.
 
-            if search_term in compare_text:
-                # Extract context around match
-                idx = compare_text.find(search_term)
-                start = max(0, idx - 100)
-                end = min(len(text), idx + len(term) + 100)
-                context = text[start:end]
+        All terms are combined into a single pattern, so every paragraph is
+        scanned once instead of once per term.
 
-                if start > 0:
-                    context = "..." + context
-                if end < len(text):
-                    context = context + "..."
+        Args:
+            terms: Terms to search for, a paragraph matches if it contains any
+            case_sensitive: Whether to perform case-sensitive search
+            limit: Stop after this many results (default: None = all)
 
+        Returns:
+            List of search results, context around the first match
+        """
+        # Longest terms first, so overlapping terms match as much as possible
+        unique_terms = sorted({term for term in terms if term}, key=len, reverse=True)
+        if not unique_terms or (limit is not None and limit <= 0):
+            return []
+
+        pattern = re.compile(
+            "|".join(map(re.escape, unique_terms)),
+            0 if case_sensitive else re.IGNORECASE,
+        )
+        results: list[SearchResult] = []
+
+        for enbez, title, text in self._get_search_texts():
+            match = pattern.search(text)
+            if match:
                 results.append(
                     {
-                        "paragraph": norm.metadaten.enbez,
-                        "title": norm.metadaten.titel or "",
-                        "context": context,
+                        "paragraph": enbez,
+                        "title": title,
+                        "context": _match_context(text, *match.span()),
                     }
                 )
+                if limit is not None and len(results) >= limit:
+                    break
+
+        return results
+
+    def search_word(self, word: str, limit: int | None = None) -> list[SearchResult]:
+        """
+        Search for a whole word (case-insensitive) using an inverted index.
+
+        The index maps every word to the paragraphs containing it and is
+        built on the first call, so repeated queries only look up the word
+        instead of scanning all texts. Unlike search_term, "Gesellschaft"
+        does not match "Gesellschafter". Terms that are not a single word
+        (e.g., "Handels-register") fall back to search_term.
+
+        Args:
+            word: Word to search for
+            limit: Stop after this many results (default: None = all)
+
+        Returns:
+            List of search results, context around the first occurrence
+        """
+        if limit is not None and limit <= 0:
+            return []
+        if not _WORD_RE.fullmatch(word):
+            return self.search_term(word, limit=limit)
+
+        positions = self._get_word_index().get(word.lower(), [])
+        search_texts = self._get_search_texts()
+        pattern = re.compile(rf"(?<!\w){re.escape(word)}(?!\w)", re.IGNORECASE)
+
+        results: list[SearchResult] = []
+        for position in positions:
+            enbez, title, text = search_texts[position]
+            match = pattern.search(text)
+            if not match:
+                continue
+            results.append(
+                {
+                    "paragraph": enbez,
+                    "title": title,
+                    "context": _match_context(text, match.start(), match.end()),
+                }
+            )
+            if limit is not None and len(results) >= limit:
+                break
 
         return results
 
+    def _get_word_index(self) -> dict[str, list[int]]:
+        """
+        Get the inverted word index over the searchable texts.
+
+        Returns:
+            Dictionary of lowercased word -> positions in _get_search_texts()
+        """
+        if self._word_index is None:
+            index: dict[str, list[int]] = {}
+            for position, (_, _, text) in enumerate(self._get_search_texts()):
+                # Each paragraph once per word, positions stay in text order
+                for word in {word.lower() for word in _WORD_RE.findall(text)}:
+                    index.setdefault(word, []).append(position)
+            self._word_index = index
+        return self._word_index
+
+    def _get_search_texts(self) -> list[tuple[str, str, str]]:
+        """
+        Get the searchable text of all paragraphs.
+
+        Extracted once per instance, so repeated searches only scan the texts.
+
+        Returns:
+            List of (enbez, title, text) tuples, paragraphs without text omitted
+        """
+        if self._search_texts is None:
+            search_texts = []
+            for norm in self._paragraphs:
+                metadaten = norm.metadaten
+                if not metadaten or not metadaten.enbez:
+                    continue
+                text = extract_text_from_norm(norm)
+                if text:
+                    search_texts.append((metadaten.enbez, metadaten.titel or "", text))
+            self._search_texts = search_texts
+        return self._search_texts
+
     def list_all_paragraphs(self) -> list[dict[str, str]]:
         """
         List all paragraphs with their titles.
@@ -243,15 +389,12 @@ class LawSearch:
         Returns:
             List of dictionaries with 'number' and 'title' keys
         """
-        result = []
-        for norm in self.documents.get_paragraphen():
-            if norm.metadaten and norm.metadaten.enbez:
-                result.append(
-                    {
-                        "number": norm.metadaten.enbez,
-                        "title": norm.metadaten.titel or "",
-                    }
-                )
+        result: list[dict[str, str]] = []
+        append = result.append
+        for norm in self._paragraphs:
+            metadaten = norm.metadaten
+            if metadaten and metadaten.enbez:
+                append({"number": metadaten.enbez, "title": metadaten.titel or ""})
         return result
 
     def get_by_reference(self, reference: str) -> str | None:
@@ -303,9 +446,7 @@ class LawSearch:
                     if note_parts:
                         note = f"(Gesucht: {' '.join(note_parts)})"
                         # Insert note after header
-                        lines = result.split("\n")
-                        lines.insert(3, note)
-                        return "\n".join(lines)
+                        return _insert_after_nth_newline(result, 3, note)
                 return result
             else:
                 # No section specified, show entire paragraph
@@ -325,17 +466,18 @@ class LawSearch:
         Returns:
             Formatted law information string
         """
+        paragraphs = self._paragraphs
         result = []
         result.append("=" * 70)
         result.append(f"{self.law_code}: {self.documents.get_titel() or 'Unknown'}")
         result.append("=" * 70)
         result.append(f"Abbreviations: {', '.join(self.documents.get_jurabk())}")
         result.append(f"Total norms:   {len(self.documents.normen)}")
-        result.append(f"Paragraphs:    {len(self.documents.get_paragraphen())}")
+        result.append(f"Paragraphs:    {len(paragraphs)}")
         result.append(f"Structure:     {len(self.documents.get_gliederung())} elements")
         result.append("")
         result.append("First 5 paragraphs:")
-        for norm in self.documents.get_paragraphen()[:5]:
+        for norm in paragraphs[:5]:
             if norm.metadaten and norm.metadaten.enbez:
                 title = norm.metadaten.titel or ""
                 result.append(f"  {norm.metadaten.enbez:15} {title[:50]}")
@@ -11,6 +11,9 @@ Key features:
 """
 
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 from fastmcp import FastMCP
 
@@ -26,14 +29,22 @@ logger = logging.getLogger(__name__)
 # Initialize MCP server
 mcp = FastMCP("German Law Documents")
 
-# Cache for LawSearch instances (lazy loading for performance)
-_search_cache: dict[str, LawSearch] = {}
+# Maximum number of laws kept in _search_cache
+SEARCH_CACHE_SIZE = 32
+
+# Cache for LawSearch instances (lazy loading for performance), least
+# recently used first - each instance keeps a whole parsed law in memory
+_search_cache: OrderedDict[str, LawSearch] = OrderedDict()
+_search_cache_lock = threading.Lock()
 
 
 def _get_search(law_code: str) -> LawSearch | None:
     """
     Get a LawSearch instance with caching and auto-download.
 
+    Keeps the SEARCH_CACHE_SIZE most recently used laws. Laws that could
+    not be loaded are not cached, so they are retried on the next call.
+
     Args:
         law_code: Law code (e.g., 'HGB', 'KSTG')
 
@@ -43,8 +54,11 @@ def _get_search(law_code: str) -> LawSearch | None:
     law_upper = law_code.upper()
 
     # Return from cache if available
-    if law_upper in _search_cache:
-        return _search_cache[law_upper]
+    with _search_cache_lock:
+        cached = _search_cache.get(law_upper)
+        if cached is not None:
+            _search_cache.move_to_end(law_upper)
+            return cached
 
     # Load law document with auto-download
     dokumente = get_law(law_code, auto_download=True)
@@ -53,15 +67,47 @@ def _get_search(law_code: str) -> LawSearch | None:
         return None
 
     # Get law code from jurabk
-    law_key = dokumente.get_jurabk()[0] if dokumente.get_jurabk() else law_upper
+    jurabk = dokumente.get_jurabk()
+    law_key = jurabk[0] if jurabk else law_upper
 
-    # Create and cache LawSearch instance
+    # Create and cache LawSearch instance, evicting the least recently used
     search = LawSearch(dokumente, law_key)
-    _search_cache[law_upper] = search
+    with _search_cache_lock:
+        _search_cache[law_upper] = search
+        _search_cache.move_to_end(law_upper)
+        while len(_search_cache) > SEARCH_CACHE_SIZE:
+            _search_cache.popitem(last=False)
 
     return search
 
 
+def prewarm(law_codes: list[str], max_workers: int = 8) -> list[str]:
+    """
+    Load several laws into the search cache in parallel.
+
+    Downloads and file reads overlap in worker threads, so warming up N
+    laws takes about as long as the slowest one instead of the sum.
+    The search cache is guarded by a lock, and laws added to
+    law_mapping.json by parallel downloads are merged.
+
+    Args:
+        law_codes: Law codes to load (e.g., ['HGB', 'KSTG'])
+        max_workers: Maximum number of worker threads
+
+    Returns:
+        Law codes that could not be loaded
+    """
+    # Each law once, in the given order
+    codes = list(dict.fromkeys(code.upper() for code in law_codes))
+    if not codes:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(codes))) as executor:
+        searches = list(executor.map(_get_search, codes))
+
+    return [code for code, search in zip(codes, searches) if search is None]
+
+
 @mcp.tool()
 def list_laws() -> dict[str, int | list[dict[str, str]]]:
     """
@@ -139,38 +185,44 @@ def get_law_reference(reference: str) -> str:
 
 @mcp.tool()
 def search_law(
-    law: str, search_term: str, max_results: int = 5
-) -> dict[str, str | int | list[SearchResult]]:
+    law: str, search_term: str | list[str], max_results: int = 5
+) -> dict[str, str | int | list[str] | list[SearchResult]]:
     """
     Search for a term within a specific law.
 
     Args:
         law: Law code (e.g., 'HGB', 'BGB', 'KSTG')
-        search_term: Text to search for (case-insensitive)
+        search_term: Text to search for (case-insensitive), or a list of texts
+            to find paragraphs containing any of them in a single pass
         max_results: Maximum number of results (default: 5)
 
     Returns:
-        Dictionary with search results
+        Dictionary with search results. total_matches is the exact count, or
+        ">max_results" if the search stopped early.
 
     Examples:
         >>> search_law('HGB', 'Handelsregister', max_results=3)
-        {'law': 'HGB', 'term': 'Handelsregister', 'found': 3,
+        {'law': 'HGB', 'term': 'Handelsregister', 'found': 3, 'total_matches': '>3',
          'results': [{'paragraph': '§ 2', 'title': '...', 'context': '...'}, ...]}
     """
     search = _get_search(law)
     if not search:
         return {"error": f"Law '{law}' not found"}
 
-    results = search.search_term(search_term, case_sensitive=False)
-
-    # Limit results
-    limited_results = results[:max_results]
+    # One extra result tells whether there are more matches than shown
+    limit = max(max_results, 0)
+    if isinstance(search_term, str):
+        results = search.search_term(search_term, limit=limit + 1)
+    else:
+        results = search.search_terms(search_term, limit=limit + 1)
+    limited_results = results[:limit]
+    truncated = len(results) > limit
 
     return {
         "law": law.upper(),
         "term": search_term,
         "found": len(limited_results),
-        "total_matches": len(results),
+        "total_matches": f">{limit}" if truncated else len(results),
         "results": limited_results,
     }
 
@@ -8,16 +8,29 @@ Provides common functionality for:
 - Law download and extraction
 """
 
+import bisect
+import contextlib
+import email.utils
+import functools
+import http.client
+import importlib
+import io
 import json
 import logging
+import os
 import re
+import shutil
 import sys
 import tempfile
+import threading
+import urllib.error
+import urllib.parse
 import urllib.request
 import xml.etree.ElementTree as ET
 import zipfile
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from types import ModuleType
+from typing import IO, TYPE_CHECKING, BinaryIO, Iterator, Literal, Optional, cast
 
 # Conditional import for type hints
 if sys.version_info >= (3, 11):
@@ -30,11 +43,67 @@ from .models import LawReference, Norm, P
 if TYPE_CHECKING:
     from .models import Dokumente
 
+lxml_etree: Optional[ModuleType]
+try:
+    # Optional: libxml2-based parser, noticeably faster on large laws
+    lxml_etree = importlib.import_module("lxml.etree")
+except ImportError:  # pragma: no cover - depends on installed extras
+    lxml_etree = None
+
+orjson: Optional[ModuleType]
+try:
+    # Optional: faster JSON encoding/decoding of law_mapping.json
+    orjson = importlib.import_module("orjson")
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # Constants
 GII_TOC_URL = "https://www.gesetze-im-internet.de/gii-toc.xml"
 
+# Chunk size for streaming downloads and file copies
+COPY_BUFFER_SIZE = 64 * 1024
+
+# Law ZIPs up to this size are downloaded into memory instead of a temp file
+MAX_IN_MEMORY_ZIP_SIZE = 32 * 1024 * 1024
+
+# Raw regex groups of a law reference: law, paragraph, section, number, letter, sentence
+_ReferenceGroups = tuple[
+    Optional[str], str, Optional[str], Optional[str], Optional[str], Optional[str]
+]
+
+# Pattern to match various reference formats
+# Matches: Optional law code, § or Artikel/Art., paragraph number, optional Absatz, Nummer, Buchstabe, Satz
+_REFERENCE_RE = re.compile(
+    r"""
+    (?:([A-ZÄÖÜ][A-Za-zäöüß]*[A-ZÄÖÜ]|[A-ZÄÖÜ]{2,})\s+)?  # Optional law code (e.g., BGB, GmbHG, KStG, AAÜG)
+    (?:§|Artikel|Art\.?)\s*                  # Paragraph marker
+    (\d+[a-z]?)                               # Paragraph number (e.g., 52, 8b)
+    (?:\s+(?:Absatz|Abs\.?)\s+(\d+))?         # Optional section (Absatz)
+    (?:\s+(?:Nummer|Nr\.?)\s+(\d+))?          # Optional number (Nummer)
+    (?:\s+Buchstabe[n]?\s+([a-z]))?           # Optional letter (Buchstabe/Buchstaben)
+    (?:\s+Satz\s+(\d+))?                      # Optional sentence (Satz)
+    """,
+    re.VERBOSE | re.IGNORECASE,
+)
+
+# Shape of a law code as written in law texts: starts and ends uppercase
+# (e.g., BGB, GmbHG, KStG). The reference pattern is case-insensitive, so
+# other candidates are only accepted if they are known law codes.
+_LAW_CODE_SHAPE_RE = re.compile(r"[A-ZÄÖÜ][A-Za-zäöüß]*[A-ZÄÖÜ]")
+
+# Legal categories and their title patterns, checked in this order
+_CATEGORY_PATTERNS = [
+    (category, re.compile(pattern, re.IGNORECASE))
+    for category, pattern in (
+        ("Abkommen", r"(abkommen|übereinkommen|konvention|vertrag)\b"),
+        ("Verordnung", r"verordnung\b"),
+        ("Bekanntmachung", r"bekanntmachung\b"),
+        ("Gesetz", r"(gesetz|gesetzbuch)\b"),
+    )
+]
+
 
 # ============================================================================
 # Law Reference Parser
@@ -70,35 +139,130 @@ def parse_law_reference(reference: str) -> LawReference | None:
         >>> parse_law_reference("§ 10 Absatz 1 Nummer 4 Buchstabe a")
         {'law': None, 'paragraph': '10', 'section': '1', 'number': '4', 'letter': 'a', 'sentence': None}
     """
-    # Pattern to match various reference formats
-    # Matches: Optional law code, § or Artikel/Art., paragraph number, optional Absatz, Nummer, Buchstabe, Satz
-    pattern = r"""
-        (?:([A-ZÄÖÜ][A-Za-zäöüß]*[A-ZÄÖÜ]|[A-ZÄÖÜ]{2,})\s+)?  # Optional law code (e.g., BGB, GmbHG, KStG, AAÜG)
-        (?:§|Artikel|Art\.?)\s*                  # Paragraph marker
-        (\d+[a-z]?)                               # Paragraph number (e.g., 52, 8b)
-        (?:\s+(?:Absatz|Abs\.?)\s+(\d+))?         # Optional section (Absatz)
-        (?:\s+(?:Nummer|Nr\.?)\s+(\d+))?          # Optional number (Nummer)
-        (?:\s+Buchstabe[n]?\s+([a-z]))?           # Optional letter (Buchstabe/Buchstaben)
-        (?:\s+Satz\s+(\d+))?                      # Optional sentence (Satz)
+    groups = _match_law_reference(reference)
+
+    if groups is None:
+        return None
+
+    return _reference_from_groups(groups)
+
+
+def iter_law_references(text: str) -> Iterator[LawReference]:
     """
+    Find all law references in a text in a single pass.
 
-    match = re.search(pattern, reference, re.VERBOSE | re.IGNORECASE)
+    Args:
+        text: Text that may contain several law references
 
-    if not match:
-        return None
+    Returns:
+        Iterator of parsed references in text order
+
+    Examples:
+        >>> [r["paragraph"] for r in iter_law_references("§ 1 und § 2 Absatz 3")]
+        ['1', '2']
+    """
+    for match in _REFERENCE_RE.finditer(text):
+        groups = _validate_law_code(cast(_ReferenceGroups, match.groups()))
+        yield _reference_from_groups(groups)
 
+
+def _reference_from_groups(groups: _ReferenceGroups) -> LawReference:
+    """
+    Build a new reference dict from raw regex groups.
+
+    Args:
+        groups: Tuple of (law, paragraph, section, number, letter, sentence)
+
+    Returns:
+        Parsed reference, empty parts as None
+    """
+    law, paragraph, section, number, letter, sentence = groups
     result: LawReference = {
-        "law": match.group(1) if match.group(1) else None,
-        "paragraph": match.group(2),
-        "section": match.group(3) if match.group(3) else None,
-        "number": match.group(4) if match.group(4) else None,
-        "letter": match.group(5) if match.group(5) else None,
-        "sentence": match.group(6) if match.group(6) else None,
+        "law": law or None,
+        "paragraph": paragraph,
+        "section": section or None,
+        "number": number or None,
+        "letter": letter or None,
+        "sentence": sentence or None,
     }
 
     return result
 
 
+@functools.lru_cache(maxsize=4096)
+def _match_law_reference(reference: str) -> Optional[_ReferenceGroups]:
+    """
+    Match a law reference string and return the raw regex groups.
+
+    Cached separately from parse_law_reference so repeated references skip
+    the regex search, while every caller still gets its own result dict.
+
+    Args:
+        reference: Law reference string
+
+    Returns:
+        Tuple of (law, paragraph, section, number, letter, sentence) or None
+    """
+    match = _REFERENCE_RE.search(reference)
+
+    if not match:
+        return None
+
+    return _validate_law_code(cast(_ReferenceGroups, match.groups()))
+
+
+def _validate_law_code(groups: _ReferenceGroups) -> _ReferenceGroups:
+    """
+    Drop a law code candidate that is just a word before the paragraph marker.
+
+    With re.IGNORECASE, words like "Siehe" in "Siehe § 1" fit the law code
+    group. Candidates are kept if they have the shape of a law code or are
+    known law codes in any case (e.g., "bgb").
+
+    Args:
+        groups: Raw regex groups of a law reference
+
+    Returns:
+        The groups, with the law code set to None if it was rejected
+    """
+    law = groups[0]
+    if (
+        law is None
+        or _LAW_CODE_SHAPE_RE.fullmatch(law)
+        or law.upper() in _known_law_codes()
+    ):
+        return groups
+    return (None,) + groups[1:]
+
+
+@functools.cache
+def _known_law_codes() -> frozenset[str]:
+    """
+    Uppercased law codes from the law_mapping.json shipped with the package.
+
+    Loaded on first use instead of at import time. Keys with a year (e.g.,
+    "KStG 1977") also contribute their first word.
+
+    Returns:
+        Set of uppercased law codes (empty if the file is missing)
+    """
+    mapping_file = (Path(__file__).parent / "law_mapping.json").resolve()
+    try:
+        mapping = _read_law_mapping(mapping_file, mapping_file.stat().st_mtime_ns)
+    except (OSError, ValueError) as e:
+        logger.warning("Could not load known law codes: %s", e)
+        return frozenset()
+
+    codes = set()
+    for key in mapping:
+        key_upper = key.upper()
+        codes.add(key_upper)
+        words = key_upper.split(maxsplit=1)
+        if words:
+            codes.add(words[0])
+    return frozenset(codes)
+
+
 class LawMapping(TypedDict):
     """Law mapping entry structure."""
 
@@ -141,6 +305,22 @@ def load_law_mapping(base_path: Optional[Path] = None) -> dict[str, LawMapping]:
     Returns:
         Dictionary mapping law codes (jurabk) to law info
     """
+    return _load_law_mapping(base_path)[0]
+
+
+def _load_law_mapping(
+    base_path: Optional[Path],
+) -> tuple[dict[str, LawMapping], Optional[tuple[Path, int]]]:
+    """
+    Load law mapping and tell which file version it was read from.
+
+    Args:
+        base_path: Base directory containing law_mapping.json (default: ~/.gesetzessuche)
+
+    Returns:
+        Tuple of (mapping, (absolute path, mtime_ns) of law_mapping.json or
+        None if no file was read)
+    """
     if base_path is None:
         # Use user's home directory for data storage
         base_path = Path.home() / ".gesetzessuche"
@@ -151,28 +331,73 @@ def load_law_mapping(base_path: Optional[Path] = None) -> dict[str, LawMapping]:
         if not mapping_file.exists():
             package_mapping = Path(__file__).parent / "law_mapping.json"
             if package_mapping.exists():
-                import shutil
-
                 shutil.copy2(package_mapping, mapping_file)
-                logger.info(f"Initialized law_mapping.json in {base_path}")
+                logger.info("Initialized law_mapping.json in %s", base_path)
             else:
-                logger.warning(f"Law mapping file not found: {mapping_file}")
-                return {}
+                logger.warning("Law mapping file not found: %s", mapping_file)
+                return {}, None
     else:
         mapping_file = base_path / "law_mapping.json"
 
     if not mapping_file.exists():
-        logger.warning(f"Law mapping file not found: {mapping_file}")
-        return {}
+        logger.warning("Law mapping file not found: %s", mapping_file)
+        return {}, None
 
     try:
-        with open(mapping_file, encoding="utf-8") as f:
-            mapping: dict[str, LawMapping] = json.load(f)
-        logger.debug(f"Loaded {len(mapping)} laws from {mapping_file}")
-        return mapping
+        mapping_file = mapping_file.resolve()
+        mtime_ns = mapping_file.stat().st_mtime_ns
+        # Shallow copy - callers add entries before saving the mapping
+        mapping = dict(_read_law_mapping(mapping_file, mtime_ns))
+        logger.debug("Loaded %s laws from %s", len(mapping), mapping_file)
+        return mapping, (mapping_file, mtime_ns)
     except Exception as e:
-        logger.error(f"Error loading law_mapping.json: {e}")
-        return {}
+        logger.error("Error loading law_mapping.json: %s", e)
+        return {}, None
+
+
+@functools.lru_cache(maxsize=4)
+def _read_law_mapping(mapping_file: Path, mtime_ns: int) -> dict[str, LawMapping]:
+    """
+    Read and decode law_mapping.json (cached per file and modification time).
+
+    Args:
+        mapping_file: Absolute path to law_mapping.json
+        mtime_ns: Modification time, part of the cache key so that changed
+            files are read again
+
+    Returns:
+        Dictionary mapping law codes (jurabk) to law info (do not modify)
+    """
+    mapping: dict[str, LawMapping]
+    if orjson is not None:
+        mapping = orjson.loads(mapping_file.read_bytes())
+    else:
+        with open(mapping_file, encoding="utf-8") as f:
+            mapping = json.load(f)
+    return mapping
+
+
+@functools.lru_cache(maxsize=4)
+def _read_mapping_lookup(mapping_file: Path, mtime_ns: int) -> "_MappingLookup":
+    """
+    Index the keys of law_mapping.json (cached per file and modification time).
+
+    Args:
+        mapping_file: Absolute path to law_mapping.json
+        mtime_ns: Modification time of the file
+
+    Returns:
+        Lookup tables of the mapping keys
+    """
+    return _MappingLookup(tuple(_read_law_mapping(mapping_file, mtime_ns)))
+
+
+def clear_caches() -> None:
+    """Drop the cached law mapping and TOC index, e.g. after writing them."""
+    _read_law_mapping.cache_clear()
+    _read_mapping_lookup.cache_clear()
+    _read_toc_index.cache_clear()
+    _read_toc_lookup.cache_clear()
 
 
 def save_law_mapping(
@@ -193,15 +418,56 @@ def save_law_mapping(
         base_path.mkdir(exist_ok=True)
 
     mapping_file = base_path / "law_mapping.json"
+    tmp_file = mapping_file.with_name(mapping_file.name + ".tmp")
+
+    # Threads share the temporary file name - write one mapping at a time
+    with _mapping_lock:
+        try:
+            # Encode in one go, then replace the old file at once - a crash
+            # mid-write never leaves a truncated mapping behind
+            if orjson is not None:
+                # Same layout as the json module output below
+                data = orjson.dumps(
+                    mapping, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+                )
+            else:
+                data = json.dumps(
+                    mapping, ensure_ascii=False, indent=2, sort_keys=True
+                ).encode("utf-8")
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, mapping_file)
+            clear_caches()
+            logger.info("Saved mapping with %s laws to %s", len(mapping), mapping_file)
+            return True
+        except Exception as e:
+            logger.error("Error saving law_mapping.json: %s", e)
+            tmp_file.unlink(missing_ok=True)
+            return False
+
+
+def _add_law_to_mapping(jurabk: str, entry: LawMapping, base_path: Path) -> bool:
+    """
+    Add a single law to law_mapping.json.
 
-    try:
-        with open(mapping_file, "w", encoding="utf-8") as f:
-            json.dump(mapping, f, ensure_ascii=False, indent=2, sort_keys=True)
-        logger.info(f"Saved mapping with {len(mapping)} laws to {mapping_file}")
-        return True
-    except Exception as e:
-        logger.error(f"Error saving law_mapping.json: {e}")
-        return False
+    Reloads the mapping under the lock, so laws added by other threads in
+    the meantime (e.g., parallel get_law downloads) are kept.
+
+    Args:
+        jurabk: Law code to add
+        entry: Mapping entry of the law
+        base_path: Base directory containing law_mapping.json
+
+    Returns:
+        True if successful, False otherwise
+    """
+    with _mapping_lock:
+        mapping = load_law_mapping(base_path)
+        mapping[jurabk] = entry
+        return save_law_mapping(mapping, base_path)
+
+
+# Serializes writes of law_mapping.json within this process
+_mapping_lock = threading.RLock()
 
 
 def find_law_in_mapping(law_code: str, mapping: dict[str, LawMapping]) -> Optional[str]:
@@ -219,26 +485,95 @@ def find_law_in_mapping(law_code: str, mapping: dict[str, LawMapping]) -> Option
     if law_code in mapping:
         return law_code
 
-    # Try case-insensitive exact match
+    # Single pass: a case-insensitive exact match wins right away, otherwise
+    # the first key with a delimited prefix, then the first key with a prefix
     law_upper = law_code.upper()
-    for key in mapping:
-        if key.upper() == law_upper:
-            return key
-
-    # Try match at start of key with delimiter (e.g., "KStG" matches "KStG 1977")
+    delimited = (law_upper + " ", law_upper + "_")
+    delimited_match: Optional[str] = None
+    prefix_match: Optional[str] = None
     for key in mapping:
         key_upper = key.upper()
-        if key_upper.startswith(law_upper + " ") or key_upper.startswith(
-            law_upper + "_"
-        ):
+        if key_upper == law_upper:
             return key
-
-    # Fallback: word boundary match (only at start)
-    for key in mapping:
-        if key.upper().startswith(law_upper):
+        if delimited_match is None and key_upper.startswith(delimited):
+            delimited_match = key
+        elif prefix_match is None and key_upper.startswith(law_upper):
+            prefix_match = key
+
+    return delimited_match if delimited_match is not None else prefix_match
+
+
+class _MappingLookup:
+    """Uppercased views of the law mapping keys, matching like find_law_in_mapping."""
+
+    def __init__(self, keys: tuple[str, ...]) -> None:
+        self.keys = keys
+        uppers = [key.upper() for key in keys]
+        # Uppercased key -> first key in mapping order
+        self.by_upper: dict[str, str] = {}
+        for upper, key in zip(uppers, keys):
+            self.by_upper.setdefault(upper, key)
+        # (uppercased key, mapping position), sorted for prefix searches
+        self.sorted_uppers = sorted(zip(uppers, range(len(uppers))))
+
+    def match(self, law_code: str) -> Optional[str]:
+        """
+        Find a law code in the keys (case-insensitive, then by prefix).
+
+        Args:
+            law_code: Law code to search for
+
+        Returns:
+            First matching key in mapping order or None
+        """
+        law_upper = law_code.upper()
+
+        # Try case-insensitive exact match
+        key = self.by_upper.get(law_upper)
+        if key is not None:
             return key
 
-    return None
+        # Try match at start of key with delimiter (e.g., "KStG" matches "KStG 1977")
+        positions = [
+            position
+            for position in (
+                _first_with_prefix(self.sorted_uppers, law_upper + " "),
+                _first_with_prefix(self.sorted_uppers, law_upper + "_"),
+            )
+            if position is not None
+        ]
+        if positions:
+            return self.keys[min(positions)]
+
+        # Fallback: word boundary match (only at start)
+        position = _first_with_prefix(self.sorted_uppers, law_upper)
+        if position is not None:
+            return self.keys[position]
+
+        return None
+
+
+def _first_with_prefix(
+    sorted_items: list[tuple[str, int]], prefix: str
+) -> Optional[int]:
+    """
+    Find the lowest position among sorted (text, position) pairs by prefix.
+
+    Args:
+        sorted_items: (text, original position) pairs, sorted by text
+        prefix: Prefix the text has to start with
+
+    Returns:
+        Smallest original position of a matching text or None
+    """
+    first: Optional[int] = None
+    pos = bisect.bisect_left(sorted_items, (prefix, -1))
+    while pos < len(sorted_items) and sorted_items[pos][0].startswith(prefix):
+        position = sorted_items[pos][1]
+        if first is None or position < first:
+            first = position
+        pos += 1
+    return first
 
 
 # ============================================================================
@@ -250,6 +585,8 @@ def extract_text_from_p(p: P) -> str:
     """
     Extract clean text from a P (paragraph) element.
 
+    The reconstructed text is cached on the element (models are immutable).
+
     Args:
         p: P element from XML
 
@@ -259,21 +596,33 @@ def extract_text_from_p(p: P) -> str:
     if p.raw_text:
         return p.raw_text
 
+    cached = p._extracted_text
+    if cached is not None:
+        return cached
+
     # Fallback: reconstruct from content
-    parts = []
+    parts: list[str] = []
+    append = parts.append
     for elem in p.content:
         if isinstance(elem, str):
-            parts.append(elem)
-        elif hasattr(elem, "text") and elem.text:
-            parts.append(elem.text)
+            append(elem)
+        else:
+            # Single attribute probe instead of hasattr + access
+            elem_text = getattr(elem, "text", None)
+            if elem_text:
+                append(elem_text)
 
-    return " ".join(parts).strip()
+    text = " ".join(parts).strip()
+    p._extracted_text = text
+    return text
 
 
 def extract_text_from_norm(norm: Norm) -> str:
     """
     Extract full text content from a norm.
 
+    The reconstructed text is cached on the norm (models are immutable).
+
     Args:
         norm: Norm object
 
@@ -291,17 +640,26 @@ def extract_text_from_norm(norm: Norm) -> str:
     if text_content.content.raw_text:
         return text_content.content.raw_text
 
+    cached = norm._extracted_text
+    if cached is not None:
+        return cached
+
     # Otherwise reconstruct from content elements
-    parts = []
+    parts: list[str] = []
+    append = parts.append
     for item in text_content.content.elements:
         if isinstance(item, str):
-            parts.append(item)
+            append(item)
         elif isinstance(item, P):
-            parts.append(extract_text_from_p(item))
-        elif hasattr(item, "raw_text") and item.raw_text:
-            parts.append(item.raw_text)
+            append(extract_text_from_p(item))
+        else:
+            item_text = getattr(item, "raw_text", None)
+            if item_text:
+                append(item_text)
 
-    return "\n".join(parts)
+    text = "\n".join(parts)
+    norm._extracted_text = text
+    return text
 
 
 # ============================================================================
@@ -313,25 +671,70 @@ def download_toc(base_path: Optional[Path] = None) -> bool:
     """
     Download gii-toc.xml from gesetze-im-internet.de.
 
+    An existing copy is only replaced if the server has a newer one
+    (If-Modified-Since / ETag, the ETag is kept in gii-toc.xml.etag).
+
     Args:
         base_path: Base directory to save gii-toc.xml (default: project root)
 
     Returns:
-        True if successful, False otherwise
+        True if successful or already up to date, False otherwise
     """
     if base_path is None:
         base_path = Path(__file__).parent.parent
 
     toc_path = base_path / "gii-toc.xml"
+    etag_path = toc_path.with_name(toc_path.name + ".etag")
+    tmp_path = toc_path.with_name(toc_path.name + ".tmp")
+
+    # Conditional GET - the server answers 304 if our copy is still current
+    headers = {}
+    if toc_path.exists():
+        headers["If-Modified-Since"] = email.utils.formatdate(
+            toc_path.stat().st_mtime, usegmt=True
+        )
+        if etag_path.exists():
+            headers["If-None-Match"] = etag_path.read_text(encoding="utf-8").strip()
 
     try:
-        logger.info(f"Downloading gii-toc.xml from {GII_TOC_URL}")
-        urllib.request.urlretrieve(GII_TOC_URL, toc_path)
-        logger.info(f"Successfully downloaded gii-toc.xml to {toc_path}")
+        logger.info("Downloading gii-toc.xml from %s", GII_TOC_URL)
+        request = urllib.request.Request(GII_TOC_URL, headers=headers)
+        with urllib.request.urlopen(request) as response:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            # Stream into a temporary file, then replace the old copy at once
+            with open(tmp_path, "wb") as f:
+                shutil.copyfileobj(response, f, COPY_BUFFER_SIZE)
+
+        if last_modified:
+            # Keep the server's timestamp for the next If-Modified-Since
+            try:
+                modified = email.utils.parsedate_to_datetime(last_modified)
+                timestamp = modified.timestamp()
+                os.utime(tmp_path, (timestamp, timestamp))
+            except (TypeError, ValueError):
+                logger.warning("Ignoring invalid Last-Modified: %s", last_modified)
+        os.replace(tmp_path, toc_path)
+
+        if etag:
+            etag_path.write_text(etag, encoding="utf-8")
+        else:
+            etag_path.unlink(missing_ok=True)
+
+        clear_caches()
+        logger.info("Successfully downloaded gii-toc.xml to %s", toc_path)
         return True
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            logger.info("gii-toc.xml is up to date")
+            return True
+        logger.error("Error downloading gii-toc.xml: %s", e)
+        return False
     except Exception as e:
-        logger.error(f"Error downloading gii-toc.xml: {e}")
+        logger.error("Error downloading gii-toc.xml: %s", e)
         return False
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
 
 def extract_category_from_title(title: str) -> str:
@@ -346,15 +749,8 @@ def extract_category_from_title(title: str) -> str:
     Returns:
         Category string or "Sonstiges" if no category found
     """
-    categories = [
-        ("Abkommen", r"(abkommen|übereinkommen|konvention|vertrag)\b"),
-        ("Verordnung", r"verordnung\b"),
-        ("Bekanntmachung", r"bekanntmachung\b"),
-        ("Gesetz", r"(gesetz|gesetzbuch)\b"),
-    ]
-
-    for category, pattern in categories:
-        if re.search(pattern, title, re.IGNORECASE):
+    for category, pattern in _CATEGORY_PATTERNS:
+        if pattern.search(title):
             return category
 
     return "Sonstiges"
@@ -369,7 +765,23 @@ def load_toc_index(base_path: Optional[Path] = None) -> dict[str, TOCEntry]:
         base_path: Base directory containing gii-toc.xml (default: project root)
 
     Returns:
-        Dictionary mapping title to TOC entry
+        Dictionary mapping title to TOC entry (shared between calls, do not modify)
+    """
+    return _load_toc_index(base_path)[0]
+
+
+def _load_toc_index(
+    base_path: Optional[Path],
+) -> tuple[dict[str, TOCEntry], Optional[tuple[Path, int]]]:
+    """
+    Load the TOC index and tell which file version it was parsed from.
+
+    Args:
+        base_path: Base directory containing gii-toc.xml (default: project root)
+
+    Returns:
+        Tuple of (TOC index, (absolute path, mtime_ns) of gii-toc.xml or None
+        if no file was parsed)
     """
     if base_path is None:
         base_path = Path(__file__).parent.parent
@@ -380,45 +792,78 @@ def load_toc_index(base_path: Optional[Path] = None) -> dict[str, TOCEntry]:
     if not toc_path.exists():
         logger.info("gii-toc.xml not found, downloading...")
         if not download_toc(base_path):
-            return {}
+            return {}, None
 
     try:
-        tree = ET.parse(toc_path)
-        root = tree.getroot()
-
-        index: dict[str, TOCEntry] = {}
-        for item in root.findall("item"):
-            title_elem = item.find("title")
-            link_elem = item.find("link")
-
-            if (
-                title_elem is not None
-                and link_elem is not None
-                and title_elem.text
-                and link_elem.text
-            ):
-                title = title_elem.text
-                url = link_elem.text
+        toc_path = toc_path.resolve()
+        mtime_ns = toc_path.stat().st_mtime_ns
+        return _read_toc_index(toc_path, mtime_ns), (toc_path, mtime_ns)
+
+    except Exception as e:
+        logger.error("Error parsing gii-toc.xml: %s", e)
+        return {}, None
 
-                # Extract url_path (e.g., "hgb" from "https://www.gesetze-im-internet.de/hgb/xml.zip")
-                url_path = url.split("/")[-2] if "/" in url else ""
 
-                # Extract category from title
-                category = extract_category_from_title(title)
+@functools.lru_cache(maxsize=4)
+def _read_toc_index(toc_path: Path, mtime_ns: int) -> dict[str, TOCEntry]:
+    """
+    Parse gii-toc.xml into a TOC index (cached per file and modification time).
 
-                index[title] = {
-                    "title": title,
-                    "url": url,
-                    "url_path": url_path,
-                    "category": category,
-                }
+    Args:
+        toc_path: Absolute path to gii-toc.xml
+        mtime_ns: Modification time, part of the cache key so that changed
+            files are parsed again
 
-        logger.info(f"Loaded {len(index)} laws from gii-toc.xml")
-        return index
+    Returns:
+        Dictionary mapping title to TOC entry (do not modify)
+    """
+    index: dict[str, TOCEntry] = {}
+    depth = 0
+    root: Optional[ET.Element] = None
+    # Stream the items instead of building the whole tree first
+    for event, item in ET.iterparse(toc_path, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = item
+            depth += 1
+            continue
+
+        depth -= 1
+        # Only direct children of the root element, like root.findall("item")
+        if depth != 1 or root is None:
+            continue
+
+        title_elem = item.find("title")
+        link_elem = item.find("link")
+
+        if (
+            item.tag == "item"
+            and title_elem is not None
+            and link_elem is not None
+            and title_elem.text
+            and link_elem.text
+        ):
+            title = title_elem.text
+            url = link_elem.text
 
-    except Exception as e:
-        logger.error(f"Error parsing gii-toc.xml: {e}")
-        return {}
+            # Extract url_path (e.g., "hgb" from "https://www.gesetze-im-internet.de/hgb/xml.zip")
+            url_path = url.split("/")[-2] if "/" in url else ""
+
+            # Extract category from title
+            category = extract_category_from_title(title)
+
+            index[title] = {
+                "title": title,
+                "url": url,
+                "url_path": url_path,
+                "category": category,
+            }
+
+        # Free the processed subtree
+        root.remove(item)
+
+    logger.info("Loaded %s laws from gii-toc.xml", len(index))
+    return index
 
 
 def find_law_in_toc(
@@ -435,36 +880,191 @@ def find_law_in_toc(
         TOC entry or None if not found
     """
     law_lower = law_code.lower()
+    law_upper = law_code.upper()
+    prefix = law_lower + "_"
 
-    # Try exact match in URL path first (most reliable)
+    # Single pass: an exact url_path match wins right away, otherwise the
+    # first url_path prefix match, partial url_path match, then title match
+    prefix_match: Optional[TOCEntry] = None
+    partial_match: Optional[TOCEntry] = None
+    title_match: Optional[TOCEntry] = None
     for title, entry in toc_index.items():
-        if entry["url_path"].lower() == law_lower:
+        url_path = entry["url_path"].lower()
+        if url_path == law_lower:
             return entry
+        if prefix_match is None and url_path.startswith(prefix):
+            prefix_match = entry
+        elif partial_match is None and law_lower in url_path:
+            partial_match = entry
+        elif title_match is None and law_upper in title.upper():
+            title_match = entry
 
-    # Try exact match at start of URL path
-    for title, entry in toc_index.items():
-        if entry["url_path"].lower().startswith(law_lower + "_"):
-            return entry
+    return prefix_match or partial_match or title_match
 
-    # Try partial match in URL path
-    for title, entry in toc_index.items():
-        if law_lower in entry["url_path"].lower():
-            return entry
 
-    # Finally try matching in title
-    law_upper = law_code.upper()
-    for title, entry in toc_index.items():
-        if law_upper in title.upper():
+def _find_law_in_toc_file(law_code: str, base_path: Path) -> Optional[TOCEntry]:
+    """
+    Find a law in gii-toc.xml, with lookup tables cached per file version.
+
+    Args:
+        law_code: Law code to search for (e.g., "HGB", "KSTG")
+        base_path: Base directory containing gii-toc.xml
+
+    Returns:
+        TOC entry or None if not found (same as find_law_in_toc)
+    """
+    toc_index, source = _load_toc_index(base_path)
+    if source is None:
+        return find_law_in_toc(law_code, toc_index)
+    return _read_toc_lookup(*source).find(law_code)
+
+
+@functools.lru_cache(maxsize=4)
+def _read_toc_lookup(toc_path: Path, mtime_ns: int) -> "_TOCLookup":
+    """
+    Build the lookup tables of gii-toc.xml (cached per file and modification time).
+
+    Args:
+        toc_path: Absolute path to gii-toc.xml
+        mtime_ns: Modification time of the file
+
+    Returns:
+        Lookup tables of the TOC index
+    """
+    return _TOCLookup(_read_toc_index(toc_path, mtime_ns))
+
+
+class _TOCLookup:
+    """Pre-normalized views of a TOC index, matching like find_law_in_toc."""
+
+    def __init__(self, toc_index: dict[str, TOCEntry]) -> None:
+        # Entries with lowercased url_path and uppercased title, in TOC order
+        self.entries = list(toc_index.values())
+        self.paths = [entry["url_path"].lower() for entry in self.entries]
+        self.titles = [title.upper() for title in toc_index]
+        # Lowercased url_path -> first entry with that path
+        self.by_path: dict[str, TOCEntry] = {}
+        for path, entry in zip(self.paths, self.entries):
+            self.by_path.setdefault(path, entry)
+        # (lowercased url_path, TOC position), sorted for prefix searches
+        self.sorted_paths = sorted(zip(self.paths, range(len(self.paths))))
+        # NUL-separated blobs for substring searches in one str.find call
+        # (XML text never contains NUL, so a match can't span two entries)
+        self.paths_blob, self.path_starts = _join_with_offsets(self.paths)
+        self.titles_blob, self.title_starts = _join_with_offsets(self.titles)
+        # Law code -> result of match(), filled by find()
+        self.results: dict[str, Optional[TOCEntry]] = {}
+        self.results_lock = threading.Lock()
+
+    def find(self, law_code: str) -> Optional[TOCEntry]:
+        """
+        Find a law code in the TOC, remembering the result.
+
+        Args:
+            law_code: Law code to search for
+
+        Returns:
+            First matching TOC entry in TOC order or None
+        """
+        with self.results_lock:
+            if law_code in self.results:
+                return self.results[law_code]
+
+        entry = self.match(law_code)
+        with self.results_lock:
+            if len(self.results) >= _TOC_RESULT_CACHE_SIZE:
+                self.results.clear()
+            self.results[law_code] = entry
+        return entry
+
+    def match(self, law_code: str) -> Optional[TOCEntry]:
+        """
+        Find a law code in the TOC (exact, prefix, partial url_path, title).
+
+        Args:
+            law_code: Law code to search for
+
+        Returns:
+            First matching TOC entry in TOC order or None
+        """
+        law_lower = law_code.lower()
+
+        # Try exact match in URL path first (most reliable)
+        entry = self.by_path.get(law_lower)
+        if entry is not None:
             return entry
 
-    return None
+        # Try exact match at start of URL path - first one in TOC order
+        first = _first_with_prefix(self.sorted_paths, law_lower + "_")
+        if first is not None:
+            return self.entries[first]
+
+        if not self.entries or "\0" in law_code:
+            return None
+
+        # Try partial match in URL path
+        idx = self.paths_blob.find(law_lower)
+        if idx >= 0:
+            return self.entries[bisect.bisect_right(self.path_starts, idx) - 1]
+
+        # Finally try matching in title
+        idx = self.titles_blob.find(law_code.upper())
+        if idx >= 0:
+            return self.entries[bisect.bisect_right(self.title_starts, idx) - 1]
+
+        return None
 
 
+def _join_with_offsets(parts: list[str]) -> tuple[str, list[int]]:
+    """
+    Join strings with NUL separators and record where each one starts.
+
+    Args:
+        parts: Strings to join
+
+    Returns:
+        Tuple of (joined string, start offset of each part)
+    """
+    starts = []
+    offset = 0
+    for part in parts:
+        starts.append(offset)
+        offset += len(part) + 1
+    return "\0".join(parts), starts
+
+
+# Maximum number of law codes whose lookup results are kept per TOC index
+_TOC_RESULT_CACHE_SIZE = 1024
+
 # ============================================================================
 # XML Extraction Functions
 # ============================================================================
 
 
+def _iterparse(
+    source: BinaryIO, events: tuple[Literal["start", "end"], ...]
+) -> Iterator[tuple[str, ET.Element]]:
+    """
+    Parse XML incrementally (with lxml, if installed).
+
+    Callers stop as soon as they have what they need, so the rest of the
+    document is never read or built into a tree.
+
+    Args:
+        source: Binary file object with the XML document
+        events: Events to report ("start" and/or "end")
+
+    Returns:
+        Iterator of (event, element) pairs
+    """
+    if lxml_etree is not None:
+        return cast(
+            Iterator[tuple[str, ET.Element]],
+            iter(lxml_etree.iterparse(source, events=events)),
+        )
+    return ET.iterparse(source, events=events)
+
+
 def extract_jurabk_from_xml(xml_path: Path) -> Optional[str]:
     """
     Extract the jurabk (legal abbreviation) from a law XML file.
@@ -476,18 +1076,19 @@ def extract_jurabk_from_xml(xml_path: Path) -> Optional[str]:
         The jurabk string or None if not found
     """
     try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-
-        jurabk_elem = root.find(".//jurabk")
-        if jurabk_elem is not None and jurabk_elem.text:
-            return jurabk_elem.text.strip()
-
-        logger.warning(f"No <jurabk> found in {xml_path}")
+        with open(xml_path, "rb") as f:
+            # The first <jurabk> sits in the metadata of the first norm
+            for _, elem in _iterparse(f, ("end",)):
+                if elem.tag == "jurabk":
+                    if elem.text:
+                        return elem.text.strip()
+                    break
+
+        logger.warning("No <jurabk> found in %s", xml_path)
         return None
 
     except Exception as e:
-        logger.error(f"Error extracting jurabk from {xml_path}: {e}")
+        logger.error("Error extracting jurabk from %s: %s", xml_path, e)
         return None
 
 
@@ -502,21 +1103,72 @@ def extract_builddate_from_xml(xml_path: Path) -> Optional[str]:
         The builddate string (format: YYYYMMDDHHMMSS) or None if not found
     """
     try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-
-        builddate = root.get("builddate")
-        if builddate:
-            return builddate.strip()
-
-        logger.warning(f"No builddate attribute found in {xml_path}")
+        with open(xml_path, "rb") as f:
+            # The root element is the first start event
+            for _, root in _iterparse(f, ("start",)):
+                builddate = root.get("builddate")
+                if builddate:
+                    return builddate.strip()
+                break
+
+        logger.warning("No builddate attribute found in %s", xml_path)
         return None
 
     except Exception as e:
-        logger.error(f"Error extracting builddate from {xml_path}: {e}")
+        logger.error("Error extracting builddate from %s: %s", xml_path, e)
         return None
 
 
+def _copy_reading_metadata(
+    src: IO[bytes], dst: IO[bytes]
+) -> tuple[Optional[str], Optional[str]]:
+    """
+    Copy a law XML stream and read jurabk and builddate on the way.
+
+    The document head is parsed from the chunks already in memory, so the
+    written file is not read again. Malformed XML raises ET.ParseError on
+    the first chunk, before the rest of the member is decompressed.
+
+    Args:
+        src: Binary file object with the XML document
+        dst: Binary file object to copy the document to
+
+    Returns:
+        Tuple of (jurabk, builddate), each None if not found
+    """
+    jurabk: Optional[str] = None
+    builddate: Optional[str] = None
+    parser: ET.XMLPullParser[ET.Element] = ET.XMLPullParser(("start", "end"))
+    parsing = True
+    root_seen = False
+
+    while chunk := src.read(COPY_BUFFER_SIZE):
+        dst.write(chunk)
+        if not parsing:
+            continue
+
+        parser.feed(chunk)
+        events = cast(Iterator[tuple[str, ET.Element]], parser.read_events())
+        for event, elem in events:
+            if not root_seen:
+                # The root element is the first start event
+                root_seen = True
+                builddate_attr = elem.get("builddate")
+                if builddate_attr:
+                    builddate = builddate_attr.strip()
+            elif event == "end":
+                if elem.tag == "jurabk":
+                    if elem.text:
+                        jurabk = elem.text.strip()
+                    # Copy the rest without parsing it
+                    parsing = False
+                    break
+                # Keep the partial tree small while searching
+                elem.clear()
+
+    return (jurabk, builddate)
+
+
 # ============================================================================
 # Law Loading Functions
 # ============================================================================
@@ -536,7 +1188,8 @@ def get_law(
         auto_download: Automatically download if not found locally (default: False)
 
     Returns:
-        Parsed Dokumente object or None if not found
+        Parsed Dokumente object or None if not found. Repeated calls for an
+        unchanged file return the same cached object.
 
     Examples:
         >>> get_law('HGB')
@@ -545,35 +1198,35 @@ def get_law(
         >>> get_law('KStG')
         <Dokumente: Körperschaftsteuergesetz>
     """
-    from .parser import parse_gesetz
-
     if base_path is None:
         # Use user's home directory for data storage
         base_path = Path.home() / ".gesetzessuche"
         base_path.mkdir(exist_ok=True)
 
     # Load mapping and find law
-    mapping = load_law_mapping(base_path)
+    mapping, source = _load_law_mapping(base_path)
     if not mapping:
         logger.warning("No law mapping found")
         return None
 
-    law_key = find_law_in_mapping(law_code, mapping)
+    if law_code in mapping or source is None:
+        law_key = find_law_in_mapping(law_code, mapping)
+    else:
+        # Key index cached per mapping file instead of scanning all keys
+        law_key = _read_mapping_lookup(*source).match(law_code)
 
     # If not found in mapping, try to download
     if not law_key and auto_download:
-        logger.info(f"Law '{law_code}' not in mapping, attempting download...")
-        toc_index = load_toc_index(base_path)
-        toc_entry = find_law_in_toc(law_code, toc_index)
+        logger.info("Law '%s' not in mapping, attempting download...", law_code)
+        toc_entry = _find_law_in_toc_file(law_code, base_path)
 
         if toc_entry:
-            logger.info(f"Found '{law_code}' in TOC: {toc_entry['title']}")
+            logger.info("Found '%s' in TOC: %s", law_code, toc_entry["title"])
             target_dir = base_path / "data"
             result = download_and_extract_law(toc_entry["url"], target_dir)
 
             if result:
-                xml_path, jurabk = result
-                builddate = extract_builddate_from_xml(xml_path)
+                xml_path, jurabk, builddate = result
 
                 # Update mapping
                 mapping[jurabk] = {
@@ -583,18 +1236,18 @@ def get_law(
                     "builddate": builddate or "",
                     "url_path": toc_entry.get("url_path", ""),
                 }
-                save_law_mapping(mapping, base_path)
+                _add_law_to_mapping(jurabk, mapping[jurabk], base_path)
                 law_key = jurabk
-                logger.info(f"Successfully downloaded and added '{jurabk}' to mapping")
+                logger.info("Successfully downloaded and added '%s' to mapping", jurabk)
             else:
-                logger.error(f"Failed to download '{law_code}'")
+                logger.error("Failed to download '%s'", law_code)
                 return None
         else:
-            logger.warning(f"Law '{law_code}' not found in TOC")
+            logger.warning("Law '%s' not found in TOC", law_code)
             return None
 
     if not law_key:
-        logger.warning(f"Law '{law_code}' not found")
+        logger.warning("Law '%s' not found", law_code)
         return None
 
     # Get XML path from mapping
@@ -604,36 +1257,33 @@ def get_law(
     # If XML file doesn't exist, try to download if auto_download is enabled
     if not xml_path.exists():
         if auto_download:
-            logger.info(f"XML file not found for '{law_code}', attempting download...")
+            logger.info("XML file not found for '%s', attempting download...", law_code)
 
             # If law is in mapping, use url_path from mapping for download
             if law_info.get("url_path"):
                 url_path = law_info["url_path"]
                 download_url = f"https://www.gesetze-im-internet.de/{url_path}/xml.zip"
-                logger.info(f"Using URL from mapping: {download_url}")
+                logger.info("Using URL from mapping: %s", download_url)
 
                 target_dir = base_path / "data"
                 result = download_and_extract_law(download_url, target_dir)
 
                 if result:
-                    xml_path_new, jurabk = result
-                    xml_path = xml_path_new
-                    logger.info(f"Successfully downloaded '{law_code}'")
+                    xml_path = result[0]
+                    logger.info("Successfully downloaded '%s'", law_code)
                 else:
-                    logger.error(f"Failed to download '{law_code}'")
+                    logger.error("Failed to download '%s'", law_code)
                     return None
             else:
                 # Fallback: search in TOC
-                toc_index = load_toc_index(base_path)
-                toc_entry = find_law_in_toc(law_code, toc_index)
+                toc_entry = _find_law_in_toc_file(law_code, base_path)
 
                 if toc_entry:
                     target_dir = base_path / "data"
                     result = download_and_extract_law(toc_entry["url"], target_dir)
 
                     if result:
-                        xml_path_new, jurabk = result
-                        builddate = extract_builddate_from_xml(xml_path_new)
+                        xml_path_new, jurabk, builddate = result
 
                         # Update mapping with fresh download info
                         mapping[jurabk] = {
@@ -643,33 +1293,152 @@ def get_law(
                             "builddate": builddate or "",
                             "url_path": toc_entry.get("url_path", ""),
                         }
-                        save_law_mapping(mapping, base_path)
+                        _add_law_to_mapping(jurabk, mapping[jurabk], base_path)
                         xml_path = xml_path_new
-                        logger.info(f"Successfully downloaded '{law_code}'")
+                        logger.info("Successfully downloaded '%s'", law_code)
                     else:
-                        logger.error(f"Failed to download '{law_code}'")
+                        logger.error("Failed to download '%s'", law_code)
                         return None
                 else:
-                    logger.error(f"Law '{law_code}' not found in TOC for download")
+                    logger.error("Law '%s' not found in TOC for download", law_code)
                     return None
         else:
-            logger.error(f"XML file not found: {xml_path}")
+            logger.error("XML file not found: %s", xml_path)
             return None
 
     # Parse and return
     try:
-        return parse_gesetz(xml_path)
+        xml_path = xml_path.resolve()
+        return _parse_law_file(xml_path, xml_path.stat().st_mtime_ns)
     except Exception as e:
-        logger.error(f"Error parsing {xml_path}: {e}")
+        logger.error("Error parsing %s: %s", xml_path, e)
         return None
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_law_file(xml_path: Path, mtime_ns: int) -> "Dokumente":
+    """
+    Parse a law XML file (cached per file and modification time).
+
+    Args:
+        xml_path: Absolute path to the XML file
+        mtime_ns: Modification time, part of the cache key so that
+            re-downloaded files are parsed again
+
+    Returns:
+        Parsed Dokumente object, shared between callers (do not modify)
+    """
+    from .parser import parse_gesetz
+
+    return parse_gesetz(xml_path)
+
+
 # ============================================================================
 # Download Functions
 # ============================================================================
 
 
-def download_and_extract_law(url: str, target_dir: Path) -> Optional[tuple[Path, str]]:
+# Kept-alive HTTP connections per thread, keyed by (scheme, host)
+_http_local = threading.local()
+
+# Result of a law download: (xml_path, jurabk, builddate) or None if failed
+_DownloadedLaw = Optional[tuple[Path, str, Optional[str]]]
+
+# Same User-Agent as urllib.request sends
+_USER_AGENT = f"Python-urllib/{sys.version_info.major}.{sys.version_info.minor}"
+
+
+def _thread_connections() -> dict[tuple[str, str], http.client.HTTPConnection]:
+    """
+    Get the kept-alive connections of the calling thread.
+
+    Returns:
+        Connections keyed by (scheme, host)
+    """
+    connections: dict[tuple[str, str], http.client.HTTPConnection]
+    connections = _http_local.__dict__.setdefault("connections", {})
+    return connections
+
+
+def _close_connections(
+    connections: dict[tuple[str, str], http.client.HTTPConnection],
+) -> None:
+    """
+    Close kept-alive connections that are no longer used.
+
+    Args:
+        connections: Connections of a thread that has finished downloading
+    """
+    for conn in connections.values():
+        conn.close()
+    connections.clear()
+
+
+def _open_url(url: str) -> http.client.HTTPResponse:
+    """
+    Send a GET request, reusing a kept-alive connection to the same host.
+
+    Downloads of many laws from gesetze-im-internet.de then skip the TCP and
+    TLS handshake for every file. Connections are per thread, so concurrent
+    downloads never share one. Redirects and proxies (http_proxy, https_proxy,
+    no_proxy) are left to urllib.
+
+    Args:
+        url: HTTP(S) URL to fetch
+
+    Returns:
+        Response positioned at the body (read it completely before the next
+        request in the same thread)
+
+    Raises:
+        urllib.error.HTTPError: If the server answers with an error status
+    """
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme not in ("http", "https") or (
+        parts.scheme in urllib.request.getproxies()
+        and not urllib.request.proxy_bypass(parts.netloc)
+    ):
+        return cast(http.client.HTTPResponse, urllib.request.urlopen(url))
+
+    connections = _thread_connections()
+    key = (parts.scheme, parts.netloc)
+    path = urllib.parse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+    headers = {"User-Agent": _USER_AGENT}
+
+    # A kept-alive connection may have been closed by the server meanwhile -
+    # retry once on a fresh connection
+    for attempt in range(2):
+        conn = connections.get(key)
+        if conn is None:
+            connection_cls = (
+                http.client.HTTPSConnection
+                if parts.scheme == "https"
+                else http.client.HTTPConnection
+            )
+            conn = connections[key] = connection_cls(parts.netloc, timeout=60)
+        try:
+            conn.request("GET", path, headers=headers)
+            response = conn.getresponse()
+            break
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            del connections[key]
+            if attempt:
+                raise
+
+    if response.status == 200:
+        return response
+
+    # Drain the body so the connection stays usable
+    response.read()
+    if 300 <= response.status < 400:
+        return cast(http.client.HTTPResponse, urllib.request.urlopen(url))
+    raise urllib.error.HTTPError(
+        url, response.status, response.reason, response.headers, None
+    )
+
+
+def download_and_extract_law(url: str, target_dir: Path) -> _DownloadedLaw:
     """
     Download a law ZIP file, extract the XML, and determine its jurabk.
 
@@ -678,63 +1447,98 @@ def download_and_extract_law(url: str, target_dir: Path) -> Optional[tuple[Path,
         target_dir: Directory where to save the extracted XML
 
     Returns:
-        Tuple of (xml_path, jurabk) or None if failed
+        Tuple of (xml_path, jurabk, builddate) or None if failed
     """
+    tmp_path: Optional[Path] = None
+    partial_path: Optional[Path] = None
     try:
-        logger.info(f"Downloading law from {url}")
-
-        # Download ZIP to temporary file
-        with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as tmp_file:
-            urllib.request.urlretrieve(url, tmp_file.name)
-            tmp_path = Path(tmp_file.name)
+        logger.info("Downloading law from %s", url)
+
+        archive: Path | io.BytesIO
+        with _open_url(url) as response:
+            length = response.headers.get("Content-Length")
+            if length is not None and int(length) <= MAX_IN_MEMORY_ZIP_SIZE:
+                # Typical law ZIPs are small - keep them in memory
+                archive = io.BytesIO(response.read())
+            else:
+                # Unknown or large size: stream to a temporary file in chunks
+                with tempfile.NamedTemporaryFile(
+                    suffix=".zip", delete=False
+                ) as tmp_file:
+                    tmp_path = archive = Path(tmp_file.name)
+                    shutil.copyfileobj(response, tmp_file, COPY_BUFFER_SIZE)
 
         # Extract XML from ZIP
-        with zipfile.ZipFile(tmp_path, "r") as zip_ref:
-            xml_files = [f for f in zip_ref.namelist() if f.endswith(".xml")]
-
-            if not xml_files:
-                logger.error(f"No XML file found in {url}")
-                tmp_path.unlink()
+        with zipfile.ZipFile(archive, "r") as zip_ref:
+            # First XML member, without building the full name list
+            xml_info = next(
+                (info for info in zip_ref.infolist() if info.filename.endswith(".xml")),
+                None,
+            )
+
+            if xml_info is None:
+                logger.error("No XML file found in %s", url)
                 return None
 
-            xml_filename = xml_files[0]
-
-            # Extract to temporary location first
-            with tempfile.TemporaryDirectory() as temp_extract_dir:
-                zip_ref.extract(xml_filename, temp_extract_dir)
-                temp_xml_path = Path(temp_extract_dir) / xml_filename
+            # Use original filename
+            final_xml_path = target_dir / xml_info.filename
+            partial_path = final_xml_path.with_name(final_xml_path.name + ".part")
 
-                # Extract jurabk to determine final filename
-                jurabk = extract_jurabk_from_xml(temp_xml_path)
-
-                if not jurabk:
-                    logger.error(f"Could not extract jurabk from {url}")
-                    tmp_path.unlink()
-                    return None
-
-                # Use original filename
-                final_xml_path = target_dir / xml_filename
+            # Stream the member straight next to its final location
+            target_dir.mkdir(parents=True, exist_ok=True)
+            with (
+                zip_ref.open(xml_info) as src,
+                open(partial_path, "wb") as dst,
+            ):
+                jurabk, builddate = _copy_reading_metadata(src, dst)
 
-                # Copy to final location
-                target_dir.mkdir(parents=True, exist_ok=True)
-                with (
-                    open(temp_xml_path, "rb") as src,
-                    open(final_xml_path, "wb") as dst,
-                ):
-                    dst.write(src.read())
+        # Only replace an existing law once the new one has a jurabk
+        if not jurabk:
+            logger.error("Could not extract jurabk from %s", url)
+            return None
 
-        # Clean up temporary ZIP file
-        tmp_path.unlink()
+        os.replace(partial_path, final_xml_path)
 
         logger.info(
-            f"Successfully downloaded and extracted {jurabk} to {final_xml_path}"
+            "Successfully downloaded and extracted %s to %s", jurabk, final_xml_path
         )
-        return (final_xml_path, jurabk)
+        return (final_xml_path, jurabk, builddate)
 
     except Exception as e:
-        logger.error(f"Error downloading law from {url}: {e}")
+        logger.error("Error downloading law from %s: %s", url, e)
         return None
 
+    finally:
+        # Clean up temporary ZIP file and unfinished extraction
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+        if partial_path is not None:
+            partial_path.unlink(missing_ok=True)
+
+
+def _read_mapping_journal(journal_path: Path) -> dict[str, LawMapping]:
+    """
+    Read the law mapping entries journaled by an interrupted batch download.
+
+    Args:
+        journal_path: Path to the journal (one JSON object per line)
+
+    Returns:
+        Journaled entries, empty if there is no journal
+    """
+    entries: dict[str, LawMapping] = {}
+    if not journal_path.exists():
+        return entries
+
+    with open(journal_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entries.update(json.loads(line))
+            except ValueError:
+                # Last line may be cut off by the interruption
+                logger.warning("Skipping damaged line in %s", journal_path)
+    return entries
+
 
 def download_laws_batch(
     toc_entries: list[tuple[str, TOCEntry]],
@@ -743,6 +1547,7 @@ def download_laws_batch(
     skip_existing: bool = True,
     save_interval: int = 10,
     base_path: Optional[Path] = None,
+    max_workers: int = 1,
 ) -> DownloadResult:
     """
     Batch download laws and update mapping file.
@@ -750,15 +1555,17 @@ def download_laws_batch(
     Args:
         toc_entries: List of (title, toc_entry) tuples to download
         target_dir: Directory where to save downloaded laws
-        max_downloads: Maximum number to download (0 = unlimited)
+        max_downloads: Maximum number of successful downloads (0 = unlimited)
         skip_existing: Skip laws that already exist locally
-        save_interval: Save mapping every N downloads
+        save_interval: Flush the download journal every N downloads
         base_path: Base directory for law_mapping.json (default: project root)
+        max_workers: Number of concurrent downloads (default: 1 = sequential)
 
     Returns:
         Download statistics
     """
     import time
+    from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 
     if base_path is None:
         base_path = Path(__file__).parent.parent
@@ -768,59 +1575,122 @@ def download_laws_batch(
     failed = 0
     skipped = 0
 
+    # New entries are appended to a journal while downloading and only
+    # merged into law_mapping.json once at the end, instead of rewriting the
+    # growing mapping file every save_interval downloads. A journal left
+    # behind by an interrupted run is merged first.
+    base_path.mkdir(parents=True, exist_ok=True)
+    journal_path = base_path / "law_mapping.journal.jsonl"
+    recovered = _read_mapping_journal(journal_path)
+    if recovered:
+        logger.info("Recovered %s laws from interrupted download", len(recovered))
+        mapping.update(recovered)
+        if save_law_mapping(mapping, base_path):
+            journal_path.unlink()
+
     start_time = time.time()
 
-    for idx, (title, entry) in enumerate(toc_entries, 1):
-        # Check download limit
-        if max_downloads > 0 and downloaded >= max_downloads:
-            logger.info(f"Reached download limit of {max_downloads}")
-            break
+    # Lowercased url_path -> filenames of the mapped laws, built once
+    # instead of scanning the whole mapping for every entry
+    filenames_by_url: dict[str, list[str]] = {}
+    if skip_existing:
+        for law_info in mapping.values():
+            url_path = law_info.get("url_path", "").lower()
+            filenames_by_url.setdefault(url_path, []).append(law_info["filename"])
 
+    # Select the entries to download
+    pending: list[tuple[int, str, TOCEntry]] = []
+    for idx, (title, entry) in enumerate(toc_entries, 1):
         # Skip if exists
         if skip_existing:
-            for jurabk, law_info in mapping.items():
-                if law_info.get("url_path", "").lower() == entry["url_path"].lower():
-                    xml_path = target_dir / law_info["filename"]
-                    if xml_path.exists():
-                        skipped += 1
-                        break
-            else:
-                pass
-
-            if skipped > 0 and idx == skipped:
+            filenames = filenames_by_url.get(entry["url_path"].lower(), [])
+            if any((target_dir / filename).exists() for filename in filenames):
+                skipped += 1
                 continue
 
-        # Download
-        logger.info(f"Downloading {idx}/{len(toc_entries)}: {title[:60]}...")
-        result = download_and_extract_law(entry["url"], target_dir)
+        pending.append((idx, title, entry))
+
+    # Kept-alive connections of the worker threads, closed once all are done
+    worker_connections: dict[int, dict[tuple[str, str], http.client.HTTPConnection]]
+    worker_connections = {}
+
+    def download(idx: int, title: str, entry: TOCEntry) -> _DownloadedLaw:
+        worker_connections.setdefault(threading.get_ident(), _thread_connections())
+        logger.info("Downloading %s/%s: %s...", idx, len(toc_entries), title[:60])
+        return download_and_extract_law(entry["url"], target_dir)
+
+    def close_worker_connections() -> None:
+        for connections in worker_connections.values():
+            _close_connections(connections)
+
+    # Download - network bound, so overlap requests in worker threads.
+    # Mapping updates stay in this thread.
+    workers = max(1, max_workers)
+    remaining = iter(pending)
+    with (
+        contextlib.ExitStack() as cleanup,
+        ThreadPoolExecutor(max_workers=workers) as executor,
+        open(journal_path, "a", encoding="utf-8") as journal,
+    ):
+        # Runs after the executor has shut down, when no worker downloads
+        cleanup.callback(close_worker_connections)
+        futures: dict[Future[_DownloadedLaw], tuple[str, TOCEntry]] = {}
+        while True:
+            # Keep the workers busy, but never run more downloads than are
+            # still needed - max_downloads counts successful downloads only
+            while len(futures) < workers:
+                if max_downloads > 0 and downloaded + len(futures) >= max_downloads:
+                    break
+                item = next(remaining, None)
+                if item is None:
+                    break
+                idx, title, entry = item
+                futures[executor.submit(download, idx, title, entry)] = (title, entry)
+
+            if not futures:
+                break
+
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                title, entry = futures.pop(future)
+                result = future.result()
 
-        if result:
-            xml_path, jurabk = result
-            builddate = extract_builddate_from_xml(xml_path)
+                if result:
+                    xml_path, jurabk, builddate = result
+
+                    new_entry: LawMapping = {
+                        "filename": xml_path.name,
+                        "title": title,
+                        "category": entry.get("category", ""),
+                        "builddate": builddate or "",
+                        "url_path": entry.get("url_path", ""),
+                    }
+                    mapping[jurabk] = new_entry
+                    journal.write(json.dumps({jurabk: new_entry}, ensure_ascii=False))
+                    journal.write("\n")
+                    downloaded += 1
+
+                    # Flush the journal periodically
+                    if downloaded % save_interval == 0:
+                        journal.flush()
+                        elapsed = time.time() - start_time
+                        rate = downloaded / elapsed if elapsed > 0 else 0
+                        logger.info(
+                            "Progress: %s/%s - Rate: %.2f laws/sec",
+                            downloaded + failed,
+                            len(pending),
+                            rate,
+                        )
+                else:
+                    failed += 1
+                    logger.warning("Failed to download: %s", title)
 
-            mapping[jurabk] = {
-                "filename": xml_path.name,
-                "title": title,
-                "category": entry.get("category", ""),
-                "builddate": builddate or "",
-                "url_path": entry.get("url_path", ""),
-            }
-            downloaded += 1
-
-            # Save periodically
-            if downloaded % save_interval == 0:
-                save_law_mapping(mapping, base_path)
-                elapsed = time.time() - start_time
-                rate = downloaded / elapsed if elapsed > 0 else 0
-                logger.info(
-                    f"Progress: {idx}/{len(toc_entries)} - Rate: {rate:.2f} laws/sec"
-                )
-        else:
-            failed += 1
-            logger.warning(f"Failed to download: {title}")
+        if downloaded + failed < len(pending):
+            logger.info("Reached download limit of %s", max_downloads)
 
-    # Save final mapping
-    save_law_mapping(mapping, base_path)
+    # Save final mapping - the journal is no longer needed afterwards
+    if save_law_mapping(mapping, base_path):
+        journal_path.unlink(missing_ok=True)
 
     return {
         "downloaded": downloaded,
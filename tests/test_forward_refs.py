@@ -1,20 +1,22 @@
 #!/usr/bin/env python3
 """Test that all Pydantic models with forward references work correctly"""
 
-import sys
-from pathlib import Path
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from pydantic import ValidationError
 
 from gesetzessuche.models import (
     DD,
+    DL,
+    DT,
     LA,
     TOC,
     Content,
+    DLItem,
+    Dokumente,
     Entry,
     Footnote,
     FormatElement,
+    Metadaten,
+    Norm,
     P,
     Revision,
 )
@@ -75,6 +77,17 @@ def test_dd_creation() -> None:
     print("✓ DD model works")
 
 
+def test_dl_parallel_lists() -> None:
+    """Test DL stores DT/DD in parallel lists and still accepts items"""
+    dt = DT(text="1.")
+    dd = DD(la=LA(text="Erster Punkt"))
+    dl = DL(items=[DLItem(dt=dt, dd=dd)])
+    assert dl.dts == [dt]
+    assert dl.dds == [dd]
+    assert dl.items == [DLItem(dt=dt, dd=dd)]
+    print("✓ DL parallel lists work")
+
+
 def test_format_element_creation() -> None:
     """Test FormatElement can be created"""
     fmt = FormatElement(tag="B", text="Bold text", children=["nested"])
@@ -97,6 +110,47 @@ def test_content_creation() -> None:
     print("✓ Content model works")
 
 
+def test_content_p_elements() -> None:
+    """Test Content collects its P elements when created"""
+    p1 = P(id="p1", raw_text="(1) Erster Absatz")
+    p2 = P(id="p2", raw_text="(2) Zweiter Absatz")
+    content = Content(elements=["Intro", p1, FormatElement(tag="B"), p2])
+    assert content.p_elements == [p1, p2]
+    assert "p_elements" not in content.model_dump()
+
+    dl = DL()
+    p3 = P(content=["Einleitung:", dl])
+    assert p3.dl_lists == [dl]
+    assert p1.dl_lists == []
+    print("✓ Content P elements work")
+
+
+def test_models_are_frozen() -> None:
+    """Test parsed models reject mutation"""
+    p = P(id="p1", raw_text="(1) Erster Absatz")
+    try:
+        p.raw_text = "geändert"
+    except ValidationError:
+        pass
+    else:
+        raise AssertionError("P should be frozen")
+    assert p.raw_text == "(1) Erster Absatz"
+    print("✓ Models are frozen")
+
+
+def test_dokumente_find_paragraph() -> None:
+    """Test paragraph lookup through the lazily built index"""
+    first = Norm(doknr="n1", metadaten=Metadaten(enbez="§ 1"))
+    duplicate = Norm(doknr="n2", metadaten=Metadaten(enbez="§ 1"))
+    other = Norm(doknr="n3", metadaten=Metadaten(enbez="§ 8b"))
+    dokumente = Dokumente(normen=[Norm(), first, duplicate, other])
+    assert dokumente.find_paragraph("§ 1") is first
+    assert dokumente.find_paragraph("8b") is other
+    assert dokumente.find_paragraph("2") is None
+    assert dokumente.get_paragraphen() == [first, duplicate, other]
+    print("✓ Dokumente paragraph lookup works")
+
+
 def test_nested_content() -> None:
     """Test nested content elements work"""
     p = P(
@@ -119,9 +173,13 @@ def main() -> None:
     test_p_creation()
     test_la_creation()
     test_dd_creation()
+    test_dl_parallel_lists()
     test_format_element_creation()
     test_revision_creation()
     test_content_creation()
+    test_content_p_elements()
+    test_models_are_frozen()
+    test_dokumente_find_paragraph()
     test_nested_content()
 
     print("\n✅ All forward reference tests passed!")
@@ -3,8 +3,44 @@
 Minimal test to verify law_mapping.json can be accessed.
 """
 
+import http.server
+import io
+import os
+import threading
+import urllib.error
+import urllib.request
+import xml.etree.ElementTree as ET
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from email.message import Message
 from pathlib import Path
-from gesetzessuche.utils import load_law_mapping
+
+import pytest
+
+from gesetzessuche import utils
+from gesetzessuche.utils import (
+    LawMapping,
+    TOCEntry,
+    download_and_extract_law,
+    download_laws_batch,
+    download_toc,
+    find_law_in_mapping,
+    find_law_in_toc,
+    get_law,
+    load_law_mapping,
+    load_toc_index,
+    save_law_mapping,
+)
+
+TOC_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<items>
+<item><title>Handelsgesetzbuch</title>
+<link>https://www.gesetze-im-internet.de/hgb/xml.zip</link></item>
+<item><title>Ohne Link</title></item>
+<item><title>Verordnung über Tests</title>
+<link>https://www.gesetze-im-internet.de/testv/xml.zip</link></item>
+</items>
+"""
 
 
 def test_law_mapping_exists():
@@ -29,6 +65,446 @@ def test_load_law_mapping():
     print(f"✓ BGB found: {mapping['BGB']['title']}")
 
 
+def test_law_mapping_cache(tmp_path: Path):
+    """Test that cached mappings are private copies and refreshed on save."""
+    entry: LawMapping = {
+        "filename": "BJNR000010000.xml",
+        "title": "Testgesetz",
+        "category": "Gesetz",
+        "builddate": "20240101",
+        "url_path": "tg",
+    }
+    assert save_law_mapping({"TG": entry}, tmp_path)
+
+    mapping = load_law_mapping(tmp_path)
+    mapping["XG"] = entry
+    assert list(load_law_mapping(tmp_path)) == ["TG"]
+
+    assert save_law_mapping(mapping, tmp_path)
+    assert sorted(load_law_mapping(tmp_path)) == ["TG", "XG"]
+    # Written via a temporary file that is renamed into place
+    assert [p.name for p in tmp_path.iterdir()] == ["law_mapping.json"]
+
+
+def test_load_toc_index(tmp_path: Path):
+    """Test that gii-toc.xml items are indexed by title."""
+    (tmp_path / "gii-toc.xml").write_text(TOC_XML, encoding="utf-8")
+
+    index = load_toc_index(tmp_path)
+
+    assert list(index) == ["Handelsgesetzbuch", "Verordnung über Tests"]
+    assert index["Handelsgesetzbuch"]["url_path"] == "hgb"
+    assert index["Handelsgesetzbuch"]["category"] == "Gesetz"
+    assert index["Verordnung über Tests"]["category"] == "Verordnung"
+
+
+def test_add_law_to_mapping_threads(tmp_path: Path):
+    """Test that laws added from parallel threads are all kept."""
+    codes = [f"G{i}" for i in range(16)]
+
+    def add(code: str) -> bool:
+        entry: LawMapping = {
+            "filename": f"{code}.xml",
+            "title": code,
+            "category": "Gesetz",
+            "builddate": "",
+            "url_path": code.lower(),
+        }
+        return utils._add_law_to_mapping(code, entry, tmp_path)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert all(executor.map(add, codes))
+
+    assert sorted(load_law_mapping(tmp_path)) == sorted(codes)
+
+
+def test_get_law_cache(tmp_path: Path):
+    """Test that parsed laws are reused until the XML file changes."""
+    entry: LawMapping = {
+        "filename": "BJNR000010000.xml",
+        "title": "Testgesetz",
+        "category": "Gesetz",
+        "builddate": "20240101",
+        "url_path": "tg",
+    }
+    assert save_law_mapping({"TG": entry}, tmp_path)
+    xml_path = tmp_path / "data" / "BJNR000010000.xml"
+    xml_path.parent.mkdir()
+    xml_path.write_text(
+        '<dokumente builddate="20240101"><norm><metadaten>'
+        "<jurabk>TG</jurabk></metadaten></norm></dokumente>",
+        encoding="utf-8",
+    )
+
+    first = get_law("TG", tmp_path)
+    assert first is not None
+    assert get_law("tg", tmp_path) is first
+    # The key index of the unchanged mapping file is reused
+    hits = utils._read_mapping_lookup.cache_info().hits
+    assert get_law("Tg", tmp_path) is first
+    assert utils._read_mapping_lookup.cache_info().hits == hits + 1
+
+    stat = xml_path.stat()
+    os.utime(xml_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = get_law("TG", tmp_path)
+    assert second is not first
+    assert second == first
+
+
+def test_find_law_in_mapping():
+    """Test the match order: exact, case-insensitive, delimited prefix, prefix."""
+    entry: LawMapping = {
+        "filename": "x.xml",
+        "title": "",
+        "category": "",
+        "builddate": "",
+        "url_path": "",
+    }
+    mapping = {key: entry for key in ["KStGX", "KStG_2", "KStG 1977", "hgb", "HGB"]}
+
+    assert find_law_in_mapping("HGB", mapping) == "HGB"
+    assert find_law_in_mapping("Hgb", mapping) == "hgb"
+    # First match in mapping order, not in alphabetical order
+    assert find_law_in_mapping("kstg", mapping) == "KStG_2"
+    assert find_law_in_mapping("kst", mapping) == "KStGX"
+    assert find_law_in_mapping("XYZ", mapping) is None
+    # Changed mappings are searched again
+    del mapping["KStG_2"]
+    assert find_law_in_mapping("kstg", mapping) == "KStG 1977"
+
+
+def test_find_law_in_toc():
+    """Test the match order: exact url_path, prefix, substring, title."""
+
+    def entry(title: str, url_path: str) -> TOCEntry:
+        url = f"https://www.gesetze-im-internet.de/{url_path}/xml.zip"
+        return {"title": title, "url": url, "url_path": url_path, "category": ""}
+
+    toc_index = {
+        "Gesetz Z": entry("Gesetz Z", "estg_z"),
+        "Gesetz A": entry("Gesetz A", "estg_a"),
+        "Einkommensteuergesetz": entry("Einkommensteuergesetz", "estg"),
+        "Handelsgesetzbuch (HGB)": entry("Handelsgesetzbuch (HGB)", "hgbeg"),
+    }
+
+    assert find_law_in_toc("EStG", toc_index) == toc_index["Einkommensteuergesetz"]
+    # First prefix match in TOC order, not in alphabetical order
+    del toc_index["Einkommensteuergesetz"]
+    assert find_law_in_toc("estg", toc_index) == toc_index["Gesetz Z"]
+    assert find_law_in_toc("gbe", toc_index) == toc_index["Handelsgesetzbuch (HGB)"]
+    assert find_law_in_toc("(hgb)", toc_index) == toc_index["Handelsgesetzbuch (HGB)"]
+    assert find_law_in_toc("XYZ", toc_index) is None
+
+
+def test_find_law_in_toc_after_mutation():
+    """Test that changes to the TOC dict are seen, even at the same size."""
+    toc_index: dict[str, TOCEntry] = {
+        "Handelsgesetzbuch": {
+            "title": "Handelsgesetzbuch",
+            "url": "https://www.gesetze-im-internet.de/hgb/xml.zip",
+            "url_path": "hgb",
+            "category": "Gesetz",
+        }
+    }
+    assert find_law_in_toc("HGB", toc_index) is not None
+
+    del toc_index["Handelsgesetzbuch"]
+    toc_index["Aktiengesetz"] = {
+        "title": "Aktiengesetz",
+        "url": "https://www.gesetze-im-internet.de/aktg/xml.zip",
+        "url_path": "aktg",
+        "category": "Gesetz",
+    }
+
+    assert find_law_in_toc("HGB", toc_index) is None
+    assert find_law_in_toc("AKTG", toc_index) == toc_index["Aktiengesetz"]
+
+
+def test_download_toc_conditional(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test that an unchanged gii-toc.xml is not downloaded again."""
+    requests: list[urllib.request.Request] = []
+
+    def fake_urlopen(request: urllib.request.Request) -> io.BytesIO:
+        requests.append(request)
+        if request.get_header("If-none-match") == '"v1"':
+            raise urllib.error.HTTPError(request.full_url, 304, "", Message(), None)
+        response = io.BytesIO(TOC_XML.encode("utf-8"))
+        response.headers = {  # type: ignore[attr-defined]
+            "ETag": '"v1"',
+            "Last-Modified": "Mon, 06 Jan 2025 10:00:00 GMT",
+        }
+        return response
+
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    toc_path = tmp_path / "gii-toc.xml"
+
+    assert download_toc(tmp_path)
+    assert toc_path.read_text(encoding="utf-8") == TOC_XML
+    assert (tmp_path / "gii-toc.xml.etag").read_text(encoding="utf-8") == '"v1"'
+    assert requests[0].get_header("If-modified-since") is None
+
+    assert download_toc(tmp_path)
+    assert requests[1].get_header("If-modified-since") == (
+        "Mon, 06 Jan 2025 10:00:00 GMT"
+    )
+    assert toc_path.read_text(encoding="utf-8") == TOC_XML
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "gii-toc.xml",
+        "gii-toc.xml.etag",
+    ]
+
+
+def test_download_toc_invalid_last_modified(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that a malformed Last-Modified header does not discard the TOC."""
+
+    def fake_urlopen(request: urllib.request.Request) -> io.BytesIO:
+        response = io.BytesIO(TOC_XML.encode("utf-8"))
+        response.headers = {"Last-Modified": "gestern"}  # type: ignore[attr-defined]
+        return response
+
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+
+    assert download_toc(tmp_path)
+    assert (tmp_path / "gii-toc.xml").read_text(encoding="utf-8") == TOC_XML
+
+
+def test_download_and_extract_law(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test that laws are extracted and downloads reuse one connection."""
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("readme.txt", "Kein Gesetz")
+        zf.writestr(
+            "BJNR000010000.xml",
+            '<dokumente builddate="20240101120000"><norm><metadaten>'
+            "<jurabk>TG</jurabk></metadaten></norm></dokumente>",
+        )
+    body = archive.getvalue()
+    client_ports: list[int] = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            client_ports.append(self.client_address[1])
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            # Let the handler thread end after the last expected request
+            self.close_connection = len(client_ports) >= 2
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/tg/xml.zip"
+    try:
+        first = download_and_extract_law(url, tmp_path)
+        # Same result when the ZIP goes through a temporary file
+        monkeypatch.setattr(utils, "MAX_IN_MEMORY_ZIP_SIZE", 0)
+        second = download_and_extract_law(url, tmp_path)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    expected = (tmp_path / "BJNR000010000.xml", "TG", "20240101120000")
+    assert first == second == expected
+    assert [p.name for p in tmp_path.iterdir()] == ["BJNR000010000.xml"]
+    assert len(client_ports) == 2
+    assert client_ports[0] == client_ports[1]
+
+
+def test_open_url_proxy(monkeypatch: pytest.MonkeyPatch):
+    """Test that URLs behind a configured proxy are left to urllib."""
+    opened: list[str] = []
+
+    def fake_urlopen(url: str) -> io.BytesIO:
+        opened.append(url)
+        return io.BytesIO(b"")
+
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    for name in ("http_proxy", "HTTP_PROXY", "no_proxy", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("http_proxy", "http://proxy.invalid:3128")
+    monkeypatch.setenv("no_proxy", "127.0.0.1")
+
+    utils._open_url("http://www.gesetze-im-internet.de/tg/xml.zip")
+    assert opened == ["http://www.gesetze-im-internet.de/tg/xml.zip"]
+
+    # Hosts in no_proxy are still fetched directly (nothing listens on port 9)
+    with pytest.raises(OSError):
+        utils._open_url("http://127.0.0.1:9/tg/xml.zip")
+    assert len(opened) == 1
+
+
+def test_copy_reading_metadata():
+    """Test that metadata is read while copying and bad XML stops the copy."""
+    xml = (
+        b'<dokumente builddate="20240101120000"><norm><metadaten>'
+        b"<jurabk>TG</jurabk></metadaten></norm>"
+        + b"<norm><metadaten><jurabk>XG</jurabk></metadaten></norm>" * 2000
+        + b"</dokumente>"
+    )
+    dst = io.BytesIO()
+    assert utils._copy_reading_metadata(io.BytesIO(xml), dst) == (
+        "TG",
+        "20240101120000",
+    )
+    assert dst.getvalue() == xml
+
+    with pytest.raises(ET.ParseError):
+        utils._copy_reading_metadata(io.BytesIO(b"<a></b>" + xml), io.BytesIO())
+
+
+def toc_entry(code: str) -> tuple[str, TOCEntry]:
+    """Build a (title, TOC entry) pair for download_laws_batch."""
+    url = f"https://www.gesetze-im-internet.de/{code.lower()}/xml.zip"
+    return code, {"title": code, "url": url, "url_path": code.lower(), "category": ""}
+
+
+class FakeDownload:
+    """Stand-in for download_and_extract_law that records its calls."""
+
+    def __init__(self) -> None:
+        self.requested: list[str] = []
+        self.closed: list[str] = []
+        self.failing: set[str] = set()
+        self.lock = threading.Lock()
+
+    def __call__(
+        self, url: str, target_dir: Path
+    ) -> tuple[Path, str, str | None] | None:
+        with self.lock:
+            self.requested.append(url)
+        # Keep a connection alive like the real download does
+        connection = FakeConnection(url, self)
+        utils._thread_connections()[("https", url)] = connection  # type: ignore
+        code = url.rsplit("/", 2)[1].upper()
+        if code in self.failing:
+            return None
+        return target_dir / f"{code}.xml", code, None
+
+
+class FakeConnection:
+    """Kept-alive connection that reports when it is closed."""
+
+    def __init__(self, url: str, download: FakeDownload) -> None:
+        self.url = url
+        self.download = download
+
+    def close(self) -> None:
+        with self.download.lock:
+            self.download.closed.append(self.url)
+
+
+@pytest.fixture
+def fake_download(monkeypatch: pytest.MonkeyPatch) -> FakeDownload:
+    """Replace download_and_extract_law with a FakeDownload."""
+    fake = FakeDownload()
+    monkeypatch.setattr(utils, "download_and_extract_law", fake)
+    return fake
+
+
+def test_download_laws_batch_skip_existing(tmp_path: Path, fake_download: FakeDownload):
+    """Test that every locally present law is skipped, not just leading ones."""
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    mapping: dict[str, LawMapping] = {}
+    for code in ("AG", "CG"):
+        (data_dir / f"{code}.xml").write_text("<dokumente/>", encoding="utf-8")
+        mapping[code] = {
+            "filename": f"{code}.xml",
+            "title": code,
+            "category": "Gesetz",
+            "builddate": "",
+            "url_path": code.lower(),
+        }
+    assert save_law_mapping(mapping, tmp_path)
+    fake_download.failing.add("BG")
+
+    result = download_laws_batch(
+        [toc_entry("AG"), toc_entry("BG"), toc_entry("CG")],
+        data_dir,
+        base_path=tmp_path,
+    )
+
+    assert fake_download.requested == ["https://www.gesetze-im-internet.de/bg/xml.zip"]
+    assert result == {"downloaded": 0, "failed": 1, "skipped": 2}
+
+
+def test_download_laws_batch_journal(tmp_path: Path, fake_download: FakeDownload):
+    """Test that journaled and new laws end up in the mapping file."""
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    journal = tmp_path / "law_mapping.journal.jsonl"
+    # Left behind by an interrupted run, with a cut-off last line
+    journal.write_text(
+        '{"AG": {"filename": "AG.xml", "title": "AG", "category": "",'
+        ' "builddate": "", "url_path": "ag"}}\n{"BG": {"filen',
+        encoding="utf-8",
+    )
+
+    result = download_laws_batch([toc_entry("CG")], data_dir, base_path=tmp_path)
+
+    assert result == {"downloaded": 1, "failed": 0, "skipped": 0}
+    assert sorted(load_law_mapping(tmp_path)) == ["AG", "CG"]
+    assert not journal.exists()
+
+
+def test_download_laws_batch_new_base_path(tmp_path: Path, fake_download: FakeDownload):
+    """Test that a missing base directory is created for the mapping."""
+    base_path = tmp_path / "neu" / "gesetze"
+
+    result = download_laws_batch(
+        [toc_entry("CG")], base_path / "data", base_path=base_path
+    )
+
+    assert result == {"downloaded": 1, "failed": 0, "skipped": 0}
+    assert list(load_law_mapping(base_path)) == ["CG"]
+
+
+def test_download_laws_batch_closes_connections(
+    tmp_path: Path, fake_download: FakeDownload
+):
+    """Test that the workers' kept-alive connections are closed at the end."""
+    download_laws_batch(
+        [toc_entry("AG"), toc_entry("BG"), toc_entry("CG")],
+        tmp_path,
+        base_path=tmp_path,
+        max_workers=2,
+    )
+
+    assert sorted(fake_download.closed) == [
+        "https://www.gesetze-im-internet.de/ag/xml.zip",
+        "https://www.gesetze-im-internet.de/bg/xml.zip",
+        "https://www.gesetze-im-internet.de/cg/xml.zip",
+    ]
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_download_laws_batch_limit(
+    tmp_path: Path, fake_download: FakeDownload, max_workers: int
+):
+    """Test that failed downloads do not count against max_downloads."""
+    fake_download.failing.add("AG")
+
+    result = download_laws_batch(
+        [toc_entry(code) for code in ("AG", "BG", "CG", "DG")],
+        tmp_path,
+        max_downloads=2,
+        base_path=tmp_path,
+        max_workers=max_workers,
+    )
+
+    assert result["downloaded"] == 2
+    assert result["failed"] == 1
+    assert len(fake_download.requested) == 3
+    assert len(load_law_mapping(tmp_path)) == 2
+
+
 if __name__ == "__main__":
     test_law_mapping_exists()
     test_load_law_mapping()
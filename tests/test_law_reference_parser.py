@@ -12,7 +12,7 @@ Tests various formats of German law references:
 
 import pytest
 
-from gesetzessuche.utils import parse_law_reference
+from gesetzessuche.utils import iter_law_references, parse_law_reference
 
 
 class TestLawReferenceParser:
@@ -158,6 +158,17 @@ class TestLawReferenceParserEdgeCases:
         assert result is not None
         assert result["paragraph"] == "1"
 
+    def test_iter_all_references_in_text(self):
+        """Test that all references are found in text order"""
+        text = "Siehe § 1 und BGB § 2 Absatz 3, vgl. Art. 4 Satz 2"
+        results = list(iter_law_references(text))
+        assert [r["paragraph"] for r in results] == ["1", "2", "4"]
+        assert results[1]["law"] == "BGB"
+        assert results[1]["section"] == "3"
+        assert results[2]["sentence"] == "2"
+        assert results[0] == parse_law_reference(text)
+        assert list(iter_law_references("Keine Verweise")) == []
+
     def test_paragraph_with_multiple_letters(self):
         """Test paragraph with multiple letters (though rare)"""
         result = parse_law_reference("§ 8abc")
@@ -177,6 +188,20 @@ class TestLawReferenceParserEdgeCases:
         result = parse_law_reference("Absatz 2 Satz 1")
         assert result is None
 
+    def test_word_before_marker_is_not_a_law_code(self):
+        """Test that a plain word before § is not taken as the law code"""
+        result = parse_law_reference("Siehe § 1 Absatz 2")
+        assert result is not None
+        assert result["law"] is None
+        assert result["paragraph"] == "1"
+        assert result["section"] == "2"
+
+    def test_known_law_code_in_lowercase(self):
+        """Test that known law codes are accepted in any case"""
+        result = parse_law_reference("bgb § 1 abs. 2")
+        assert result is not None
+        assert result["law"] == "bgb"
+
     def test_german_umlaut_in_context(self):
         """Test reference with German umlauts in surrounding text"""
         text = "Nach § 1 Absatz 2 müssen Änderungen vorgenommen werden"
@@ -414,5 +439,31 @@ class TestLawReferenceParserWithLawCode:
         assert result["section"] == expected_section
 
 
+class TestLawReferenceParserCache:
+    """Repeated references are served from the cache."""
+
+    def test_repeated_reference_uses_cache(self):
+        """Test that a repeated reference hits the LRU cache"""
+        from gesetzessuche.utils import _match_law_reference
+
+        _match_law_reference.cache_clear()
+        parse_law_reference("BGB § 433 Absatz 1")
+        parse_law_reference("BGB § 433 Absatz 1")
+        info = _match_law_reference.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
+    def test_cached_results_are_independent(self):
+        """Test that callers get their own result dict for cached references"""
+        first = parse_law_reference("HGB § 1 Absatz 2")
+        assert first is not None
+        first["section"] = "99"
+
+        second = parse_law_reference("HGB § 1 Absatz 2")
+        assert second is not None
+        assert second["section"] == "2"
+        assert first is not second
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
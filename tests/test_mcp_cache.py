@@ -3,79 +3,92 @@
 Test script to verify MCP server caching performance
 """
 
-import sys
 import time
+from collections import OrderedDict
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
-from gesetzessuche import server
+from gesetzessuche import server, utils
+from gesetzessuche.utils import LawMapping, get_law, save_law_mapping
 
 
 def test_caching_performance():
     """Test that caching improves performance on repeated access"""
-    print("=" * 60)
-    print("MCP Server Caching Performance Test")
-    print("=" * 60)
-    print()
-
-    # Clear cache first
+    # Really cold: earlier tests may have parsed the laws already
     server._search_cache.clear()
-    print("Cache cleared")
-    print()
+    utils._parse_law_file.cache_clear()
 
     # First load (cold cache)
-    print("First load (cold cache):")
-    start = time.time()
+    start = time.perf_counter_ns()
     search1 = server._get_search("HGB")
-    time1 = (time.time() - start) * 1000
-    print(f"  Time: {time1:.1f}ms")
+    cold_ns = time.perf_counter_ns() - start
     assert search1 is not None
-    print()
-
-    # Second load (cached)
-    print("Second load (from cache):")
-    start = time.time()
-    search2 = server._get_search("HGB")
-    time2 = (time.time() - start) * 1000
-    print(f"  Time: {time2:.1f}ms")
-    assert search2 is not None
-    print()
-
-    # Verify it's the same object (cached)
-    assert search1 is search2, "Should return same cached object"
-    print("✓ Caching verified (same object returned)")
-    print()
-
-    # Performance improvement
-    speedup = time1 / time2 if time2 > 0 else float("inf")
-    print(f"Performance improvement: {speedup:.0f}x faster")
-    print()
-
-    # Verify cache contains HGB
-    assert "HGB" in server._search_cache
-    print(f"✓ Cache contains: {', '.join(server._search_cache.keys())}")
-    print()
-
-    # Load another law
-    print("Loading another law (KSTG):")
-    start = time.time()
-    search3 = server._get_search("KSTG")
-    time3 = (time.time() - start) * 1000
-    print(f"  Time: {time3:.1f}ms")
-    assert search3 is not None
-    print()
-
-    # Verify both are cached
-    assert len(server._search_cache) == 2
-    print(f"✓ Cache now contains: {', '.join(server._search_cache.keys())}")
-    print()
-
-    print("=" * 60)
-    print("✓ Caching test passed!")
-    print("=" * 60)
+
+    # Second load (cached) - best of 100 runs to reject scheduler noise
+    timings = []
+    for _ in range(100):
+        start = time.perf_counter_ns()
+        search2 = server._get_search("HGB")
+        timings.append(time.perf_counter_ns() - start)
+    cached_ns = min(timings)
+    assert search2 is search1, "Should return same cached object"
+    message = f"Cache hit ({cached_ns} ns) not faster than cold load ({cold_ns} ns)"
+    assert cached_ns < cold_ns, message
+    assert list(server._search_cache) == ["HGB"]
+
+    # Load another law - both stay cached
+    assert server._get_search("KSTG") is not None
+    assert list(server._search_cache) == ["HGB", "KSTG"]
+
+
+@pytest.fixture
+def local_laws(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Serve the laws TG and XG from a temporary directory, empty cache"""
+    mapping: dict[str, LawMapping] = {}
+    (tmp_path / "data").mkdir()
+    for number, code in enumerate(["TG", "XG"], 1):
+        filename = f"BJNR00000{number}000.xml"
+        mapping[code] = {
+            "filename": filename,
+            "title": code,
+            "category": "Gesetz",
+            "builddate": "20240101",
+            "url_path": code.lower(),
+        }
+        (tmp_path / "data" / filename).write_text(
+            '<dokumente builddate="20240101"><norm><metadaten>'
+            f"<jurabk>{code}</jurabk></metadaten></norm></dokumente>",
+            encoding="utf-8",
+        )
+    assert save_law_mapping(mapping, tmp_path)
+
+    def local_get_law(law_code: str, auto_download: bool = False):
+        return get_law(law_code, base_path=tmp_path)
+
+    monkeypatch.setattr(server, "get_law", local_get_law)
+    monkeypatch.setattr(server, "_search_cache", OrderedDict())
+
+
+def test_prewarm(local_laws: None):
+    """Test that prewarm loads laws into the cache and reports failures"""
+    assert server.prewarm(["tg", "NONEXISTENT", "TG"]) == ["NONEXISTENT"]
+    assert list(server._search_cache) == ["TG"]
+
+
+def test_search_cache_lru(local_laws: None, monkeypatch: pytest.MonkeyPatch):
+    """Test that the least recently used law is evicted from the cache"""
+    monkeypatch.setattr(server, "SEARCH_CACHE_SIZE", 1)
+
+    tg_search = server._get_search("TG")
+    assert tg_search is not None
+    assert server._get_search("tg") is tg_search
+
+    assert server._get_search("XG") is not None
+    assert list(server._search_cache) == ["XG"]
+    assert server._get_search("TG") is not tg_search
 
 
 if __name__ == "__main__":
     test_caching_performance()
+    print("✓ Caching test passed!")
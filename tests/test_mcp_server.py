@@ -5,16 +5,30 @@ Tests the underlying logic without MCP decorators
 """
 
 import sys
-from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
 # Import the underlying modules directly
 from gesetzessuche.search import LawSearch
 from gesetzessuche.utils import get_law, load_law_mapping, parse_law_reference
 
 
+def _load_search(law_code: str) -> LawSearch:
+    """Load a law (auto-download if missing) and create its search instance"""
+    dokumente = get_law(law_code, auto_download=True)
+    assert dokumente is not None
+
+    jurabk = dokumente.get_jurabk()
+    law_key = jurabk[0] if jurabk else law_code
+    return LawSearch(dokumente, law_key)
+
+
+@pytest.fixture(scope="session")
+def hgb_search() -> LawSearch:
+    """HGB search instance, parsed once and shared by all tests"""
+    return _load_search("HGB")
+
+
 def test_list_laws():
     """Test listing available laws"""
     print("Testing list_laws()...")
@@ -39,7 +53,7 @@ def test_list_laws():
     print()
 
 
-def test_get_law_reference():
+def test_get_law_reference(hgb_search: LawSearch):
     """Test getting law content by reference"""
     print("Testing get_law_reference('HGB § 1')...")
     reference = "HGB § 1"
@@ -49,16 +63,8 @@ def test_get_law_reference():
     assert parsed is not None
     assert parsed["law"] == "HGB"
 
-    # Load law (auto-download if missing)
-    dokumente = get_law(parsed["law"], auto_download=True)
-    assert dokumente is not None
-
-    # Create search instance
-    law_key = dokumente.get_jurabk()[0] if dokumente.get_jurabk() else "HGB"
-    search = LawSearch(dokumente, law_key)
-
     # Get by reference
-    result = search.get_by_reference(reference)
+    result = hgb_search.get_by_reference(reference)
 
     print(f"  Result length: {len(result)}")
     print(f"  First 100 chars: {result[:100]}")
@@ -75,15 +81,10 @@ def test_get_law_reference_with_absatz():
 
     # Parse reference
     parsed = parse_law_reference(reference)
-    assert parsed is not None
-
-    # Load law (auto-download if missing)
-    dokumente = get_law(parsed["law"], auto_download=True)
-    assert dokumente is not None
+    assert parsed is not None and parsed["law"] is not None
 
-    # Create search instance
-    law_key = dokumente.get_jurabk()[0] if dokumente.get_jurabk() else "KSTG"
-    search = LawSearch(dokumente, law_key)
+    # Load law and create search instance
+    search = _load_search(parsed["law"])
 
     # Get by reference
     result = search.get_by_reference(reference)
@@ -95,20 +96,12 @@ def test_get_law_reference_with_absatz():
     print()
 
 
-def test_list_paragraphs():
+def test_list_paragraphs(hgb_search: LawSearch):
     """Test listing paragraphs"""
     print("Testing list_paragraphs('HGB', limit=5)...")
 
-    # Load law
-    dokumente = get_law("HGB", auto_download=True)
-    assert dokumente is not None
-
-    # Create search instance
-    law_key = dokumente.get_jurabk()[0] if dokumente.get_jurabk() else "HGB"
-    search = LawSearch(dokumente, law_key)
-
     # List paragraphs
-    all_paragraphs = search.list_all_paragraphs()
+    all_paragraphs = hgb_search.list_all_paragraphs()
     limit = 5
 
     result = {
@@ -129,28 +122,23 @@ def test_list_paragraphs():
     print()
 
 
-def test_search_law():
+def test_search_law(hgb_search: LawSearch):
     """Test searching within a law"""
     print("Testing search_law('HGB', 'Handelsregister', max_results=3)...")
 
-    # Load law
-    dokumente = get_law("HGB", auto_download=True)
-    assert dokumente is not None
-
-    # Create search instance
-    law_key = dokumente.get_jurabk()[0] if dokumente.get_jurabk() else "HGB"
-    search = LawSearch(dokumente, law_key)
-
     # Search
-    results = search.search_term("Handelsregister", case_sensitive=False)
     max_results = 3
+    results = hgb_search.search_term(
+        "Handelsregister", case_sensitive=False, limit=max_results + 1
+    )
     limited_results = results[:max_results]
+    truncated = len(results) > max_results
 
     result = {
         "law": "HGB",
         "term": "Handelsregister",
         "found": len(limited_results),
-        "total_matches": len(results),
+        "total_matches": f">{max_results}" if truncated else len(results),
         "results": limited_results,
     }
 
@@ -184,10 +172,12 @@ def main():
 
     try:
         test_list_laws()
-        test_get_law_reference()
+        # Parse HGB once for all tests that use it
+        hgb_search = _load_search("HGB")
+        test_get_law_reference(hgb_search)
         test_get_law_reference_with_absatz()
-        test_list_paragraphs()
-        test_search_law()
+        test_list_paragraphs(hgb_search)
+        test_search_law(hgb_search)
         test_error_handling()
 
         print("=" * 60)
@@ -1,51 +1,124 @@
 #!/usr/bin/env python3
 """Test script to parse example XML files"""
 
+import io
+import logging
+import os
 import sys
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
 from pathlib import Path
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from gesetzessuche.parser import parse_gesetz
-
-
-def parse_xml_file(xml_file: Path) -> bool:
-    """Parse a single XML file (not a pytest test)"""
-    print(f"\n{'=' * 80}")
-    print(f"Testing: {xml_file.name}")
-    print(f"{'=' * 80}")
+from typing import Optional, Tuple
+
+from gesetzessuche.models import FormatElement
+from gesetzessuche.parser import GesetzParser, parse_gesetz
+
+STREAMING_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<dokumente builddate="20240101" doknr="BJNR0">
+<norm doknr="BJNR0-1"><metadaten><jurabk>TG</jurabk><enbez>§ 1</enbez></metadaten>
+<norm doknr="nested"/></norm>
+<norm doknr="BJNR0-2"><metadaten><jurabk>TG</jurabk><enbez>§ 2</enbez></metadaten>
+</norm>
+</dokumente>
+"""
+
+
+def test_parse_xml_file_streaming(tmp_path: Path) -> None:
+    """Only direct norm children are streamed, root attributes are kept"""
+    xml_file = tmp_path / "gesetz.xml"
+    xml_file.write_text(STREAMING_XML, encoding="utf-8")
+
+    parser = GesetzParser()
+    streamed = list(parser.parse_xml_file_streaming(xml_file))
+    assert [norm.doknr for norm in streamed] == ["BJNR0-1", "BJNR0-2"]
+
+    dokumente = parse_gesetz(xml_file)
+    assert dokumente.builddate == "20240101"
+    assert dokumente.doknr == "BJNR0"
+    assert [norm.doknr for norm in dokumente.normen] == ["BJNR0-1", "BJNR0-2"]
+    assert dokumente.find_paragraph("2") is dokumente.normen[1]
+
+
+def test_parse_xml_file_parallel(tmp_path: Path) -> None:
+    """Parsing with a process pool gives the same document as sequential parsing"""
+    xml_file = tmp_path / "gesetz.xml"
+    xml_file.write_text(STREAMING_XML, encoding="utf-8")
+
+    assert parse_gesetz(xml_file, max_workers=2) == parse_gesetz(xml_file)
+
+
+def test_parse_date() -> None:
+    """YYYY-MM-DD is parsed directly, invalid dates become None"""
+    assert GesetzParser._parse_date("2024-02-29") == date(2024, 2, 29)
+    assert GesetzParser._parse_date("2024-1-5") == date(2024, 1, 5)
+    assert GesetzParser._parse_date("2023-02-29") is None
+    assert GesetzParser._parse_date("2024-01-05x") is None
+    assert GesetzParser._parse_date("") is None
+
+
+def test_parse_content_elements_deep_nesting() -> None:
+    """Nested format elements deeper than the recursion limit are parsed"""
+    root = ET.Element("Content")
+    current = root
+    depth = sys.getrecursionlimit() + 100
+    for _ in range(depth):
+        current = ET.SubElement(current, "B")
+        current.tail = " nach"
+    current.text = "innen"
+
+    elements = GesetzParser().parse_content_elements(root)
+    levels = 0
+    while elements and isinstance(elements[0], FormatElement):
+        assert elements[1:] == [" nach"]
+        elements = elements[0].children
+        levels += 1
+    assert levels == depth
+    assert elements == ["innen"]
+
+
+def parse_xml_file(xml_file: Path) -> Tuple[str, Optional[str], str]:
+    """Parse a single XML file (not a pytest test, runs in a worker process)
+
+    Returns (file name, error or None, report) - the report is printed by the
+    parent process so the output of parallel workers doesn't interleave.
+    """
+    out = io.StringIO()
+    print(f"\n{'=' * 80}", file=out)
+    print(f"Testing: {xml_file.name}", file=out)
+    print(f"{'=' * 80}", file=out)
 
     try:
         dokumente = parse_gesetz(xml_file)
 
-        print(f"✓ Successfully parsed {xml_file.name}")
-        print(f"  - Build date: {dokumente.builddate}")
-        print(f"  - Document number: {dokumente.doknr}")
-        print(f"  - Title: {dokumente.get_titel()}")
-        print(f"  - Abbreviations: {', '.join(dokumente.get_jurabk())}")
-        print(f"  - Total norms: {len(dokumente.normen)}")
-        print(f"  - Paragraphs: {len(dokumente.get_paragraphen())}")
-        print(f"  - Structure elements: {len(dokumente.get_gliederung())}")
+        print(f"✓ Successfully parsed {xml_file.name}", file=out)
+        print(f"  - Build date: {dokumente.builddate}", file=out)
+        print(f"  - Document number: {dokumente.doknr}", file=out)
+        print(f"  - Title: {dokumente.get_titel()}", file=out)
+        print(f"  - Abbreviations: {', '.join(dokumente.get_jurabk())}", file=out)
+        print(f"  - Total norms: {len(dokumente.normen)}", file=out)
+        print(f"  - Paragraphs: {len(dokumente.get_paragraphen())}", file=out)
+        print(f"  - Structure elements: {len(dokumente.get_gliederung())}", file=out)
 
         # Show first few paragraphs
         paragraphs = dokumente.get_paragraphen()[:3]
         if paragraphs:
-            print("\n  First paragraphs:")
+            print("\n  First paragraphs:", file=out)
             for p in paragraphs:
                 if p.metadaten and p.metadaten.enbez:
                     print(
-                        f"    - {p.metadaten.enbez}: {p.metadaten.titel or '(no title)'}"
+                        f"    - {p.metadaten.enbez}: {p.metadaten.titel or '(no title)'}",
+                        file=out,
                     )
 
-        return True
+        return xml_file.name, None, out.getvalue()
     except Exception as e:
-        print(f"✗ Failed to parse {xml_file.name}")
-        print(f"  Error: {type(e).__name__}: {e}")
+        print(f"✗ Failed to parse {xml_file.name}", file=out)
+        print(f"  Error: {type(e).__name__}: {e}", file=out)
         import traceback
 
-        traceback.print_exc()
-        return False
+        traceback.print_exc(file=out)
+        return xml_file.name, f"{type(e).__name__}: {e}", out.getvalue()
 
 
 def main() -> None:
@@ -58,23 +131,29 @@ def main() -> None:
         return
 
     print(f"Found {len(xml_files)} XML files to test")
+    logging.basicConfig(level=logging.WARNING)
+
+    # The files are independent - parse them in parallel processes
+    max_workers = min(len(xml_files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(parse_xml_file, xml_files))
 
-    results = []
-    for xml_file in xml_files:
-        success = parse_xml_file(xml_file)
-        results.append((xml_file.name, success))
+    # All reports in one write instead of a print per line
+    sys.stdout.write("".join(report for _, _, report in results))
 
     # Summary
     print(f"\n{'=' * 80}")
     print("SUMMARY")
     print(f"{'=' * 80}")
 
-    successful = sum(1 for _, success in results if success)
+    successful = sum(1 for _, error, _ in results if error is None)
     total = len(results)
 
-    for filename, success in results:
-        status = "✓ PASS" if success else "✗ FAIL"
-        print(f"{status}: {filename}")
+    for filename, error, _ in results:
+        if error is None:
+            print(f"✓ PASS: {filename}")
+        else:
+            print(f"✗ FAIL: {filename} ({error})")
 
     print(f"\nTotal: {successful}/{total} files parsed successfully")
 
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Test LawSearch on a small in-memory law"""
+
+from gesetzessuche.models import (
+    Content,
+    Dokumente,
+    Metadaten,
+    Norm,
+    P,
+    Text,
+    Textdaten,
+)
+from gesetzessuche.search import LawSearch, _insert_after_nth_newline
+from gesetzessuche.utils import extract_text_from_norm
+
+
+def _norm(enbez: str, text: str) -> Norm:
+    """Build a paragraph norm with a single Absatz"""
+    p = P(absatz_num="1", content=[text], raw_text=text)
+    content = Content(elements=[p], raw_text=text)
+    return Norm(
+        metadaten=Metadaten(jurabk=["TG"], enbez=enbez),
+        textdaten=Textdaten(text=Text(content=content)),
+    )
+
+
+def _search() -> LawSearch:
+    """Search over three paragraphs mentioning 'Gesellschaft'"""
+    dokumente = Dokumente(
+        normen=[
+            _norm("§ 1", "(1) Die Gesellschaft ist eine juristische Person."),
+            _norm("§ 2", "(1) Gesellschafter haften nicht."),
+            _norm("§ 3", "(1) Das gilt für jede GESELLSCHAFT."),
+        ]
+    )
+    return LawSearch(dokumente, "TG")
+
+
+def test_search_term_case_insensitive() -> None:
+    """Matches are found regardless of case, context comes from the original text"""
+    results = _search().search_term("gesellschaft")
+    assert [r["paragraph"] for r in results] == ["§ 1", "§ 2", "§ 3"]
+    assert "GESELLSCHAFT" in results[2]["context"]
+
+    assert _search().search_term("gesellschaft", case_sensitive=True) == []
+
+
+def test_search_term_limit() -> None:
+    """The search stops once the limit is reached, a limit of 0 finds nothing"""
+    search = _search()
+    results = search.search_term("Gesellschaft", limit=2)
+    assert [r["paragraph"] for r in results] == ["§ 1", "§ 2"]
+
+    assert search.search_term("Gesellschaft", limit=0) == []
+    assert search.search_terms(["Gesellschaft"], limit=0) == []
+    assert search.search_word("Gesellschaft", limit=0) == []
+
+
+def test_search_word() -> None:
+    """Whole words are found through the index, regardless of case"""
+    search = _search()
+    results = search.search_word("gesellschaft")
+    assert [r["paragraph"] for r in results] == ["§ 1", "§ 3"]
+    assert "GESELLSCHAFT" in results[1]["context"]
+
+    results = search.search_word("Gesellschaft", limit=1)
+    assert [r["paragraph"] for r in results] == ["§ 1"]
+    assert search.search_word("Gesell") == []
+    # Not a single word - same result as search_term
+    assert search.search_word("haften nicht") == search.search_term("haften nicht")
+
+
+def test_insert_after_nth_newline() -> None:
+    """The line is inserted like list.insert on the split lines"""
+    assert _insert_after_nth_newline("a\nb\nc\nd", 3, "X") == "a\nb\nc\nX\nd"
+    assert _insert_after_nth_newline("a\nb", 3, "X") == "a\nb\nX"
+    assert _insert_after_nth_newline("", 3, "X") == "\nX"
+
+
+def test_extract_text_from_norm_cached() -> None:
+    """Text rebuilt from the elements is computed once per norm"""
+    p = P(absatz_num="1", content=["(1) Erster", "Satz."])
+    norm = Norm(
+        metadaten=Metadaten(enbez="§ 1"),
+        textdaten=Textdaten(text=Text(content=Content(elements=[p]))),
+    )
+    text = extract_text_from_norm(norm)
+    assert text == "(1) Erster Satz."
+    assert extract_text_from_norm(norm) is text
+
+
+def test_search_terms() -> None:
+    """Paragraphs matching any of the terms are found in one pass"""
+    search = _search()
+    results = search.search_terms(["juristische", "haften"])
+    assert [r["paragraph"] for r in results] == ["§ 1", "§ 2"]
+    assert "juristische" in results[0]["context"]
+
+    assert [r["paragraph"] for r in search.search_terms(["GILT"])] == ["§ 3"]
+    assert search.search_terms(["GILT"], case_sensitive=True) == []
+    assert search.search_terms(["", "nichts"]) == []
+    assert len(search.search_terms(["Gesellschaft"], limit=1)) == 1